@@ -9,21 +9,45 @@ finally:
     del version, PackageNotFoundError
 
 from . import propagators
+from .artifacts import ArtifactStore
+from .checkpoint import (
+    AnyCheckpointPolicy,
+    CheckpointPolicy,
+    IntervalCheckpointPolicy,
+    ShutdownCheckpointPolicy,
+    SignalCheckpointPolicy,
+    VolumeCheckpointPolicy,
+)
+from .export import ResultsExporter, export_results
 from .islands import Islands
 from .migrator import Migrator
 from .pollinator import Pollinator
-from .population import Individual
-from .propulator import Propulator
+from .population import Individual, Transform, Transformed
+from .propulator import Propulator, evaluation_deadline
 from .surrogate import Surrogate
 from .utils import get_default_propagator, set_logger_config
+from .warm_start import WarmStart
 
 __all__ = [
+    "ArtifactStore",
+    "CheckpointPolicy",
+    "IntervalCheckpointPolicy",
+    "VolumeCheckpointPolicy",
+    "SignalCheckpointPolicy",
+    "ShutdownCheckpointPolicy",
+    "AnyCheckpointPolicy",
+    "ResultsExporter",
+    "export_results",
     "Islands",
     "Individual",
+    "Transform",
+    "Transformed",
     "Propulator",
+    "evaluation_deadline",
     "Surrogate",
     "Migrator",
     "Pollinator",
+    "WarmStart",
     "get_default_propagator",
     "set_logger_config",
     "propagators",
@@ -4,3 +4,4 @@ INIT_TAG = 3
 POPULATION_TAG = 4
 DUMP_TAG = 5
 MIGRATION_TAG = 6
+PENDING_TAG = 7
@@ -0,0 +1,171 @@
+import logging
+import shutil
+from pathlib import Path
+from typing import Final, List, Optional, Set, Union
+
+import numpy as np
+
+from .population import Individual, Transformed
+
+log = logging.getLogger(__name__)  # Get logger instance.
+
+ARTIFACT_KEY: Final[str] = "_artifact"  # Key for the path to store the individual's own artifact at
+PARENT_ARTIFACT_KEY: Final[str] = "_parent_artifact"  # Key for the path of the parent's artifact to warm-start from
+
+
+class ArtifactStore:
+    """
+    On-disk store for artifacts, e.g., trained model weights, of evaluated individuals for population-based training.
+
+    Each individual is identified by its birth island, the rank of the worker that bred it, and its generation. Before
+    evaluation, Propulate passes two paths to the loss function via the individual's private keys:
+    ``ind["_artifact"]`` is where the loss function should save the individual's artifact (a file or a directory), and
+    ``ind["_parent_artifact"]`` points to the artifact of the closest evaluated individual in the breeding population
+    the child can warm-start from, or is None if no such artifact exists (yet). Both keys are removed again before the
+    individual is added to the population. Note that they show up when iterating over all items of the individual.
+
+    To bound disk usage, each worker deletes the artifacts of its own individuals which have been deactivated or are not
+    among the ``keep`` best active individuals of its island anymore. Artifacts of individuals that emigrated to other
+    islands are deleted by their origin worker, too; as parents are only chosen among existing artifacts, the child is
+    then warm-started from the next-closest artifact instead. Artifacts may thus vanish between the choice of the parent
+    and loading it, so loss functions should treat a missing parent artifact like a start from scratch.
+
+    To spare the shared file system, the store keeps track of the worker's own live artifacts and of the artifacts known
+    to be gone in memory, so that usually only the chosen parent's artifact is checked for existence on disk. As
+    individuals only enter the population once evaluated, an artifact missing then is considered gone for good, i.e.,
+    loss functions need to save the artifact before returning.
+
+    Attributes
+    ----------
+    keep : int
+        The number of best active individuals per island whose artifacts are kept.
+    path : pathlib.Path
+        The directory the artifacts are stored in. Must be accessible from all ranks.
+
+    Methods
+    -------
+    path_for()
+        Get the artifact path of an individual.
+    add()
+        Track the artifact of an evaluated individual of this worker for garbage collection.
+    find_parent()
+        Find the closest individual with an existing artifact.
+    collect_garbage()
+        Delete artifacts of a worker's individuals that are no longer needed.
+    """
+
+    def __init__(self, path: Union[str, Path], keep: int = 10) -> None:
+        """
+        Initialize an artifact store.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            The directory the artifacts are stored in. Must be accessible from all ranks.
+        keep : int, optional
+            The number of best active individuals per island whose artifacts are kept. Default is 10.
+
+        Raises
+        ------
+        ValueError
+            If ``keep`` is smaller than 1.
+        """
+        if keep < 1:
+            raise ValueError("At least one artifact per island needs to be kept.")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.keep = keep
+        self._own: Set[Path] = set()  # Artifact paths of this worker's evaluated individuals not deleted yet
+        self._gone: Set[Path] = set()  # Artifact paths known not to exist (anymore)
+
+    def path_for(self, ind: Individual) -> Path:
+        """
+        Get the artifact path of an individual.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual.
+
+        Returns
+        -------
+        pathlib.Path
+            The path of the individual's artifact.
+        """
+        return self.path / f"island_{ind.island}_worker_{ind.rank}_generation_{ind.generation}"
+
+    def add(self, ind: Individual) -> None:
+        """
+        Track the artifact of an evaluated individual of this worker for garbage collection.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The evaluated individual.
+        """
+        artifact = self.path_for(ind)
+        self._own.add(artifact)
+        self._gone.discard(artifact)
+
+    def find_parent(self, ind: Individual, population: List[Individual]) -> Optional[Individual]:
+        """
+        Find the individual closest to the given one in the search space which has an existing artifact.
+
+        Distances are computed on the individuals' positions, with continuous and integer genes normalized by the width
+        of their limits. The candidates are checked for an existing artifact from the closest one on, skipping those
+        known to be gone.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The newly bred individual.
+        population : List[propulate.population.Individual]
+            The evaluated individuals to choose the parent from.
+
+        Returns
+        -------
+        propulate.population.Individual, optional
+            The closest individual with an existing artifact, or None if there is none.
+        """
+        candidates = [parent for parent in population if self.path_for(parent) not in self._gone]
+        if len(candidates) == 0:
+            return None
+        scale = np.ones_like(ind.position, dtype=float)
+        for key, limit in ind.limits.items():
+            if ind.types[key] is not str:
+                low, high = limit.bounds if isinstance(limit, Transformed) else (float(limit[0]), float(limit[1]))
+                scale[ind.offsets[key]] = max(abs(high - low), 1e-12)
+        positions = np.array([parent.position for parent in candidates], dtype=float)
+        distances = np.linalg.norm((positions - ind.position) / scale, axis=1)
+        for idx in np.argsort(distances, kind="stable"):
+            artifact = self.path_for(candidates[idx])
+            if artifact.exists():
+                return candidates[idx]
+            self._gone.add(artifact)  # Deleted by its origin worker or never written.
+        return None
+
+    def collect_garbage(self, population: List[Individual], island: int, rank: int) -> None:
+        """
+        Delete the artifacts of a worker's individuals that are inactive or not among the best active individuals.
+
+        Only the artifacts tracked via ``add()`` are considered.
+
+        Parameters
+        ----------
+        population : List[propulate.population.Individual]
+            The island population as known to the worker.
+        island : int
+            The worker's island index.
+        rank : int
+            The worker's rank within its island.
+        """
+        active = sorted((ind for ind in population if ind.active), key=lambda ind: ind.loss)
+        needed = {self.path_for(ind) for ind in active[: self.keep]}
+        for artifact in self._own - needed:
+            log.debug(f"Island {island} Worker {rank}: Deleting artifact {artifact}.")
+            try:
+                artifact.unlink(missing_ok=True)
+            except OSError:  # Artifact is a directory.
+                shutil.rmtree(artifact, ignore_errors=True)
+            self._own.discard(artifact)
+            self._gone.add(artifact)
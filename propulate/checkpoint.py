@@ -0,0 +1,1693 @@
+import copy
+import json
+import logging
+import os
+import pickle
+import queue
+import signal
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import h5py
+import numpy as np
+from mpi4py import MPI
+
+from .population import Individual, Transformed
+
+log = logging.getLogger(__name__)  # Get logger instance.
+
+RECORD_HEADER: Final[struct.Struct] = struct.Struct("<QI")  # Length and CRC32 prefix of each record in a checkpoint log
+CHECKSUM_HEADER: Final[struct.Struct] = struct.Struct("<I")  # CRC32 prefix of snapshots and optimizer state checkpoints
+LAYOUT_FILE: Final[str] = "layout.json"  # File storing the number of workers on each island of a checkpoint
+INDIVIDUAL_RECORD: Final[str] = "individual"  # Record of an individual added to the island population
+DEACTIVATION_RECORD: Final[str] = "deactivation"  # Record of an individual deactivated in the island population
+# Scalar attributes of individuals stored as columns in HDF5 checkpoints
+HDF5_COLUMNS: Final[Dict[str, Any]] = {
+    "loss": np.float64,
+    "generation": np.int64,
+    "rank": np.int64,
+    "island": np.int64,
+    "current": np.int64,
+    "migration_steps": np.int64,
+    "active": np.bool_,
+    "evaltime": np.float64,
+    "evalperiod": np.float64,
+    "operator": np.int64,
+    "migration_history": h5py.string_dtype(),
+}
+
+
+def individual_key(ind: Individual) -> Tuple[int, int, int, int]:
+    """
+    Get the key identifying an individual in an island population.
+
+    Parameters
+    ----------
+    ind : propulate.population.Individual
+        The individual.
+
+    Returns
+    -------
+    Tuple[int, int, int, int]
+        The individual's birth island, the rank of the worker that bred it, its generation, and the number of
+        migration steps it performed.
+    """
+    return ind.island, ind.rank, ind.generation, ind.migration_steps
+
+
+def _fsync_directory(path: Path) -> None:
+    """
+    Flush a directory to disk so that renames of files in it persist after a crash.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The directory.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # E.g., directories cannot be opened on Windows.
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(path: Path) -> None:
+    """
+    Flush a file written by another library, e.g., h5py, to disk.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The file.
+    """
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
+def atomic_write(path: Path, data: bytes, backup_path: Optional[Path] = None) -> None:
+    """
+    Atomically replace a file, such that a crash leaves either the old or the new file but never a partial one.
+
+    The data is written to a temporary file, which is flushed to disk and then renamed to the target.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The file.
+    data : bytes
+        The file's new content.
+    backup_path : pathlib.Path, optional
+        Where to keep the old file, if any, as backup. Default is None, i.e., no backup.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if backup_path is not None and path.is_file():
+        os.replace(path, backup_path)
+    os.replace(tmp_path, path)
+    _fsync_directory(path.parent)
+
+
+def _dumps_checked(obj: Any) -> bytes:
+    """
+    Serialize an object, prefixed with a checksum.
+
+    Parameters
+    ----------
+    obj : Any
+        The object.
+
+    Returns
+    -------
+    bytes
+        The CRC32 checksum of the pickled object, followed by the pickled object.
+    """
+    data = pickle.dumps(obj)
+    return CHECKSUM_HEADER.pack(zlib.crc32(data)) + data
+
+
+def _loads_checked(data: bytes) -> Any:
+    """
+    Deserialize an object serialized with ``_dumps_checked()``, verifying its checksum.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized object.
+
+    Returns
+    -------
+    Any
+        The object.
+
+    Raises
+    ------
+    ValueError
+        If the data is truncated or corrupted, i.e., the checksum does not match.
+    """
+    if len(data) < CHECKSUM_HEADER.size or CHECKSUM_HEADER.unpack_from(data)[0] != zlib.crc32(data[CHECKSUM_HEADER.size :]):
+        raise ValueError("Checksum mismatch.")
+    return pickle.loads(data[CHECKSUM_HEADER.size :])
+
+
+def _iter_records(path: Path, offset: int = 0) -> Iterator[Tuple[int, Tuple[int, str, Any]]]:
+    """
+    Iterate over the complete records of a checkpoint log one by one, reading only one record into memory at a time.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The checkpoint log file.
+    offset : int, optional
+        The byte offset of the first record to read. Default is 0.
+
+    Yields
+    ------
+    int
+        The byte offset after the record.
+    Tuple[int, str, Any]
+        The record's sequence number, kind, and payload. Iteration stops at a record truncated by a crash while writing
+        or corrupted, i.e., whose checksum does not match.
+    """
+    if not path.is_file():
+        return
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            length, checksum = RECORD_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length or zlib.crc32(data) != checksum:
+                return  # Truncated or corrupted record
+            try:
+                record = pickle.loads(data)
+            except (pickle.UnpicklingError, EOFError, ValueError):
+                return  # Corrupted record
+            offset += RECORD_HEADER.size + length
+            yield offset, record
+
+
+def _read_records(path: Path) -> Tuple[List[Tuple[int, str, Any]], int]:
+    """
+    Read all complete records from a checkpoint log.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The checkpoint log file.
+
+    Returns
+    -------
+    List[Tuple[int, str, Any]]
+        The sequence number, kind, and payload of each complete record.
+    int
+        The number of bytes occupied by the complete records. A record truncated by a crash while writing is ignored.
+    """
+    records: List[Tuple[int, str, Any]] = []
+    offset = 0
+    for offset, record in _iter_records(path):
+        records.append(record)
+    return records, offset
+
+
+def _read_snapshot(path: Path) -> Optional[Tuple[int, List[Tuple[int, str, Any]]]]:
+    """
+    Read a checkpoint snapshot.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The snapshot file.
+
+    Returns
+    -------
+    Tuple[int, List[Tuple[int, str, Any]]], optional
+        The sequence number of the last record contained in the snapshot and the records contained in the snapshot, or
+        None if there is no valid snapshot.
+    """
+    if not path.is_file():
+        return None
+    try:
+        with open(path, "rb") as f:
+            last_seq, records = _loads_checked(f.read())
+        return last_seq, records
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        log.warning(f"Ignoring invalid checkpoint snapshot {path}.")
+        return None
+
+
+def _read_worker_snapshot(log_path: Path) -> Tuple[int, List[Tuple[int, str, Any]]]:
+    """
+    Read the snapshot of a worker's checkpoint log, falling back to the previous snapshot if it is missing or corrupted.
+
+    The previous snapshot and the log compacted into the current snapshot are kept as backups upon compaction. Together,
+    they contain the same records as the current snapshot.
+
+    Parameters
+    ----------
+    log_path : pathlib.Path
+        The worker's checkpoint log file.
+
+    Returns
+    -------
+    int
+        The sequence number of the last record contained in the snapshot, -1 if there is no valid snapshot.
+    List[Tuple[int, str, Any]]
+        The records contained in the snapshot.
+    """
+    snapshot_path = log_path.with_name(f"{log_path.stem}_snapshot.pickle")
+    snapshot = _read_snapshot(snapshot_path)
+    if snapshot is not None:
+        return snapshot
+    previous = _read_snapshot(snapshot_path.with_suffix(".bkp"))
+    previous_log_path = log_path.with_name(f"{log_path.stem}_log.bkp")
+    if previous is None and not previous_log_path.is_file():
+        return -1, []
+    log.warning(f"Recovering checkpoint log {log_path} from previous snapshot.")
+    last_seq, records = (-1, []) if previous is None else previous
+    for _, record in _iter_records(previous_log_path):
+        if record[0] > last_seq:
+            records.append(record)
+            last_seq = record[0]
+    return last_seq, records
+
+
+def _fold_deactivations(records: List[Tuple[int, str, Any]]) -> List[Tuple[int, str, Any]]:
+    """
+    Apply deactivation records to the individual records they refer to, dropping the applied deactivation records.
+
+    Deactivations of individuals not contained in the given records are kept as they refer to records of other workers.
+
+    Parameters
+    ----------
+    records : List[Tuple[int, str, Any]]
+        The records in the order they were recorded.
+
+    Returns
+    -------
+    List[Tuple[int, str, Any]]
+        The folded records.
+    """
+    active: Dict[Tuple[int, int, int, int], List[Individual]] = {}
+    folded: List[Tuple[int, str, Any]] = []
+    for record in records:
+        _, kind, payload = record
+        if kind == INDIVIDUAL_RECORD:
+            if payload.active:
+                active.setdefault(individual_key(payload), []).append(payload)
+        elif kind == DEACTIVATION_RECORD and len(active.get(payload, [])) > 0:
+            active[payload].pop(0).active = False  # Only deactivate one copy.
+            continue
+        folded.append(record)
+    return folded
+
+
+def _state_path(checkpoint_path: Path, island_idx: int, rank: int) -> Path:
+    """
+    Get the path of a worker's optimizer state checkpoint.
+
+    Parameters
+    ----------
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+    island_idx : int
+        The worker's island index.
+    rank : int
+        The worker's rank within its island.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the worker's optimizer state checkpoint.
+    """
+    return checkpoint_path / f"island_{island_idx}_worker_{rank}_state.pickle"
+
+
+def _write_state(path: Path, state: bytes) -> None:
+    """
+    Atomically replace a worker's optimizer state checkpoint, keeping the previous one as backup.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path of the worker's optimizer state checkpoint.
+    state : bytes
+        The optimizer state, serialized with ``_dumps_checked()``.
+    """
+    atomic_write(path, state, path.with_suffix(".bkp"))
+
+
+def load_worker_state(checkpoint_path: Path, island_idx: int, rank: int) -> Optional[Any]:
+    """
+    Load a worker's optimizer state checkpoint, e.g., propagator and random number generator states.
+
+    Parameters
+    ----------
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+    island_idx : int
+        The worker's island index.
+    rank : int
+        The worker's rank within its island.
+
+    Returns
+    -------
+    Any, optional
+        The worker's optimizer state, or None if there is no valid optimizer state checkpoint. If the latest optimizer
+        state checkpoint is corrupted, the previous one is returned.
+    """
+    path = _state_path(checkpoint_path, island_idx, rank)
+    for state_path in (path, path.with_suffix(".bkp")):  # Fall back to previous state if current one is corrupted.
+        if not state_path.is_file():
+            continue
+        try:
+            with open(state_path, "rb") as f:
+                return _loads_checked(f.read())
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            log.warning(f"Ignoring invalid optimizer state checkpoint {state_path}.")
+    return None
+
+
+def read_layout(checkpoint_path: Path) -> Optional[List[int]]:
+    """
+    Read the island layout, i.e., the number of workers on each island, of the run that wrote a checkpoint.
+
+    Parameters
+    ----------
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+
+    Returns
+    -------
+    List[int], optional
+        The number of workers on each island, or None if the checkpoint has no (valid) layout file.
+    """
+    try:
+        with open(checkpoint_path / LAYOUT_FILE) as f:
+            return [int(size) for size in json.load(f)["island_sizes"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_layout(checkpoint_path: Path, island_sizes: Sequence[int]) -> None:
+    """
+    Write the island layout, i.e., the number of workers on each island, of the current run.
+
+    Parameters
+    ----------
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+    island_sizes : Sequence[int]
+        The number of workers on each island.
+    """
+    atomic_write(checkpoint_path / LAYOUT_FILE, json.dumps({"island_sizes": [int(size) for size in island_sizes]}).encode())
+
+
+def archive_checkpoints(checkpoint_path: Path) -> Path:
+    """
+    Move all island checkpoint files and the layout file into a new archive subdirectory of the checkpoint directory.
+
+    Parameters
+    ----------
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+
+    Returns
+    -------
+    pathlib.Path
+        The archive directory.
+    """
+    idx = 0
+    while (checkpoint_path / f"resharded_{idx}").exists():
+        idx += 1
+    archive_path = checkpoint_path / f"resharded_{idx}"
+    archive_path.mkdir()
+    for path in [*checkpoint_path.glob("island_*"), checkpoint_path / LAYOUT_FILE]:
+        if path.is_file():
+            os.replace(path, archive_path / path.name)
+    return archive_path
+
+
+def reshard_populations(populations: Sequence[List[Individual]], island_sizes: Sequence[int]) -> List[List[Individual]]:
+    """
+    Redistribute the island populations of a checkpoint over a new island layout.
+
+    The individuals of old island ``j`` are merged into new island ``j % num_islands``, keeping one copy of individuals
+    that migrated between merged islands, preferably an active one. A new island without old islands mapped to it is
+    seeded with a copy of the population of old island ``i % num_old_islands``. Within each new island, the individuals
+    are sorted by evaluation time and assigned round-robin to the new workers, i.e., each worker becomes responsible for
+    and is considered the breeder of every ``island_size``-th individual, with consecutive generations. Each worker thus
+    resumes with an equal share of the already evaluated individuals. As the identities of the individuals change,
+    resharded populations need to be checkpointed from scratch.
+
+    Parameters
+    ----------
+    populations : Sequence[List[propulate.population.Individual]]
+        The population of each old island.
+    island_sizes : Sequence[int]
+        The number of workers on each new island.
+
+    Returns
+    -------
+    List[List[propulate.population.Individual]]
+        The population of each new island. The individuals are copies.
+    """
+    resharded = []
+    for island_idx, island_size in enumerate(island_sizes):
+        sources = [idx for idx in range(len(populations)) if idx % len(island_sizes) == island_idx]
+        if len(sources) == 0 and len(populations) > 0:
+            sources = [island_idx % len(populations)]
+        unique: Dict[Tuple[int, int, int, int], Individual] = {}
+        for ind in (ind for idx in sources for ind in populations[idx]):
+            key = individual_key(ind)  # Merged islands may hold migrated copies of the same individual.
+            if key not in unique or (ind.active and not unique[key].active):
+                unique[key] = ind
+        population = [copy.deepcopy(ind) for ind in unique.values()]
+        population.sort(key=lambda ind: (ind.evaltime, individual_key(ind)))
+        for idx, ind in enumerate(population):
+            ind.island, ind.rank, ind.generation = island_idx, idx % island_size, idx // island_size
+            ind.current, ind.migration_steps = ind.rank, 0
+        resharded.append(population)
+    return resharded
+
+
+class CheckpointLog:
+    """
+    Append-only checkpoint log of the population events a single worker originates.
+
+    Each worker records the individuals it evaluates, the immigrants it is responsible for, and the individuals it
+    deactivates. Every event is thus recorded exactly once per island, and the cost of checkpointing is proportional to
+    the number of new events. Records are buffered in memory and appended to the worker's log file as length-prefixed
+    pickles upon ``flush()``. Once the log holds at least as many records as the worker's snapshot (and at least
+    ``compaction_threshold``), it is compacted into the snapshot, folding deactivations into the records of the
+    individuals concerned. This keeps the amortized cost per record constant. Records carry per-worker sequence numbers
+    so that records already contained in the snapshot are skipped on recovery.
+
+    All writes are flushed to disk before returning. Records and snapshots carry CRC32 checksums, and snapshots are
+    replaced atomically. Upon compaction, the previous snapshot and the compacted log are kept as backups, so that a
+    missing or corrupted snapshot can be recovered. Recovery stops at the first truncated or corrupted record of a log.
+
+    Attributes
+    ----------
+    compaction_threshold : int
+        The minimum number of records in the log before it is compacted into the snapshot.
+    log_path : pathlib.Path
+        The worker's log file.
+    snapshot_path : pathlib.Path
+        The worker's snapshot file.
+    snapshot_backup_path : pathlib.Path
+        The worker's previous snapshot file.
+    log_backup_path : pathlib.Path
+        The worker's log file compacted into the current snapshot.
+    state_path : pathlib.Path
+        The worker's optimizer state file.
+
+    Methods
+    -------
+    record_individual()
+        Record an individual added to the island population.
+    record_deactivation()
+        Record an individual deactivated in the island population.
+    record_state()
+        Record the worker's optimizer state.
+    take_records()
+        Take all buffered records out of the buffer.
+    write_records()
+        Append records taken out of the buffer to the log and compact it if necessary.
+    flush()
+        Append all buffered records to the log and compact it if necessary.
+    compact()
+        Compact the log into the snapshot.
+    load_population()
+        Recover an island population from the logs and snapshots of all its workers.
+    """
+
+    def __init__(self, checkpoint_path: Path, island_idx: int, rank: int, compaction_threshold: int = 1000) -> None:
+        """
+        Open the checkpoint log of a worker, dropping records truncated by a crash or corrupted.
+
+        Parameters
+        ----------
+        checkpoint_path : pathlib.Path
+            The checkpoint directory.
+        island_idx : int
+            The worker's island index.
+        rank : int
+            The worker's rank within its island.
+        compaction_threshold : int, optional
+            The minimum number of records in the log before it is compacted into the snapshot. Default is 1000.
+        """
+        self.log_path = checkpoint_path / f"island_{island_idx}_worker_{rank}.log"
+        self.snapshot_path = checkpoint_path / f"island_{island_idx}_worker_{rank}_snapshot.pickle"
+        self.snapshot_backup_path = self.snapshot_path.with_suffix(".bkp")
+        self.log_backup_path = checkpoint_path / f"island_{island_idx}_worker_{rank}_log.bkp"
+        self.state_path = _state_path(checkpoint_path, island_idx, rank)
+        self.compaction_threshold = compaction_threshold
+        self._buffer: List[bytes] = []  # Serialized records not yet appended to the log
+        self._state: Optional[bytes] = None  # Serialized optimizer state not yet written
+        # NOTE The sequence number and number of records in the buffer are maintained by the thread recording, the
+        # remaining counters by the thread writing the records.
+        self._num_buffered = 0
+
+        snapshot_seq, snapshot_records = _read_worker_snapshot(self.log_path)
+        log_records, valid_size = _read_records(self.log_path)
+        self._num_snapshot_records = len(snapshot_records)
+        self._num_log_records = len([record for record in log_records if record[0] > snapshot_seq])
+        self._seq = max([snapshot_seq] + [record[0] for record in log_records])  # Last used sequence number
+        self._written_seq = self._seq  # Last sequence number written to the log
+        if self.log_path.is_file() and self.log_path.stat().st_size > valid_size:
+            log.warning(f"Dropping truncated or corrupted records at the end of checkpoint log {self.log_path}.")
+            os.truncate(self.log_path, valid_size)
+
+    def _record(self, kind: str, payload: Any) -> None:
+        """
+        Serialize and buffer a record.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of record.
+        payload : Any
+            The record's payload.
+        """
+        self._seq += 1
+        data = pickle.dumps((self._seq, kind, payload))
+        self._buffer.append(RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data)
+        self._num_buffered += 1
+
+    def record_individual(self, ind: Individual) -> None:
+        """
+        Record an individual added to the island population.
+
+        The individual is serialized immediately, i.e., later changes are not reflected in the record.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual.
+        """
+        self._record(INDIVIDUAL_RECORD, ind)
+
+    def record_deactivation(self, ind: Individual) -> None:
+        """
+        Record an individual deactivated in the island population.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The deactivated individual.
+        """
+        self._record(DEACTIVATION_RECORD, individual_key(ind))
+
+    def record_state(self, state: Any) -> None:
+        """
+        Record the worker's optimizer state, e.g., propagator and random number generator states.
+
+        The state is serialized immediately and written after the records buffered so far, replacing the previous state.
+
+        Parameters
+        ----------
+        state : Any
+            The worker's optimizer state.
+        """
+        self._state = _dumps_checked(state)
+
+    def take_records(self) -> Optional[Tuple[int, int, bytes, Optional[bytes]]]:
+        """
+        Take all buffered records out of the buffer.
+
+        Returns
+        -------
+        Tuple[int, int, bytes, Optional[bytes]], optional
+            The sequence number of the last record, the number of records, the serialized records, and the serialized
+            optimizer state (if recorded), or None if the buffer is empty.
+        """
+        if self._num_buffered == 0 and self._state is None:
+            return None
+        records = (self._seq, self._num_buffered, b"".join(self._buffer), self._state)
+        self._buffer, self._num_buffered, self._state = [], 0, None
+        return records
+
+    def write_records(self, records: Tuple[int, int, bytes, Optional[bytes]]) -> None:
+        """
+        Append records taken out of the buffer to the log and compact the log into the snapshot if necessary.
+
+        The optimizer state is written after the records so that it never is ahead of the recorded population.
+
+        Parameters
+        ----------
+        records : Tuple[int, int, bytes, Optional[bytes]]
+            The records as returned by ``take_records()``.
+        """
+        last_seq, num_records, data, state = records
+        if num_records > 0:
+            with open(self.log_path, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._written_seq = last_seq
+            self._num_log_records += num_records
+            if self._num_log_records >= max(self.compaction_threshold, self._num_snapshot_records):
+                self.compact()
+        if state is not None:
+            _write_state(self.state_path, state)
+
+    def flush(self) -> None:
+        """Append all buffered records to the log and compact the log into the snapshot if necessary."""
+        records = self.take_records()
+        if records is not None:
+            self.write_records(records)
+
+    def compact(self) -> None:
+        """Compact all records of the log into the snapshot and start a new log, keeping the old ones as backups."""
+        snapshot_seq, snapshot_records = _read_worker_snapshot(self.log_path)
+        log_records, _ = _read_records(self.log_path)
+        records = _fold_deactivations(snapshot_records + [record for record in log_records if record[0] > snapshot_seq])
+        atomic_write(self.snapshot_path, _dumps_checked((self._written_seq, records)), self.snapshot_backup_path)
+        # Records remaining in the log if a crash occurs now are skipped on recovery by their sequence numbers.
+        if self.log_path.is_file():
+            os.replace(self.log_path, self.log_backup_path)
+            _fsync_directory(self.log_path.parent)
+        self._num_snapshot_records, self._num_log_records = len(records), 0
+
+    @staticmethod
+    def load_population(checkpoint_path: Path, island_idx: int) -> List[Individual]:
+        """
+        Recover an island population from the snapshots and logs of all its workers.
+
+        Parameters
+        ----------
+        checkpoint_path : pathlib.Path
+            The checkpoint directory.
+        island_idx : int
+            The island index.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The recovered population. Empty if there are no checkpoint logs for this island.
+        """
+        population: List[Individual] = []
+        deactivations: List[Tuple[int, int, int, int]] = []
+        log_paths = set(checkpoint_path.glob(f"island_{island_idx}_worker_*.log"))
+        log_paths |= {
+            path.with_name(path.name.replace("_snapshot.pickle", ".log"))
+            for path in checkpoint_path.glob(f"island_{island_idx}_worker_*_snapshot.pickle")
+        }
+        for log_path in sorted(log_paths):
+            snapshot_seq, snapshot_records = _read_worker_snapshot(log_path)
+            log_records, _ = _read_records(log_path)
+            for _, kind, payload in snapshot_records + [record for record in log_records if record[0] > snapshot_seq]:
+                if kind == INDIVIDUAL_RECORD:
+                    population.append(payload)
+                elif kind == DEACTIVATION_RECORD:
+                    deactivations.append(payload)
+        # Apply deactivations once all individuals are known as they may have been recorded by other workers.
+        _fold_deactivations(
+            [(0, INDIVIDUAL_RECORD, ind) for ind in population] + [(0, DEACTIVATION_RECORD, key) for key in deactivations]
+        )
+        return population
+
+
+def _append_rows(h5_file: h5py.File, name: str, rows: np.ndarray, count: int, chunk_size: int) -> None:
+    """
+    Append rows to a chunked, extendable dataset of an HDF5 checkpoint, creating it if necessary.
+
+    Rows beyond the committed count, e.g., from an append interrupted by a crash, are overwritten. A dataset created
+    after rows were committed to other datasets is filled up with NaN. Each chunk of numeric datasets carries a
+    Fletcher-32 checksum, so corrupted chunks raise an ``OSError`` when read.
+
+    Parameters
+    ----------
+    h5_file : h5py.File
+        The HDF5 checkpoint file opened for writing.
+    name : str
+        The dataset's name.
+    rows : numpy.ndarray
+        The rows to append.
+    count : int
+        The number of rows committed so far.
+    chunk_size : int
+        The number of rows per chunk.
+    """
+    if name not in h5_file:
+        h5_file.create_dataset(
+            name,
+            shape=(count,) + rows.shape[1:],
+            maxshape=(None,) + rows.shape[1:],
+            dtype=rows.dtype if rows.dtype.kind != "O" else h5py.string_dtype(),
+            chunks=(chunk_size,) + rows.shape[1:],
+            fillvalue=np.nan if rows.dtype.kind == "f" else None,
+            fletcher32=rows.dtype.kind != "O",  # Checksum per chunk, verified when reading; not for strings
+        )
+    dataset = h5_file[name]
+    dataset.resize(count + len(rows), axis=0)
+    dataset[count:] = rows
+
+
+def _dump_limits(limits: Any) -> str:
+    """
+    Serialize a search space to JSON, keeping the transforms of ``Transformed`` limits by name.
+
+    Parameters
+    ----------
+    limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space.
+
+    Returns
+    -------
+    str
+        The JSON representation.
+    """
+    return json.dumps(
+        {
+            key: [limit[0], limit[1], limit.transform.name] if isinstance(limit, Transformed) else list(limit)
+            for key, limit in limits.items()
+        }
+    )
+
+
+def _load_limits(text: str) -> Dict[str, Any]:
+    """
+    Deserialize a search space written by ``_dump_limits()``.
+
+    Parameters
+    ----------
+    text : str
+        The JSON representation.
+
+    Returns
+    -------
+    Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space.
+    """
+    limits: Dict[str, Any] = {}
+    for key, limit in json.loads(text).items():
+        if len(limit) == 3 and isinstance(limit[0], float) and isinstance(limit[2], str):
+            limits[key] = Transformed(*limit)  # Continuous limits with transform
+        else:
+            limits[key] = tuple(limit)
+    return limits
+
+
+def _individual_columns(individuals: List[Individual]) -> Dict[str, np.ndarray]:
+    """
+    Convert individuals into columns of an HDF5 checkpoint.
+
+    Parameters
+    ----------
+    individuals : List[propulate.population.Individual]
+        The individuals.
+
+    Returns
+    -------
+    Dict[str, numpy.ndarray]
+        The columns, i.e., the positions, the velocities and multi-objective losses (NaN if unset; only if any
+        individual has them), and the scalar attributes in ``HDF5_COLUMNS``.
+    """
+    columns = {
+        name: np.array([getattr(ind, name) for ind in individuals], dtype=dtype if name != "migration_history" else object)
+        for name, dtype in HDF5_COLUMNS.items()
+    }
+    columns["position"] = np.array([ind.position for ind in individuals], dtype=np.float64)
+    if any(ind.velocity is not None for ind in individuals):
+        columns["velocity"] = np.array(
+            [ind.velocity if ind.velocity is not None else np.full_like(ind.position, np.nan) for ind in individuals],
+            dtype=np.float64,
+        )
+    if any(ind.losses is not None for ind in individuals):
+        num_objectives = max(len(ind.losses) for ind in individuals if ind.losses is not None)
+        columns["losses"] = np.array(
+            [ind.losses if ind.losses is not None else np.full(num_objectives, np.nan) for ind in individuals],
+            dtype=np.float64,
+        )
+    return columns
+
+
+def _write_individuals(h5_file: h5py.File, individuals: List[Individual], chunk_size: int) -> None:
+    """
+    Append individuals to the columns of an HDF5 checkpoint and commit their count.
+
+    Parameters
+    ----------
+    h5_file : h5py.File
+        The HDF5 checkpoint file opened for writing.
+    individuals : List[propulate.population.Individual]
+        The individuals to append.
+    chunk_size : int
+        The number of rows per chunk.
+    """
+    count = int(h5_file.attrs.get("num_individuals", 0))
+    if "limits" not in h5_file.attrs:
+        h5_file.attrs["limits"] = _dump_limits(individuals[0].limits)
+    columns = _individual_columns(individuals)
+    if "velocity" in h5_file and "velocity" not in columns:
+        columns["velocity"] = np.full_like(columns["position"], np.nan)
+    if "losses" in h5_file and "losses" not in columns:
+        columns["losses"] = np.full((len(individuals),) + h5_file["losses"].shape[1:], np.nan)
+    for name, rows in columns.items():
+        _append_rows(h5_file, name, rows, count, chunk_size)
+    h5_file.attrs["num_individuals"] = count + len(individuals)  # Commit rows only once all columns are written.
+
+
+def _memmap_dataset(path: Union[str, Path], dataset: h5py.Dataset) -> Optional[np.ndarray]:
+    """
+    Memory-map a dataset of an HDF5 file if it is stored contiguously and uncompressed.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        The HDF5 file.
+    dataset : h5py.Dataset
+        The dataset.
+
+    Returns
+    -------
+    numpy.ndarray, optional
+        The read-only memory-mapped dataset, or None if the dataset cannot be memory-mapped.
+    """
+    if dataset.chunks is not None or dataset.compression is not None or dataset.dtype.kind not in "biuf":
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:  # Storage not allocated, e.g., empty dataset
+        return None
+    return np.memmap(path, mode="r", dtype=dataset.dtype, shape=dataset.shape, offset=offset)
+
+
+def read_hdf5_columns(
+    path: Union[str, Path], columns: Optional[Iterable[str]] = None, rows: Union[slice, np.ndarray] = slice(None)
+) -> Dict[str, np.ndarray]:
+    """
+    Read columns of individuals from an HDF5 checkpoint without reconstructing the individuals.
+
+    Only the requested columns and rows are read from disk, e.g., ``read_hdf5_columns(path, ["loss", "active"])`` to
+    analyze the losses of a large population. Rows of an append interrupted by a crash are not returned. Numeric
+    columns of final island checkpoints are stored contiguously and memory-mapped instead of read, i.e., rows are only
+    loaded from disk when accessed and all processes on a node share the operating system's page cache.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        The HDF5 checkpoint file, i.e., a worker's checkpoint log or a final island checkpoint.
+    columns : Iterable[str], optional
+        The columns to read, i.e., ``"position"``, ``"velocity"``, ``"losses"``, or any of ``HDF5_COLUMNS``. Default is
+        all columns.
+    rows : slice | numpy.ndarray, optional
+        The rows to read, as a slice or increasing indices. Default is all rows.
+
+    Returns
+    -------
+    Dict[str, numpy.ndarray]
+        The requested columns. Strings are decoded. Memory-mapped columns are read-only.
+    """
+    with h5py.File(path, "r") as h5_file:
+        count = int(h5_file.attrs.get("num_individuals", 0))
+        if columns is None:
+            columns = [name for name in ["position", "velocity", "losses", *HDF5_COLUMNS] if name in h5_file]
+        data = {}
+        for name in columns:
+            if count == 0:
+                data[name] = np.empty(0, dtype=object if name == "migration_history" else HDF5_COLUMNS.get(name, np.float64))
+                continue
+            selection = rows if isinstance(rows, np.ndarray) else slice(*rows.indices(count))
+            mapped = _memmap_dataset(path, h5_file[name])
+            if mapped is not None:
+                data[name] = mapped[selection]
+                continue
+            dataset = h5_file[name].asstr() if name == "migration_history" else h5_file[name]
+            data[name] = np.asarray(dataset[selection])
+        return data
+
+
+def read_hdf5_population(path: Union[str, Path], rows: slice = slice(None)) -> List[Individual]:
+    """
+    Read the individuals from an HDF5 checkpoint.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        The HDF5 checkpoint file, i.e., a worker's checkpoint log or a final island checkpoint.
+    rows : slice, optional
+        The rows to read, e.g., to read a large checkpoint in batches. Default is all rows.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The individuals in the order they were written.
+    """
+    with h5py.File(path, "r") as h5_file:
+        if int(h5_file.attrs.get("num_individuals", 0)) == 0:
+            return []
+        limits = _load_limits(h5_file.attrs["limits"])
+    columns = read_hdf5_columns(path, rows=rows)
+    population = []
+    for idx, position in enumerate(columns["position"]):
+        velocity = columns["velocity"][idx] if "velocity" in columns else None
+        ind = Individual(position, limits, velocity=None if velocity is None or np.isnan(velocity).all() else velocity)
+        for name, dtype in HDF5_COLUMNS.items():
+            if name not in columns:  # Column added after the checkpoint was written
+                continue
+            setattr(ind, name, str(columns[name][idx]) if name == "migration_history" else dtype(columns[name][idx]).item())
+        if "losses" in columns and not np.isnan(columns["losses"][idx]).all():
+            ind.losses = np.array(columns["losses"][idx], dtype=np.float64)
+        population.append(ind)
+    return population
+
+
+def write_hdf5_population(path: Union[str, Path], population: List[Individual], comm: MPI.Comm = MPI.COMM_SELF) -> None:
+    """
+    Write a population to an HDF5 checkpoint.
+
+    The file is written to a temporary file first, which then replaces ``path``. If ``h5py`` is built with MPI support
+    and ``comm`` has more than one rank, all ranks of ``comm`` write a slice of the population to the same file in
+    parallel. This requires all ranks to call this function with the same population, possibly in a different order.
+    Otherwise, only rank 0 of ``comm`` writes the file. As the population is written at once, the columns are stored
+    contiguously so that they can be memory-mapped when reading.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        The HDF5 checkpoint file.
+    population : List[propulate.population.Individual]
+        The population to write.
+    comm : MPI.Comm, optional
+        The communicator of the ranks writing the population. Default is ``MPI.COMM_SELF``.
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+    parallel = h5py.get_config().mpi and comm.size > 1 and len(set(comm.allgather(len(population)))) == 1
+    if parallel:
+        # Bring the population into the same order on all ranks to write disjoint slices.
+        population = sorted(population, key=lambda ind: (individual_key(ind), ind.active, ind.loss))
+        start, stop = comm.rank * len(population) // comm.size, (comm.rank + 1) * len(population) // comm.size
+        columns = _individual_columns(population) if len(population) > 0 else {}
+        shapes = comm.bcast({name: rows.shape for name, rows in columns.items()})  # Identical metadata on all ranks
+        with h5py.File(tmp_path, "w", driver="mpio", comm=comm) as h5_file:
+            for name, shape in shapes.items():
+                dataset = h5_file.create_dataset(
+                    name, shape=shape, dtype=h5py.string_dtype() if name == "migration_history" else columns[name].dtype
+                )
+                with dataset.collective:
+                    dataset[start:stop] = columns[name][start:stop]
+            if len(population) > 0:
+                h5_file.attrs["limits"] = _dump_limits(population[0].limits)
+            h5_file.attrs["num_individuals"] = len(population)
+        comm.barrier()
+    elif comm.rank == 0:
+        with h5py.File(tmp_path, "w") as h5_file:
+            for name, rows in (_individual_columns(population) if len(population) > 0 else {}).items():
+                h5_file.create_dataset(name, data=rows, dtype=h5py.string_dtype() if name == "migration_history" else rows.dtype)
+            if len(population) > 0:
+                h5_file.attrs["limits"] = _dump_limits(population[0].limits)
+            h5_file.attrs["num_individuals"] = len(population)
+    if comm.rank == 0:  # Flush new file to disk before replacing old one so that a crash leaves a complete file.
+        _fsync_file(tmp_path)
+        if path.is_file():
+            try:
+                os.replace(path, path.with_suffix(".bkp"))
+            except OSError as e:
+                log.warning(e)
+        os.replace(tmp_path, path)
+        _fsync_directory(path.parent)
+
+
+class HDF5CheckpointLog:
+    """
+    Append-only checkpoint log of the population events a single worker originates, in a columnar HDF5 file.
+
+    Like ``CheckpointLog``, each worker records the individuals it evaluates, the immigrants it is responsible for, and
+    the individuals it deactivates. Individuals are stored column-wise in chunked, extendable datasets (positions,
+    velocities, losses, generations, ranks, islands, active status, and migration fields), deactivations as rows of the
+    keys of the individuals concerned. Upon ``flush()``, all buffered records are appended at once, and the number of
+    valid rows is committed afterward, so that rows of an append interrupted by a crash are ignored and overwritten.
+    As the columns are stored compactly, there is no need for compaction. Use ``read_hdf5_columns()`` to analyze
+    (subsets of) checkpoints without reconstructing the individuals.
+
+    Attributes
+    ----------
+    chunk_size : int
+        The number of rows per chunk of the datasets.
+    log_path : pathlib.Path
+        The worker's HDF5 checkpoint file.
+    state_path : pathlib.Path
+        The worker's optimizer state file.
+
+    Methods
+    -------
+    record_individual()
+        Record an individual added to the island population.
+    record_deactivation()
+        Record an individual deactivated in the island population.
+    record_state()
+        Record the worker's optimizer state.
+    take_records()
+        Take all buffered records out of the buffer.
+    write_records()
+        Append records taken out of the buffer to the checkpoint file.
+    flush()
+        Append all buffered records to the checkpoint file.
+    load_population()
+        Recover an island population from the HDF5 checkpoint files of all its workers.
+    """
+
+    def __init__(self, checkpoint_path: Path, island_idx: int, rank: int, chunk_size: int = 256) -> None:
+        """
+        Initialize the HDF5 checkpoint log of a worker.
+
+        Parameters
+        ----------
+        checkpoint_path : pathlib.Path
+            The checkpoint directory.
+        island_idx : int
+            The worker's island index.
+        rank : int
+            The worker's rank within its island.
+        chunk_size : int, optional
+            The number of rows per chunk of the datasets. Default is 256.
+        """
+        self.log_path = checkpoint_path / f"island_{island_idx}_worker_{rank}.h5"
+        self.state_path = _state_path(checkpoint_path, island_idx, rank)
+        self.chunk_size = chunk_size
+        self._individuals: List[Individual] = []  # Copies of individuals not yet appended to the file
+        self._deactivations: List[Tuple[int, int, int, int]] = []  # Deactivations not yet appended to the file
+        self._state: Optional[bytes] = None  # Serialized optimizer state not yet written
+
+    def record_individual(self, ind: Individual) -> None:
+        """
+        Record an individual added to the island population.
+
+        The individual is copied immediately, i.e., later changes are not reflected in the record.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual.
+        """
+        copy = Individual(ind.position.copy(), ind.limits, None if ind.velocity is None else ind.velocity.copy())
+        for name in HDF5_COLUMNS:
+            setattr(copy, name, getattr(ind, name))
+        copy.losses = None if ind.losses is None else ind.losses.copy()
+        self._individuals.append(copy)
+
+    def record_deactivation(self, ind: Individual) -> None:
+        """
+        Record an individual deactivated in the island population.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The deactivated individual.
+        """
+        self._deactivations.append(individual_key(ind))
+
+    def record_state(self, state: Any) -> None:
+        """
+        Record the worker's optimizer state, e.g., propagator and random number generator states.
+
+        The state is serialized immediately and written after the records buffered so far, replacing the previous state.
+
+        Parameters
+        ----------
+        state : Any
+            The worker's optimizer state.
+        """
+        self._state = _dumps_checked(state)
+
+    def take_records(self) -> Optional[Tuple[List[Individual], List[Tuple[int, int, int, int]], Optional[bytes]]]:
+        """
+        Take all buffered records out of the buffer.
+
+        Returns
+        -------
+        Tuple[List[propulate.population.Individual], List[Tuple[int, int, int, int]], Optional[bytes]], optional
+            The recorded individuals, the keys of the deactivated individuals, and the serialized optimizer state (if
+            recorded), or None if the buffer is empty.
+        """
+        if len(self._individuals) == 0 and len(self._deactivations) == 0 and self._state is None:
+            return None
+        records = (self._individuals, self._deactivations, self._state)
+        self._individuals, self._deactivations, self._state = [], [], None
+        return records
+
+    def write_records(self, records: Tuple[List[Individual], List[Tuple[int, int, int, int]], Optional[bytes]]) -> None:
+        """
+        Append records taken out of the buffer to the worker's HDF5 checkpoint file.
+
+        The optimizer state is written after the records so that it never is ahead of the recorded population.
+
+        Parameters
+        ----------
+        records : Tuple[List[propulate.population.Individual], List[Tuple[int, int, int, int]], Optional[bytes]]
+            The records as returned by ``take_records()``.
+        """
+        individuals, deactivations, state = records
+        if len(individuals) > 0 or len(deactivations) > 0:
+            with h5py.File(self.log_path, "a") as h5_file:
+                if len(individuals) > 0:
+                    _write_individuals(h5_file, individuals, self.chunk_size)
+                if len(deactivations) > 0:
+                    count = int(h5_file.attrs.get("num_deactivations", 0))
+                    rows = np.array(deactivations, dtype=np.int64)
+                    _append_rows(h5_file, "deactivations", rows, count, self.chunk_size)
+                    h5_file.attrs["num_deactivations"] = count + len(rows)
+            _fsync_file(self.log_path)
+        if state is not None:
+            _write_state(self.state_path, state)
+
+    def flush(self) -> None:
+        """Append all buffered records to the worker's HDF5 checkpoint file."""
+        records = self.take_records()
+        if records is not None:
+            self.write_records(records)
+
+    @staticmethod
+    def load_population(checkpoint_path: Path, island_idx: int) -> List[Individual]:
+        """
+        Recover an island population from the HDF5 checkpoint files of all its workers.
+
+        Parameters
+        ----------
+        checkpoint_path : pathlib.Path
+            The checkpoint directory.
+        island_idx : int
+            The island index.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The recovered population. Empty if there are no HDF5 checkpoint files for this island.
+        """
+        population: List[Individual] = []
+        deactivations: List[Tuple[int, int, int, int]] = []
+        for log_path in sorted(checkpoint_path.glob(f"island_{island_idx}_worker_*.h5")):
+            try:
+                population += read_hdf5_population(log_path)
+                with h5py.File(log_path, "r") as h5_file:
+                    if "deactivations" in h5_file:
+                        count = int(h5_file.attrs.get("num_deactivations", 0))
+                        deactivations += [tuple(key) for key in h5_file["deactivations"][:count].tolist()]
+            except (OSError, KeyError) as e:
+                log.warning(f"Ignoring invalid HDF5 checkpoint {log_path}: {e}")
+        # Apply deactivations once all individuals are known as they may have been recorded by other workers.
+        _fold_deactivations(
+            [(0, INDIVIDUAL_RECORD, ind) for ind in population] + [(0, DEACTIVATION_RECORD, key) for key in deactivations]
+        )
+        return population
+
+
+def load_island_population(checkpoint_path: Path, island_idx: int, checkpoint_format: str = "pickle") -> List[Individual]:
+    """
+    Load the population of an island from a checkpoint directory.
+
+    The population is recovered from the workers' checkpoint logs. If there are none, the final island checkpoint
+    ``island_{idx}_ckpt.pickle`` or ``island_{idx}_ckpt.h5``, respectively, is read instead, or its backup if it is
+    missing or corrupted, e.g., by a crash while writing.
+
+    Parameters
+    ----------
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+    island_idx : int
+        The island index.
+    checkpoint_format : str, optional
+        The checkpoint format, either ``"pickle"`` or ``"hdf5"``. Default is ``"pickle"``.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The island's population, empty if there is no valid checkpoint.
+    """
+    checkpoint_log_type = HDF5CheckpointLog if checkpoint_format == "hdf5" else CheckpointLog
+    population = checkpoint_log_type.load_population(checkpoint_path, island_idx)
+    if len(population) > 0:
+        return population
+    # If no checkpoint logs exist, check for full population checkpoint, falling back to backup if missing or corrupted.
+    ckpt_file = checkpoint_path / f"island_{island_idx}_ckpt{'.h5' if checkpoint_format == 'hdf5' else '.pickle'}"
+    for load_ckpt_file in (ckpt_file, ckpt_file.with_suffix(".bkp")):
+        if not load_ckpt_file.is_file():
+            continue
+        try:
+            if checkpoint_format == "hdf5":
+                return read_hdf5_population(load_ckpt_file)
+            with open(load_ckpt_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, KeyError, pickle.UnpicklingError, EOFError, ValueError) as e:
+            log.warning(f"Ignoring invalid checkpoint {load_ckpt_file}: {e}")
+    return []
+
+
+class AsyncCheckpointWriter:
+    """
+    Background writer overlapping the checkpoint I/O of a worker with its evaluations.
+
+    Wraps a worker's checkpoint log. Records are buffered by the worker as before; upon ``flush()``, the buffered records
+    are handed to a writer thread, which appends them to the checkpoint log while the worker carries on. At most
+    ``max_pending`` batches of records are queued; if the writer falls behind, ``flush()`` blocks until a batch has been
+    written. ``close()`` waits until all batches have been written. Errors of the writer thread are raised on the next
+    call of ``flush()`` or ``close()``.
+
+    Attributes
+    ----------
+    checkpoint_log : CheckpointLog | HDF5CheckpointLog
+        The wrapped checkpoint log.
+    max_pending : int
+        The maximum number of queued batches of records.
+
+    Methods
+    -------
+    record_individual()
+        Record an individual added to the island population.
+    record_deactivation()
+        Record an individual deactivated in the island population.
+    record_state()
+        Record the worker's optimizer state.
+    flush()
+        Hand all buffered records to the writer thread.
+    close()
+        Wait until all records have been written and stop the writer thread.
+    """
+
+    def __init__(self, checkpoint_log: Union[CheckpointLog, HDF5CheckpointLog], max_pending: int = 4) -> None:
+        """
+        Initialize a background checkpoint writer.
+
+        Parameters
+        ----------
+        checkpoint_log : CheckpointLog | HDF5CheckpointLog
+            The checkpoint log to write to.
+        max_pending : int, optional
+            The maximum number of queued batches of records. Default is 4.
+        """
+        self.checkpoint_log = checkpoint_log
+        self.max_pending = max_pending
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)  # Batches of records, None to stop the thread
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None  # Error raised in the writer thread
+
+    def _run(self) -> None:
+        """Write queued batches of records until stopped."""
+        while True:
+            records = self._queue.get()
+            if records is None:
+                return
+            try:
+                if self._error is None:  # Do not write any more records after an error to keep the log consistent.
+                    self.checkpoint_log.write_records(records)
+            except Exception as e:
+                self._error = e
+
+    def _raise_error(self) -> None:
+        """Raise an error that occurred in the writer thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Writing checkpoint {self.checkpoint_log.log_path} failed.") from error
+
+    def record_individual(self, ind: Individual) -> None:
+        """
+        Record an individual added to the island population.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual.
+        """
+        self.checkpoint_log.record_individual(ind)
+
+    def record_deactivation(self, ind: Individual) -> None:
+        """
+        Record an individual deactivated in the island population.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The deactivated individual.
+        """
+        self.checkpoint_log.record_deactivation(ind)
+
+    def record_state(self, state: Any) -> None:
+        """
+        Record the worker's optimizer state.
+
+        Parameters
+        ----------
+        state : Any
+            The worker's optimizer state.
+        """
+        self.checkpoint_log.record_state(state)
+
+    def flush(self) -> None:
+        """Hand all buffered records to the writer thread, blocking while ``max_pending`` batches are queued."""
+        self._raise_error()
+        records = self.checkpoint_log.take_records()
+        if records is None:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+            self._thread.start()
+        self._queue.put(records)
+
+    def close(self) -> None:
+        """Wait until all handed records have been written and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+
+class CheckpointPolicy:
+    """
+    Policy determining when a worker dumps its checkpoint, i.e., flushes its checkpoint log.
+
+    This base policy dumps after every generation. Subclasses implement ``should_dump()`` to set the checkpoint
+    frequency from the I/O budget instead. Independent of the policy, the final checkpoint is always dumped at the end
+    of the optimization. Each worker uses its own copy of the policy.
+
+    Methods
+    -------
+    start()
+        Prepare the policy at the start of the optimization.
+    should_dump()
+        Determine whether the worker dumps its checkpoint after the current generation.
+    should_stop()
+        Determine whether the worker stops breeding, e.g., as the job is about to be terminated.
+    stop()
+        Clean up the policy at the end of the optimization.
+    """
+
+    def start(self) -> None:
+        """Prepare the policy at the start of the optimization."""
+        pass
+
+    def should_dump(self, num_individuals: int, elapsed: float) -> bool:
+        """
+        Determine whether the worker dumps its checkpoint after the current generation.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals the worker evaluated since its last dump.
+        elapsed : float
+            The wall-clock time in seconds since the worker's last dump.
+
+        Returns
+        -------
+        bool
+            True if the worker dumps its checkpoint, False if not.
+        """
+        return True
+
+    def should_stop(self) -> bool:
+        """
+        Determine whether the worker stops breeding and proceeds to the final synchronization and checkpoint.
+
+        Returns
+        -------
+        bool
+            True if the worker stops breeding, False if not.
+        """
+        return False
+
+    def stop(self) -> None:
+        """Clean up the policy at the end of the optimization."""
+        pass
+
+
+class IntervalCheckpointPolicy(CheckpointPolicy):
+    """
+    Policy dumping a worker's checkpoint at most every ``interval`` seconds.
+
+    Attributes
+    ----------
+    interval : float
+        The minimum wall-clock time in seconds between two dumps.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """
+        Initialize an interval checkpoint policy.
+
+        Parameters
+        ----------
+        interval : float
+            The minimum wall-clock time in seconds between two dumps.
+        """
+        self.interval = interval
+
+    def should_dump(self, num_individuals: int, elapsed: float) -> bool:
+        """
+        Dump if at least ``interval`` seconds have passed since the last dump.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals the worker evaluated since its last dump.
+        elapsed : float
+            The wall-clock time in seconds since the worker's last dump.
+
+        Returns
+        -------
+        bool
+            True if the worker dumps its checkpoint, False if not.
+        """
+        return num_individuals > 0 and elapsed >= self.interval
+
+
+class VolumeCheckpointPolicy(CheckpointPolicy):
+    """
+    Policy dumping a worker's checkpoint every ``num_individuals`` individuals evaluated by the worker.
+
+    Attributes
+    ----------
+    num_individuals : int
+        The number of individuals a worker evaluates between two dumps.
+    """
+
+    def __init__(self, num_individuals: int) -> None:
+        """
+        Initialize a volume checkpoint policy.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals a worker evaluates between two dumps.
+        """
+        self.num_individuals = num_individuals
+
+    def should_dump(self, num_individuals: int, elapsed: float) -> bool:
+        """
+        Dump if the worker has evaluated at least ``num_individuals`` individuals since the last dump.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals the worker evaluated since its last dump.
+        elapsed : float
+            The wall-clock time in seconds since the worker's last dump.
+
+        Returns
+        -------
+        bool
+            True if the worker dumps its checkpoint, False if not.
+        """
+        return num_individuals >= self.num_individuals
+
+
+class SignalCheckpointPolicy(CheckpointPolicy):
+    """
+    Policy dumping a worker's checkpoint after receiving a signal.
+
+    Use it to checkpoint, e.g., upon the ``SIGTERM`` sent by a job scheduler before the job's wall-clock limit. Upon
+    receiving one of the signals, the worker dumps its checkpoint once its current evaluation is done. Upon a stop
+    signal, the worker then stops breeding and proceeds to the final synchronization and checkpoint, so that the run
+    ends orderly. Upon any other signal, it carries on with the optimization. The signal handlers can only be
+    installed from the main thread and are restored at the end of the optimization.
+
+    Attributes
+    ----------
+    signals : Sequence[signal.Signals]
+        The signals triggering a dump.
+    stop_signals : Sequence[signal.Signals]
+        The signals additionally ending the optimization after the dump.
+    """
+
+    def __init__(
+        self,
+        signals: Optional[Sequence[signal.Signals]] = None,
+        stop_signals: Optional[Sequence[signal.Signals]] = None,
+    ) -> None:
+        """
+        Initialize a signal checkpoint policy.
+
+        Parameters
+        ----------
+        signals : Sequence[signal.Signals], optional
+            The signals triggering a dump. Default is ``SIGTERM`` and ``SIGUSR1`` (where available).
+        stop_signals : Sequence[signal.Signals], optional
+            The signals among ``signals`` additionally ending the optimization after the dump. Default is ``SIGTERM``.
+        """
+        if signals is None:
+            signals = [getattr(signal, name) for name in ("SIGTERM", "SIGUSR1") if hasattr(signal, name)]
+        if stop_signals is None:
+            stop_signals = [signal.SIGTERM]
+        self.signals = signals
+        self.stop_signals = stop_signals
+        self._received = False  # Whether a signal was received since the last dump
+        self._stop = False  # Whether a stop signal was received
+        self._previous_handlers: Dict[signal.Signals, Any] = {}  # Handlers to restore
+
+    def _handle(self, signum: int, frame: Any) -> None:
+        """
+        Remember that a signal was received and whether it ends the optimization.
+
+        Parameters
+        ----------
+        signum : int
+            The received signal.
+        frame : Any
+            The current stack frame.
+        """
+        self._received = True
+        if signum in self.stop_signals:
+            self._stop = True
+
+    def start(self) -> None:
+        """Install the signal handlers."""
+        for sig in self.signals:
+            try:
+                self._previous_handlers[sig] = signal.signal(sig, self._handle)
+            except ValueError:
+                log.warning(f"Cannot install handler for signal {sig} outside of the main thread.")
+
+    def should_dump(self, num_individuals: int, elapsed: float) -> bool:
+        """
+        Dump if a signal was received since the last dump.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals the worker evaluated since its last dump.
+        elapsed : float
+            The wall-clock time in seconds since the worker's last dump.
+
+        Returns
+        -------
+        bool
+            True if the worker dumps its checkpoint, False if not.
+        """
+        received, self._received = self._received, False
+        return received
+
+    def should_stop(self) -> bool:
+        """
+        Stop breeding once a stop signal was received.
+
+        Returns
+        -------
+        bool
+            True if the worker stops breeding, False if not.
+        """
+        return self._stop
+
+    def stop(self) -> None:
+        """Restore the previous signal handlers."""
+        for sig, handler in self._previous_handlers.items():
+            signal.signal(sig, handler)
+        self._previous_handlers = {}
+
+
+class ShutdownCheckpointPolicy(CheckpointPolicy):
+    """Policy dumping a worker's checkpoint only at the end of the optimization."""
+
+    def should_dump(self, num_individuals: int, elapsed: float) -> bool:
+        """
+        Never dump during the optimization.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals the worker evaluated since its last dump.
+        elapsed : float
+            The wall-clock time in seconds since the worker's last dump.
+
+        Returns
+        -------
+        bool
+            Always False.
+        """
+        return False
+
+
+class AnyCheckpointPolicy(CheckpointPolicy):
+    """
+    Policy dumping a worker's checkpoint if any of the given policies does, e.g., every ten minutes and on ``SIGTERM``.
+
+    Attributes
+    ----------
+    policies : Tuple[CheckpointPolicy, ...]
+        The combined policies.
+    """
+
+    def __init__(self, *policies: CheckpointPolicy) -> None:
+        """
+        Initialize a combined checkpoint policy.
+
+        Parameters
+        ----------
+        *policies : CheckpointPolicy
+            The policies to combine.
+        """
+        self.policies = policies
+
+    def start(self) -> None:
+        """Prepare all combined policies."""
+        for policy in self.policies:
+            policy.start()
+
+    def should_dump(self, num_individuals: int, elapsed: float) -> bool:
+        """
+        Dump if any of the combined policies does.
+
+        All policies are queried, so that stateful policies, e.g., ``SignalCheckpointPolicy``, are reset upon dumping.
+
+        Parameters
+        ----------
+        num_individuals : int
+            The number of individuals the worker evaluated since its last dump.
+        elapsed : float
+            The wall-clock time in seconds since the worker's last dump.
+
+        Returns
+        -------
+        bool
+            True if the worker dumps its checkpoint, False if not.
+        """
+        return any([policy.should_dump(num_individuals, elapsed) for policy in self.policies])
+
+    def should_stop(self) -> bool:
+        """
+        Stop breeding if any of the combined policies does.
+
+        Returns
+        -------
+        bool
+            True if the worker stops breeding, False if not.
+        """
+        return any(policy.should_stop() for policy in self.policies)
+
+    def stop(self) -> None:
+        """Clean up all combined policies."""
+        for policy in self.policies:
+            policy.stop()
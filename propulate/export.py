@@ -0,0 +1,461 @@
+import csv
+import json
+import logging
+import pickle
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Final, Iterator, List, Optional, Set, Tuple, Union
+
+import h5py
+
+from .checkpoint import (
+    DEACTIVATION_RECORD,
+    INDIVIDUAL_RECORD,
+    _iter_records,
+    _read_worker_snapshot,
+    individual_key,
+    read_hdf5_population,
+)
+from .population import Individual
+
+log = logging.getLogger(__name__)  # Get logger instance.
+
+EXPORT_FORMATS: Final[Dict[str, str]] = {".parquet": "parquet", ".csv": "csv", ".jsonl": "jsonl"}  # Formats by suffix
+# Attributes of individuals exported as columns after the decoded (hyper-)parameters
+EXPORT_COLUMNS: Final[List[str]] = [
+    "loss",
+    "losses",
+    "island",
+    "rank",
+    "generation",
+    "migration_steps",
+    "current",
+    "active",
+    "evaltime",
+    "evalperiod",
+    "migration_history",
+]
+WORKER_FILE: Final[re.Pattern] = re.compile(r"island_(\d+)_worker_(\d+)(\.log|_snapshot\.pickle|\.h5)")
+CKPT_FILE: Final[re.Pattern] = re.compile(r"island_(\d+)_ckpt(\.pickle|\.h5)")
+
+
+def individual_row(ind: Individual) -> Dict[str, Any]:
+    """
+    Convert an individual into a row of exported results.
+
+    Parameters
+    ----------
+    ind : propulate.population.Individual
+        The individual.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The individual's decoded (hyper-)parameters and its attributes in ``EXPORT_COLUMNS`` as Python scalars, with
+        the losses of multi-objective optimization as list (None for single-objective losses).
+    """
+    row: Dict[str, Any] = {key: ind[key] for key in ind.limits}
+    for name in EXPORT_COLUMNS:
+        value = getattr(ind, name)
+        if name == "losses" and value is not None:
+            value = value.tolist()
+        row[name] = value.item() if hasattr(value, "item") else value
+    return row
+
+
+class _RowWriter:
+    """
+    Write batches of rows of results to a Parquet, CSV, or JSON Lines file.
+
+    CSV and JSON Lines files are flushed after each batch so that the rows can be read while following a running
+    optimization. Each batch becomes a row group of the Parquet file, which is only readable once closed.
+    """
+
+    def __init__(self, path: Path, export_format: str) -> None:
+        """
+        Open the output file.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            The output file.
+        export_format : str
+            The output format, i.e., ``"parquet"``, ``"csv"``, or ``"jsonl"``.
+
+        Raises
+        ------
+        ImportError
+            If the output format is Parquet and pyarrow is not installed.
+        """
+        self.path = path
+        self.export_format = export_format
+        self._file: Optional[IO[str]] = None
+        self._writer: Any = None  # CSV writer or Parquet writer, created with the first batch
+        if export_format == "parquet":
+            try:
+                import pyarrow  # type: ignore # noqa: F401
+            except ImportError as e:
+                raise ImportError("Exporting results to Parquet requires pyarrow, e.g., `pip install pyarrow`.") from e
+        else:
+            self._file = open(path, "w", newline="")
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch of rows.
+
+        Parameters
+        ----------
+        rows : List[Dict[str, Any]]
+            The rows, all with the same columns.
+        """
+        if self.export_format == "parquet":
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+
+            if self._writer is None:
+                table = pa.Table.from_pylist(rows)
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(pa.Table.from_pylist(rows, schema=self._writer.schema))
+            return
+        assert self._file is not None
+        if self.export_format == "csv":
+            if self._writer is None:
+                self._writer = csv.DictWriter(self._file, fieldnames=list(rows[0]))
+                self._writer.writeheader()
+            self._writer.writerows(rows)
+        else:
+            self._file.writelines(json.dumps(row) + "\n" for row in rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the output file."""
+        if self._file is not None:
+            self._file.close()
+        elif self._writer is not None:
+            self._writer.close()
+
+
+class ResultsExporter:
+    """
+    Stream the individuals of a checkpoint into a Parquet, CSV, or JSON Lines file for analysis.
+
+    Each individual is written as one row with its decoded (hyper-)parameters and the attributes in ``EXPORT_COLUMNS``
+    as columns. The exporter reads the checkpoint logs of all workers of all islands record by record, or in batches of
+    rows for HDF5 checkpoints, and writes the rows in batches. Memory usage is thus independent of the number of
+    individuals, except for the snapshot of a single worker's compacted log, which is read at once, and the keys of
+    deactivated individuals. If an island has no worker logs, its final checkpoint ``island_{idx}_ckpt.*`` is exported.
+
+    Use ``export()`` to export a finished optimization. To follow a running optimization, call ``poll()`` repeatedly
+    or use ``follow()``: Each individual is exported once, as soon as it is written to the checkpoint, so the ``active``
+    column reflects its status when recorded and later deactivations are not reflected. CSV and JSON Lines files can be
+    read while following, Parquet files only once the exporter is closed.
+
+    Attributes
+    ----------
+    batch_size : int
+        The number of rows written at once.
+    checkpoint_path : pathlib.Path
+        The checkpoint directory.
+    export_format : str
+        The output format, i.e., ``"parquet"``, ``"csv"``, or ``"jsonl"``.
+    num_exported : int
+        The number of individuals exported so far.
+    output_path : pathlib.Path
+        The output file.
+
+    Methods
+    -------
+    poll()
+        Export the individuals written to the checkpoint since the last poll.
+    export()
+        Export all individuals of a finished optimization and close the output file.
+    follow()
+        Follow a running optimization, exporting new individuals in regular intervals.
+    close()
+        Write the remaining rows and close the output file.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Union[str, Path],
+        output_path: Union[str, Path],
+        export_format: Optional[str] = None,
+        batch_size: int = 10000,
+    ) -> None:
+        """
+        Initialize a results exporter.
+
+        Parameters
+        ----------
+        checkpoint_path : str | pathlib.Path
+            The checkpoint directory.
+        output_path : str | pathlib.Path
+            The output file.
+        export_format : str, optional
+            The output format, i.e., ``"parquet"``, ``"csv"``, or ``"jsonl"``. Default is None, i.e., determined by the
+            suffix of the output file.
+        batch_size : int, optional
+            The number of rows written at once. Default is 10000.
+
+        Raises
+        ------
+        ValueError
+            If the output format is unknown.
+        ImportError
+            If the output format is Parquet and pyarrow is not installed.
+        """
+        self.checkpoint_path = Path(checkpoint_path)
+        self.output_path = Path(output_path)
+        if export_format is None:
+            export_format = EXPORT_FORMATS.get(self.output_path.suffix, self.output_path.suffix)
+        if export_format not in EXPORT_FORMATS.values():
+            raise ValueError(f"Unknown export format {export_format}, use one of {list(EXPORT_FORMATS.values())}.")
+        self.export_format = export_format
+        self.batch_size = batch_size
+        self.num_exported = 0
+        self._writer = _RowWriter(self.output_path, export_format)
+        self._rows: List[Dict[str, Any]] = []  # Rows not yet written
+        # Read position of each pickle checkpoint log, i.e., byte offset, last exported sequence number, and modification
+        # time of the snapshot the log was compacted into
+        self._log_positions: Dict[Path, Tuple[int, int, int]] = {}
+        self._hdf5_positions: Dict[Path, int] = {}  # Number of rows exported from each HDF5 checkpoint log
+        self._exported_ckpts: Set[Path] = set()  # Exported final island checkpoints
+        self._deactivations: Counter = Counter()  # Keys of deactivated individuals not yet matched during export
+
+    def _discover(self) -> Tuple[List[Path], List[Path], List[Path]]:
+        """
+        Find the checkpoint files to export.
+
+        Returns
+        -------
+        List[pathlib.Path]
+            The pickle checkpoint logs of all workers, including logs only existing as snapshots.
+        List[pathlib.Path]
+            The HDF5 checkpoint logs of all workers.
+        List[pathlib.Path]
+            The final checkpoints of islands without worker logs.
+        """
+        logs: Set[Path] = set()
+        hdf5_logs: Set[Path] = set()
+        ckpts: Dict[str, Path] = {}
+        for path in self.checkpoint_path.glob("island_*"):
+            if match := WORKER_FILE.fullmatch(path.name):
+                if match.group(3) == ".h5":
+                    hdf5_logs.add(path)
+                else:
+                    logs.add(path.with_name(f"island_{match.group(1)}_worker_{match.group(2)}.log"))
+            elif match := CKPT_FILE.fullmatch(path.name):
+                ckpts.setdefault(match.group(1), path)
+        islands_with_logs = {WORKER_FILE.fullmatch(path.name).group(1) for path in logs | hdf5_logs}  # type: ignore
+        return sorted(logs), sorted(hdf5_logs), [path for idx, path in sorted(ckpts.items()) if idx not in islands_with_logs]
+
+    def _log_records(self, path: Path) -> Iterator[Tuple[int, str, Any]]:
+        """
+        Iterate over the records of a pickle checkpoint log written since the last poll.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            The checkpoint log.
+
+        Yields
+        ------
+        Tuple[int, str, Any]
+            The record's sequence number, kind, and payload.
+        """
+        offset, last_seq, snapshot_mtime = self._log_positions.get(path, (0, -1, -1))
+        snapshot_path = path.with_name(f"{path.stem}_snapshot.pickle")
+        mtime = snapshot_path.stat().st_mtime_ns if snapshot_path.is_file() else -1
+        size = path.stat().st_size if path.is_file() else 0
+        if mtime != snapshot_mtime or size < offset:  # Log has been compacted since the last poll.
+            _, records = _read_worker_snapshot(path)
+            for record in records:
+                if record[0] > last_seq:
+                    last_seq = record[0]
+                    yield record
+            offset, snapshot_mtime = 0, mtime
+        for offset, record in _iter_records(path, offset):
+            if record[0] > last_seq:  # Skip records already contained in the snapshot.
+                last_seq = record[0]
+                yield record
+            self._log_positions[path] = (offset, last_seq, snapshot_mtime)
+        self._log_positions[path] = (offset, last_seq, snapshot_mtime)
+
+    def _hdf5_individuals(self, path: Path) -> Iterator[Individual]:
+        """
+        Iterate over the individuals of an HDF5 checkpoint written since the last poll, reading them in batches.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            The HDF5 checkpoint.
+
+        Yields
+        ------
+        propulate.population.Individual
+            The individuals.
+        """
+        start = self._hdf5_positions.get(path, 0)
+        try:
+            with h5py.File(path, "r") as h5_file:
+                count = int(h5_file.attrs.get("num_individuals", 0))
+        except OSError as e:  # E.g., locked by the writing worker.
+            log.debug(f"Skipping HDF5 checkpoint {path} in this poll: {e}")
+            return
+        for batch_start in range(start, count, self.batch_size):
+            batch_stop = min(batch_start + self.batch_size, count)
+            yield from read_hdf5_population(path, slice(batch_start, batch_stop))
+            self._hdf5_positions[path] = batch_stop
+
+    def _collect_deactivations(self) -> None:
+        """Collect the keys of all individuals deactivated in the checkpoint."""
+        logs, hdf5_logs, _ = self._discover()
+        for path in logs:
+            snapshot_seq, records = _read_worker_snapshot(path)
+            for _, kind, payload in records:
+                if kind == DEACTIVATION_RECORD:
+                    self._deactivations[payload] += 1
+            for _, (seq, kind, payload) in _iter_records(path):
+                if kind == DEACTIVATION_RECORD and seq > snapshot_seq:
+                    self._deactivations[payload] += 1
+        for path in hdf5_logs:
+            with h5py.File(path, "r") as h5_file:
+                if "deactivations" in h5_file:
+                    keys = h5_file["deactivations"][: int(h5_file.attrs.get("num_deactivations", 0))]
+                    self._deactivations.update(tuple(key) for key in keys.tolist())
+
+    def _add(self, ind: Individual) -> None:
+        """
+        Add an individual to the rows to write, writing a batch once complete.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual.
+        """
+        key = individual_key(ind)
+        if ind.active and self._deactivations[key] > 0:  # Only deactivate one copy.
+            self._deactivations[key] -= 1
+            ind.active = False
+        self._rows.append(individual_row(ind))
+        self.num_exported += 1
+        if len(self._rows) >= self.batch_size:
+            self._write()
+
+    def _write(self) -> None:
+        """Write the pending rows."""
+        if len(self._rows) > 0:
+            self._writer.write(self._rows)
+            self._rows = []
+
+    def poll(self) -> int:
+        """
+        Export the individuals written to the checkpoint since the last poll.
+
+        Returns
+        -------
+        int
+            The number of newly exported individuals.
+        """
+        num_exported = self.num_exported
+        logs, hdf5_logs, ckpts = self._discover()
+        for path in logs:
+            for _, kind, payload in self._log_records(path):
+                if kind == INDIVIDUAL_RECORD:
+                    self._add(payload)
+        for path in hdf5_logs:
+            for ind in self._hdf5_individuals(path):
+                self._add(ind)
+        for path in ckpts:
+            if path in self._exported_ckpts:
+                continue
+            if path.suffix == ".h5":
+                for ind in self._hdf5_individuals(path):
+                    self._add(ind)
+            else:
+                with open(path, "rb") as f:
+                    for ind in pickle.load(f):
+                        self._add(ind)
+            self._exported_ckpts.add(path)
+        self._write()
+        return self.num_exported - num_exported
+
+    def export(self) -> int:
+        """
+        Export all individuals of a finished optimization, with their final active status, and close the output file.
+
+        Returns
+        -------
+        int
+            The number of exported individuals.
+        """
+        self._collect_deactivations()
+        self.poll()
+        self.close()
+        log.info(f"Exported {self.num_exported} individuals from {self.checkpoint_path} to {self.output_path}.")
+        return self.num_exported
+
+    def follow(self, poll_interval: float = 10.0, stop: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Follow a running optimization, exporting new individuals in regular intervals, and close the output file.
+
+        Parameters
+        ----------
+        poll_interval : float, optional
+            The time between two polls in seconds. Default is 10.
+        stop : Callable[[], bool], optional
+            Function called after each poll, following stops once it returns True. Default is None, i.e., follow until
+            interrupted, e.g., by ``KeyboardInterrupt``.
+
+        Returns
+        -------
+        int
+            The number of exported individuals.
+        """
+        try:
+            while True:
+                self.poll()
+                if stop is not None and stop():
+                    break
+                time.sleep(poll_interval)
+        finally:
+            self.close()
+        return self.num_exported
+
+    def close(self) -> None:
+        """Write the remaining rows and close the output file."""
+        self._write()
+        self._writer.close()
+
+
+def export_results(
+    checkpoint_path: Union[str, Path],
+    output_path: Union[str, Path],
+    export_format: Optional[str] = None,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Export all individuals of a finished optimization to a Parquet, CSV, or JSON Lines file.
+
+    See ``ResultsExporter`` for details.
+
+    Parameters
+    ----------
+    checkpoint_path : str | pathlib.Path
+        The checkpoint directory.
+    output_path : str | pathlib.Path
+        The output file.
+    export_format : str, optional
+        The output format, i.e., ``"parquet"``, ``"csv"``, or ``"jsonl"``. Default is None, i.e., determined by the
+        suffix of the output file.
+    batch_size : int, optional
+        The number of rows written at once. Default is 10000.
+
+    Returns
+    -------
+    int
+        The number of exported individuals.
+    """
+    return ResultsExporter(checkpoint_path, output_path, export_format, batch_size).export()
@@ -2,17 +2,20 @@ import logging
 import platform
 import random
 from pathlib import Path
-from typing import Callable, Generator, List, Optional, Type, Union
+from typing import Any, Callable, Generator, List, Optional, Type, Union
 
 import numpy as np
 from mpi4py import MPI
 
+from .artifacts import ArtifactStore
+from .checkpoint import CheckpointPolicy
 from .migrator import Migrator
 from .pollinator import Pollinator
 from .population import Individual
 from .propagators import Propagator, SelectMax, SelectMin
 from .propulator import Propulator
 from .surrogate import Surrogate
+from .warm_start import WarmStart
 
 log = logging.getLogger(__name__)  # Get logger instance.
 
@@ -54,6 +57,17 @@ class Islands:
         checkpoint_path: Union[str, Path] = Path("./"),
         ranks_per_worker: int = 1,
         surrogate_factory: Optional[Callable[[], Surrogate]] = None,
+        time_budget: Optional[float] = None,
+        eval_timeout: Optional[float] = None,
+        timeout_loss: float = float("inf"),
+        worker_setup: Optional[Callable[[MPI.Comm], Any]] = None,
+        worker_teardown: Optional[Callable[[Any], None]] = None,
+        ranks_per_candidate: Optional[Callable[[Individual], int]] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        checkpoint_format: str = "pickle",
+        async_checkpointing: bool = True,
+        checkpoint_policy: Optional[CheckpointPolicy] = None,
+        warm_start: Optional[WarmStart] = None,
     ) -> None:
         """
         Initialize an island model with the given parameters.
@@ -89,10 +103,39 @@ class Islands:
         checkpoint_path : pathlib.Path | str, optional
             The path where checkpoints are loaded from and stored to. Default is the current working directory.
         ranks_per_worker : int, optional
-            The number of ranks per worker. Default is 1.
+            The number of ranks per worker. If ``ranks_per_candidate`` is given, this is the size of each worker's
+            pool of ranks. Default is 1.
         surrogate_factory : Callable[[], propulate.surrogate.Surrogate], optional
            Function that returns a new instance of a ``Surrogate`` model.
            Only used when ``loss_fn`` is a generator function.
+        time_budget : float, optional
+            The overall wall-clock time budget in seconds, measured from the set-up of the island model. Workers stop
+            breeding once their longest evaluation so far no longer fits into the remaining budget, after which the
+            final synchronization and checkpointing are performed. Default is None, i.e., no time budget.
+        eval_timeout : float, optional
+            The maximum wall-clock time in seconds a single evaluation of the loss function may take. Exceeding
+            evaluations are assigned ``timeout_loss``. Evaluations of multi-rank workers are not interrupted, but only
+            stopped at the yields of generator loss functions, see ``Propulator``. Hangs in plain loss functions of
+            multi-rank workers are not covered unless the loss function polls ``propulate.evaluation_deadline()`` and
+            stops itself. Default is None, i.e., no timeout.
+        timeout_loss : float, optional
+            The penalty loss recorded for evaluations exceeding ``eval_timeout``. Default is ``inf``.
+        worker_setup : Callable[[MPI.Comm], Any], optional
+            Hook called once on each rank of each worker at the start of the optimization with the worker's sub
+            communicator. Its return value, the worker context, is passed to every call of the loss function as
+            additional last positional argument. Default is None.
+        worker_teardown : Callable[[Any], None], optional
+            Hook called once on each rank of each worker at the end of the optimization with the worker context.
+            Default is None.
+        ranks_per_candidate : Callable[[propulate.population.Individual], int], optional
+            Function returning the number of ranks to evaluate a bred candidate on. If given, the ranks of each worker
+            form a pool that is dynamically split into variable-size groups, each evaluating one candidate. The loss
+            function is then always called with the candidate's communicator. Default is None.
+        artifact_store : propulate.artifacts.ArtifactStore, optional
+            The store for artifacts of evaluated individuals, e.g., trained weights, enabling population-based training.
+            The loss function finds the path to save its artifact at under ``ind["_artifact"]`` and the path of the
+            closest evaluated individual's artifact to warm-start from under ``ind["_parent_artifact"]``. Default is
+            None.
 
         Raises
         ------
@@ -102,6 +145,19 @@ class Islands:
             If the number of workers in the custom worker distribution does not equal overall number of ranks.
             If a custom migration topology has the wrong shape.
             If the migration probability is not within [0, 1].
+        checkpoint_format : str, optional
+            The checkpoint format, either ``"pickle"`` or ``"hdf5"`` for columnar HDF5 files, which can be analyzed
+            without unpickling. Default is ``"pickle"``.
+        async_checkpointing : bool, optional
+            Whether checkpoints are written by a background thread of each worker, overlapping checkpoint I/O with the
+            evaluations. Default is True.
+        checkpoint_policy : propulate.checkpoint.CheckpointPolicy, optional
+            The policy determining when each worker dumps its checkpoint, e.g., every N seconds or every K evaluated
+            individuals, to set the checkpoint frequency from the I/O budget. Default is None, i.e., dump after every
+            generation.
+        warm_start : propulate.warm_start.WarmStart, optional
+            The results of previous studies to seed the initial populations of all islands with if no checkpoint is
+            resumed from, e.g., to save random initial evaluations on related problems. Default is None.
         """
         # Set up full world communicator.
         full_world_rank, full_world_size = MPI.COMM_WORLD.rank, MPI.COMM_WORLD.size
@@ -252,6 +308,17 @@ class Islands:
                 island_displs=island_displs,
                 island_counts=island_sizes,
                 surrogate_factory=surrogate_factory,
+                time_budget=time_budget,
+                eval_timeout=eval_timeout,
+                timeout_loss=timeout_loss,
+                worker_setup=worker_setup,
+                worker_teardown=worker_teardown,
+                ranks_per_candidate=ranks_per_candidate,
+                artifact_store=artifact_store,
+                checkpoint_format=checkpoint_format,
+                async_checkpointing=async_checkpointing,
+                checkpoint_policy=checkpoint_policy,
+                warm_start=warm_start,
             )
         else:
             if full_world_rank == 0:
@@ -273,6 +340,17 @@ class Islands:
                 island_displs=island_displs,
                 island_counts=island_sizes,
                 surrogate_factory=surrogate_factory,
+                time_budget=time_budget,
+                eval_timeout=eval_timeout,
+                timeout_loss=timeout_loss,
+                worker_setup=worker_setup,
+                worker_teardown=worker_teardown,
+                ranks_per_candidate=ranks_per_candidate,
+                artifact_store=artifact_store,
+                checkpoint_format=checkpoint_format,
+                async_checkpointing=async_checkpointing,
+                checkpoint_policy=checkpoint_policy,
+                warm_start=warm_start,
             )
 
     def propulate(self, logging_interval: int = 10, debug: int = 1) -> None:
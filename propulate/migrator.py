@@ -2,16 +2,19 @@ import copy
 import logging
 import random
 from pathlib import Path
-from typing import Callable, Generator, List, Optional, Type, Union
+from typing import Any, Callable, Generator, List, Optional, Type, Union
 
 import numpy as np
 from mpi4py import MPI
 
 from ._globals import MIGRATION_TAG, SYNCHRONIZATION_TAG
+from .artifacts import ArtifactStore
+from .checkpoint import CheckpointPolicy
 from .population import Individual
 from .propagators import Propagator, SelectMin
 from .propulator import Propulator
 from .surrogate import Surrogate
+from .warm_start import WarmStart
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +62,17 @@ class Migrator(Propulator):
         island_displs: Optional[np.ndarray] = None,
         island_counts: Optional[np.ndarray] = None,
         surrogate_factory: Optional[Callable[[], Surrogate]] = None,
+        time_budget: Optional[float] = None,
+        eval_timeout: Optional[float] = None,
+        timeout_loss: float = float("inf"),
+        worker_setup: Optional[Callable[[MPI.Comm], Any]] = None,
+        worker_teardown: Optional[Callable[[Any], None]] = None,
+        ranks_per_candidate: Optional[Callable[[Individual], int]] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        checkpoint_format: str = "pickle",
+        async_checkpointing: bool = True,
+        checkpoint_policy: Optional[CheckpointPolicy] = None,
+        warm_start: Optional[WarmStart] = None,
     ) -> None:
         """
         Initialize ``Migrator`` with given parameters.
@@ -100,6 +114,39 @@ class Migrator(Propulator):
         surrogate_factory : Callable[[], propulate.surrogate.Surrogate], optional
            Function that returns a new instance of a ``Surrogate`` model.
            Only used when ``loss_fn`` is a generator function.
+        time_budget : float, optional
+            The overall wall-clock time budget in seconds, measured from the instantiation. Workers stop breeding once
+            their longest evaluation so far no longer fits into the remaining budget. Default is None.
+        eval_timeout : float, optional
+            The maximum wall-clock time in seconds a single evaluation of the loss function may take. Default is None.
+        timeout_loss : float, optional
+            The penalty loss recorded for evaluations exceeding ``eval_timeout``. Default is ``inf``.
+        worker_setup : Callable[[MPI.Comm], Any], optional
+            Hook called once on each rank of each worker at the start of the optimization with the worker's sub
+            communicator. Its return value, the worker context, is passed to every call of the loss function as
+            additional last positional argument. Default is None.
+        worker_teardown : Callable[[Any], None], optional
+            Hook called once on each rank of each worker at the end of the optimization with the worker context.
+            Default is None.
+        ranks_per_candidate : Callable[[propulate.population.Individual], int], optional
+            Function returning the number of ranks to evaluate a bred candidate on. If given, the ranks of each worker
+            form a pool that is dynamically split into variable-size groups, each evaluating one candidate. The loss
+            function is then always called with the candidate's communicator. Default is None.
+        artifact_store : propulate.artifacts.ArtifactStore, optional
+            The store for artifacts of evaluated individuals, e.g., trained weights, enabling population-based training.
+            The loss function finds the path to save its artifact at under ``ind["_artifact"]`` and the path of the
+            closest evaluated individual's artifact to warm-start from under ``ind["_parent_artifact"]``. Default is
+            None.
+        checkpoint_format : str, optional
+            The checkpoint format, either ``"pickle"`` or ``"hdf5"`` for columnar HDF5 files. Default is ``"pickle"``.
+        async_checkpointing : bool, optional
+            Whether checkpoints are written by a background thread of each worker. Default is True.
+        checkpoint_policy : propulate.checkpoint.CheckpointPolicy, optional
+            The policy determining when each worker dumps its checkpoint. Default is None, i.e., dump after every
+            generation.
+        warm_start : propulate.warm_start.WarmStart, optional
+            The results of previous studies to seed the initial population with if no checkpoint is resumed from.
+            Default is None.
         """
         super().__init__(
             loss_fn,
@@ -117,6 +164,17 @@ class Migrator(Propulator):
             island_displs,
             island_counts,
             surrogate_factory,
+            time_budget,
+            eval_timeout,
+            timeout_loss,
+            worker_setup,
+            worker_teardown,
+            ranks_per_candidate,
+            artifact_store,
+            checkpoint_format,
+            async_checkpointing,
+            checkpoint_policy,
+            warm_start,
         )
         # Set class attributes.
         self.emigrated: List[Individual] = []  # Emigrated individuals to be deactivated on sending island
@@ -186,6 +244,7 @@ class Migrator(Propulator):
                     assert len(to_deactivate) == 1  # There should be exactly one!
                     _, n_active_before = self._get_active_individuals()
                     self.population[to_deactivate[0]].active = False  # Deactivate emigrant in population.
+                    self.checkpoint_log.record_deactivation(emigrant)  # Record deactivation for checkpointing.
                     _, n_active_after = self._get_active_individuals()
                     log_string += (
                         f"Deactivated own emigrant {self.population[to_deactivate[0]]}. "
@@ -242,6 +301,8 @@ class Migrator(Propulator):
                         )
                     self.population.append(copy.deepcopy(immigrant))  # Append immigrant to population.
                     log_string += f"Added immigrant {immigrant} to population.\n"
+                    if immigrant.current == self.island_comm.rank:  # Responsible worker records immigrant.
+                        self.checkpoint_log.record_individual(immigrant)
 
                     # NOTE Do not remove obsolete individuals from population upon immigration
                     # as they should be deactivated in the next step anyway.
@@ -356,22 +417,26 @@ class Migrator(Propulator):
         """
         if self.worker_sub_comm != MPI.COMM_SELF:
             self.generation = self.worker_sub_comm.bcast(self.generation, root=0)
+        self._setup_worker()  # Set up persistent worker context.
         if self.propulate_comm is None:
-            while self.generations <= -1 or self.generation < self.generations:
+            self.checkpoint_policy.start()  # Handle signals like the worker's rank 0, which decides when to stop.
+            while self._continue_breeding():
                 # Breed and evaluate individual.
                 self._evaluate_individual()
                 self.generation += 1
+            self.checkpoint_policy.stop()
+            self._teardown_worker()  # Release persistent worker context.
             return
 
         if self.island_comm.rank == 0:
             log.info(f"Island {self.island_idx} has {self.island_comm.size} workers.")
 
-        dump = True if self.island_comm.rank == 0 else False
+        self.checkpoint_policy.start()  # E.g., install signal handlers.
         migration = True if self.migration_prob > 0 else False
         self.propulate_comm.barrier()
 
         # Loop over generations.
-        while self.generations <= -1 or self.generation < self.generations:
+        while self._continue_breeding():
             if self.generation % int(logging_interval) == 0:
                 log.info(f"Island {self.island_idx} Worker {self.island_comm.rank}: In generation {self.generation}...")
 
@@ -397,12 +462,12 @@ class Migrator(Propulator):
                     check = self._check_emigrants_to_deactivate()
                     assert check is False
 
-            if dump:  # Dump checkpoint.
+            if self._determine_worker_dumping_next():  # Dump checkpoint according to checkpoint policy.
                 self._dump_checkpoint()
-
-            dump = self._determine_worker_dumping_next()  # Determine worker dumping checkpoint in the next generation.
             self.generation += 1  # Go to next generation.
 
+        self._teardown_worker()  # Release persistent worker context.
+
         # Having completed all generations, the workers have to wait for each other.
         # Once all workers are done, they should check for incoming messages once again
         # so that each of them holds the complete final population and the found optimum
@@ -442,9 +507,6 @@ class Migrator(Propulator):
 
             self.propulate_comm.barrier()
 
-        # Final checkpointing on rank 0.
-        if self.island_comm.rank == 0:
-            self._dump_final_checkpoint()  # Dump checkpoint.
-        self.propulate_comm.barrier()
-        _ = self._determine_worker_dumping_next()
+        # Final checkpointing.
+        self._dump_final_checkpoint()  # Dump checkpoint.
         self.propulate_comm.barrier()
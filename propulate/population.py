@@ -1,9 +1,12 @@
 from decimal import Decimal
 from typing import (
     Any,
+    Callable,
+    Dict,
     Generator,
     ItemsView,
     KeysView,
+    List,
     Mapping,
     MutableMapping,
     Optional,
@@ -14,6 +17,385 @@ from typing import (
 
 import numpy as np
 
+TRANSFORMS: Dict[str, "Transform"] = {}  # Transforms by name, to restore them when loading individuals
+
+
+class Transform:
+    """
+    A strictly increasing transformation of a continuous parameter, in whose image propagators search.
+
+    Individuals store transformed values in their position and decode them with the inverse transformation. Each
+    transform is registered under its name. Pickled individuals, e.g., in checkpoints or sent to other workers, only
+    refer to this name, so custom transforms have to be created on every worker before use.
+
+    Attributes
+    ----------
+    forward : Callable[[np.ndarray], np.ndarray]
+        The transformation.
+    inverse : Callable[[np.ndarray], np.ndarray]
+        The inverse transformation.
+    name : str
+        The name of the transform.
+    """
+
+    def __init__(self, name: str, forward: Callable[[np.ndarray], np.ndarray], inverse: Callable[[np.ndarray], np.ndarray]) -> None:
+        """
+        Initialize and register a transform.
+
+        Parameters
+        ----------
+        name : str
+            The name of the transform.
+        forward : Callable[[np.ndarray], np.ndarray]
+            The strictly increasing, vectorized transformation.
+        inverse : Callable[[np.ndarray], np.ndarray]
+            The vectorized inverse transformation.
+        """
+        self.name = name
+        self.forward = forward
+        self.inverse = inverse
+        TRANSFORMS[name] = self
+
+    def __reduce__(self) -> Tuple[Callable[[str], "Transform"], Tuple[str]]:
+        """Pickle a transform by its name."""
+        return get_transform, (self.name,)
+
+
+def get_transform(transform: Union[str, Transform]) -> Transform:
+    """
+    Get a registered transform.
+
+    Parameters
+    ----------
+    transform : str | propulate.population.Transform
+        The transform or its name, e.g., "log" or "logit".
+
+    Returns
+    -------
+    propulate.population.Transform
+        The transform.
+
+    Raises
+    ------
+    ValueError
+        If there is no transform of this name.
+    """
+    if isinstance(transform, Transform):
+        return transform
+    if transform not in TRANSFORMS:
+        raise ValueError(f"Unknown transform {transform}. Create custom transforms on every worker before using them.")
+    return TRANSFORMS[transform]
+
+
+def _logit(x: np.ndarray) -> np.ndarray:
+    """Compute the logit function."""
+    return np.log(x) - np.log1p(-x)
+
+
+def _expit(x: np.ndarray) -> np.ndarray:
+    """Compute the logistic function, i.e., the inverse of the logit function."""
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+Transform("log", np.log, np.exp)
+Transform("logit", _logit, _expit)
+
+
+class Transformed(tuple):
+    """
+    The limits of a continuous parameter that is searched in a transformed space, e.g., on a log scale.
+
+    Use it in place of the ``(low, high)`` tuple of a continuous parameter in the search space, e.g.,
+    ``{"lr": Transformed(1e-5, 1e-1, "log")}``. It is a tuple of the original limits, so code that is unaware of the
+    transform still sees them. Propagators search in the transformed space, i.e., sample, mutate, and move individuals
+    between the transformed limits, while the loss function gets the original values.
+
+    Attributes
+    ----------
+    bounds : Tuple[float, float]
+        The transformed limits.
+    transform : propulate.population.Transform
+        The transform.
+    """
+
+    transform: Transform
+    bounds: Tuple[float, float]
+
+    def __new__(cls, low: float, high: float, transform: Union[str, Transform] = "log") -> "Transformed":
+        """
+        Create transformed limits.
+
+        Parameters
+        ----------
+        low : float
+            The original lower limit.
+        high : float
+            The original upper limit.
+        transform : str | propulate.population.Transform, optional
+            The transform or its name, i.e., "log", "logit", or the name of a custom transform. Default is "log".
+
+        Returns
+        -------
+        propulate.population.Transformed
+            The transformed limits.
+
+        Raises
+        ------
+        ValueError
+            If the transform is unknown or the transformed limits are not finite and increasing, e.g., for log-scale
+            limits that are not positive.
+        """
+        limits = super().__new__(cls, (float(low), float(high)))
+        limits.transform = get_transform(transform)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bounds = limits.transform.forward(np.array([float(low), float(high)]))
+        if not (np.all(np.isfinite(bounds)) and bounds[0] < bounds[1]):
+            raise ValueError(f"Limits ({low}, {high}) are invalid for the {limits.transform.name} transform.")
+        limits.bounds = (float(bounds[0]), float(bounds[1]))
+        return limits
+
+    def __getnewargs__(self) -> Tuple[float, float, Transform]:  # type: ignore[override]
+        """Return the arguments to create the limits with when unpickling."""
+        return self[0], self[1], self.transform
+
+    def __repr__(self) -> str:
+        """Return string representation of transformed limits."""
+        return f"Transformed({self[0]!r}, {self[1]!r}, {self.transform.name!r})"
+
+    def decode(self, values: np.ndarray) -> np.ndarray:
+        """
+        Map transformed values back to the original limits.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The transformed values.
+
+        Returns
+        -------
+        np.ndarray
+            The original values, clipped to the limits to absorb rounding errors.
+        """
+        return np.clip(self.transform.inverse(values), self[0], self[1])
+
+
+def _bounds(limit: Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]) -> Tuple[float, float]:
+    """
+    Get the limits of a continuous or integer-range trait in the position, i.e., transformed where applicable.
+
+    Parameters
+    ----------
+    limit : Tuple[float, float] | Tuple[int, int]
+        The limits of the trait.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The lower and upper limit in the position.
+    """
+    if isinstance(limit, Transformed):
+        return limit.bounds
+    return float(limit[0]), float(limit[1])
+
+
+class Encoding:
+    """
+    The vector encoding of a search space, i.e., where and how each trait is stored in an individual's position.
+
+    Continuous and ordinal traits take up one entry of the position, categorical traits a one-hot segment with one entry
+    per category. Continuous traits with ``Transformed`` limits are stored as transformed values. The encoding is
+    computed once per search space and shared by all individuals bred from each other, so that propagators can work on
+    whole position vectors instead of setting traits one at a time.
+
+    Attributes
+    ----------
+    categorical : np.ndarray
+        Whether each trait is categorical, i.e., of type str.
+    continuous : np.ndarray
+        Whether each trait is continuous, i.e., of type float.
+    keys : List[str]
+        The traits' names in search space order.
+    limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space.
+    lower : np.ndarray
+        The lower limit of each continuous or integer-range trait in the position, i.e., transformed where applicable, NaN
+        for all others.
+    offsets : Dict[str, int]
+        The index of each trait's (first) entry in the position.
+    ordinal : np.ndarray
+        Whether each trait is ordinal with explicitly given values, i.e., of type int with more than two limits.
+    size : int
+        The length of the position.
+    trait_offsets : np.ndarray
+        The index of each trait's (first) entry in the position as array.
+    types : Dict[str, type]
+        The type of each trait.
+    upper : np.ndarray
+        The upper limit of each continuous or integer-range trait in the position, i.e., transformed where applicable,
+        NaN for all others.
+    widths : np.ndarray
+        The number of entries of each trait in the position.
+
+    Methods
+    -------
+    decode()
+        Decode a position into the traits' values.
+    from_unit()
+        Map points of the unit hypercube to positions.
+    expand()
+        Expand a per-trait mask to a mask of the position's entries.
+    snap()
+        Map arbitrary real-valued positions to the closest valid positions.
+    """
+
+    def __init__(self, limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]]) -> None:
+        """
+        Compute the encoding of a search space.
+
+        Parameters
+        ----------
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The search space.
+
+        Raises
+        ------
+        ValueError
+            If a trait's name starts with ``_``.
+        """
+        self.limits = limits
+        self.keys: List[str] = list(limits)
+        for key in self.keys:
+            if key.startswith("_"):
+                raise ValueError("Keys starting with '_' are reserved.")
+        self.types = {key: type(limits[key][0]) for key in self.keys}
+        self.categorical = np.array([self.types[key] is str for key in self.keys], dtype=bool)
+        self.continuous = np.array([self.types[key] is float for key in self.keys], dtype=bool)
+        self.ordinal = np.array([self.types[key] is int and len(limits[key]) > 2 for key in self.keys], dtype=bool)
+        self.widths = np.array([len(limits[key]) if self.types[key] is str else 1 for key in self.keys], dtype=np.int64)
+        self.trait_offsets = np.concatenate(([0], np.cumsum(self.widths)[:-1])).astype(np.int64)
+        self.offsets = dict(zip(self.keys, self.trait_offsets.tolist()))
+        self.size = int(self.widths.sum())
+        ranged = ~(self.categorical | self.ordinal)
+        bounds = [_bounds(limits[key]) if r else (np.nan, np.nan) for key, r in zip(self.keys, ranged)]
+        self.lower = np.array([bound[0] for bound in bounds], dtype=np.float64)
+        self.upper = np.array([bound[1] for bound in bounds], dtype=np.float64)
+        self._transformed_traits = [trait for trait, key in enumerate(self.keys) if isinstance(limits[key], Transformed)]
+        integer = ~(self.continuous | self.categorical)
+        self._integer_traits = np.flatnonzero(integer).tolist()
+        self._integer_idx = self.trait_offsets[integer]
+        self._categorical_traits = np.flatnonzero(self.categorical).tolist()
+
+    def decode(self, position: np.ndarray) -> Dict[str, Union[float, int, str]]:
+        """
+        Decode a position into the traits' values.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The position.
+
+        Returns
+        -------
+        Dict[str, float | int | str]
+            The value of each trait, in search space order.
+        """
+        values: List[Union[float, int, str]] = position[self.trait_offsets].tolist()
+        for trait, value in zip(self._integer_traits, np.rint(position[self._integer_idx]).astype(np.int64).tolist()):
+            values[trait] = value
+        for trait in self._transformed_traits:
+            limit = self.limits[self.keys[trait]]
+            assert isinstance(limit, Transformed)
+            values[trait] = float(limit.decode(position[self.trait_offsets[trait]]))
+        for trait in self._categorical_traits:
+            key, offset = self.keys[trait], self.trait_offsets[trait]
+            values[trait] = str(self.limits[key][int(np.argmax(position[offset : offset + self.widths[trait]]))])
+        return dict(zip(self.keys, values))
+
+    def from_unit(self, unit: np.ndarray) -> np.ndarray:
+        """
+        Map points of the unit hypercube, with one dimension per trait, to positions.
+
+        Continuous traits are scaled to their limits. Integer, ordinal, and categorical traits divide the unit interval
+        into equally sized bins, one per value, so that uniform and stratified designs stay so in the search space.
+
+        Parameters
+        ----------
+        unit : np.ndarray
+            The points in :math:`[0, 1)^d`, one row per point.
+
+        Returns
+        -------
+        np.ndarray
+            The positions, one row per point.
+        """
+        positions = np.zeros((len(unit), self.size))
+        offsets = self.trait_offsets
+        continuous = self.continuous
+        positions[:, offsets[continuous]] = self.lower[continuous] + unit[:, continuous] * (
+            self.upper[continuous] - self.lower[continuous]
+        )
+        ranged = ~(self.continuous | self.categorical | self.ordinal)
+        counts = self.upper[ranged] - self.lower[ranged] + 1
+        positions[:, offsets[ranged]] = self.lower[ranged] + np.minimum(np.floor(unit[:, ranged] * counts), counts - 1)
+        categorical = self.categorical
+        bins = np.minimum(np.floor(unit[:, categorical] * self.widths[categorical]), self.widths[categorical] - 1)
+        positions[np.arange(len(unit))[:, None], offsets[categorical] + bins.astype(np.int64)] = 1.0
+        for trait in np.flatnonzero(self.ordinal):  # Ordinal traits with explicitly given values
+            values = np.asarray(self.limits[self.keys[trait]], dtype=np.float64)
+            idx = np.minimum(np.floor(unit[:, trait] * len(values)), len(values) - 1).astype(np.int64)
+            positions[:, offsets[trait]] = values[idx]
+        return positions
+
+    def expand(self, mask: np.ndarray) -> np.ndarray:
+        """
+        Expand a per-trait mask to a mask of the position's entries, covering the whole one-hot segment of categoricals.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            The boolean mask with one entry per trait along its last axis, e.g., one row per individual.
+
+        Returns
+        -------
+        np.ndarray
+            The boolean mask with one entry per position entry along its last axis.
+        """
+        return np.repeat(mask, self.widths, axis=-1)
+
+    def snap(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Map arbitrary real-valued positions, e.g., as obtained by vector arithmetic, to the closest valid positions.
+
+        Continuous and integer traits are clipped to their limits, integer traits are rounded, and ordinal traits are set
+        to their closest value. Categorical traits are set to the category with the largest entry of their segment.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions, one row per point.
+
+        Returns
+        -------
+        np.ndarray
+            The valid positions, one row per point.
+        """
+        positions = positions.copy()
+        ranged = ~(self.categorical | self.ordinal)
+        idx = self.trait_offsets[ranged]
+        positions[:, idx] = np.clip(positions[:, idx], self.lower[ranged], self.upper[ranged])
+        positions[:, self._integer_idx] = np.rint(positions[:, self._integer_idx])
+        for trait in np.flatnonzero(self.ordinal):  # Ordinal traits with explicitly given values
+            values = np.asarray(self.limits[self.keys[trait]], dtype=np.float64)
+            offset = self.trait_offsets[trait]
+            positions[:, offset] = values[np.abs(positions[:, offset, None] - values).argmin(axis=1)]
+        for trait in self._categorical_traits:
+            offset = self.trait_offsets[trait]
+            segment = positions[:, offset : offset + self.widths[trait]]
+            category = segment.argmax(axis=1)
+            segment[:] = 0.0
+            segment[np.arange(len(positions)), category] = 1.0
+        return positions
+
 
 class Individual:
     """An individual represents a candidate solution to the considered optimization problem."""
@@ -67,9 +449,26 @@ class Individual:
             for key in position:
                 self[key] = position[key]
 
+        self._encoding: Optional[Encoding] = None  # Computed on first access, see ``encoding``.
+        self._init_attributes(velocity, generation, rank)
+
+    def _init_attributes(self, velocity: Optional[np.ndarray], generation: int, rank: int) -> None:
+        """
+        Initialize the bookkeeping attributes of a new, unevaluated individual.
+
+        Parameters
+        ----------
+        velocity : np.ndarray, optional
+            The velocity for PSO-type propagators.
+        generation : int
+            The current generation (-1 if unset).
+        rank : int
+            The rank (-1 if unset).
+        """
         self.generation = generation  # Equals each worker's iteration for continuous population in Propulate.
         self.rank = rank  # island rank
         self.loss: float = float("inf")
+        self.losses: Optional[np.ndarray] = None  # All objectives of multi-objective losses, the first equals ``loss``.
         self.active = True
         self.island = -1  # island of origin
         self.current = -1  # current responsible worker
@@ -77,6 +476,7 @@ class Individual:
         self.migration_history: str = ""  # migration history
         self.evaltime = float("inf")  # evaluation time
         self.evalperiod = 0.0  # evaluation duration
+        self.operator = -1  # index of the operator of a ``Portfolio`` propagator that bred the individual
 
         # NOTE needed for PSO type propagators
         self.velocity = velocity
@@ -85,6 +485,82 @@ class Individual:
                 print(self.position.shape, self.velocity.shape)
                 raise ValueError("Position and velocity shape do not match.")
 
+    @property
+    def encoding(self) -> Encoding:
+        """The vector encoding of the individual's search space, computed on first access and shared with offspring."""
+        encoding = self.__dict__.get("_encoding")
+        if encoding is None or encoding.limits is not self.limits:
+            encoding = self._encoding = Encoding(self.limits)
+        return encoding
+
+    def spawn(self, position: np.ndarray) -> "Individual":
+        """
+        Create a new, unevaluated individual at the given position in the same search space.
+
+        Unlike constructing a new ``Individual``, this neither re-derives the search space encoding nor encodes the
+        traits one at a time, which makes breeding cheap for high-dimensional individuals. Underscore-prefixed entries
+        of the mapping, e.g., artifact paths, are not inherited.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The new individual's position. Used as is, i.e., not copied.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The new individual.
+
+        Raises
+        ------
+        ValueError
+            If the position is not compatible with the search space.
+        """
+        return self.__class__.from_encoding(position, self.encoding)
+
+    @classmethod
+    def from_encoding(cls, position: np.ndarray, encoding: Encoding) -> "Individual":
+        """
+        Create a new, unevaluated individual from a position and a precomputed search space encoding.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The new individual's position. Used as is, i.e., not copied.
+        encoding : propulate.population.Encoding
+            The encoding of the search space, which is shared with the new individual.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The new individual.
+
+        Raises
+        ------
+        ValueError
+            If the position is not compatible with the search space.
+        """
+        if position.shape != (encoding.size,):
+            raise ValueError("Individual position not compatible with given search space limits.")
+        ind = cls.__new__(cls)
+        ind.limits, ind.types, ind.offsets, ind._encoding = encoding.limits, encoding.types, encoding.offsets, encoding
+        ind.position = position
+        ind.mapping = encoding.decode(position)
+        ind._init_attributes(None, -1, -1)
+        return ind
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state for pickling, without the encoding, which is recomputed on demand."""
+        state = self.__dict__.copy()
+        state.pop("_encoding", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state from pickling, defaulting attributes missing in individuals pickled by older versions."""
+        self.__dict__.update(state)
+        self.__dict__.setdefault("losses", None)
+        self.__dict__.setdefault("operator", -1)
+
     def __getitem__(self, key: str) -> Union[float, int, str]:
         """Return decoded value for input key."""
         if key.startswith("_"):
@@ -92,6 +568,9 @@ class Individual:
         else:
             # continuous variable
             if self.types[key] is float:
+                limit = self.limits[key]
+                if isinstance(limit, Transformed):
+                    return float(limit.decode(self.position[self.offsets[key]]))
                 return float(self.position[self.offsets[key]].item())
             elif self.types[key] is int:
                 return int(np.rint(self.position[self.offsets[key]]).item())
@@ -112,6 +591,9 @@ class Individual:
                 raise ValueError("Unknown gene.")
             if self.types[key] is float:
                 assert isinstance(newvalue, float)
+                limit = self.limits[key]
+                if isinstance(limit, Transformed):
+                    newvalue = float(limit.transform.forward(np.float64(newvalue)))
                 self.position[self.offsets[key]] = newvalue
             elif self.types[key] is int:
                 assert isinstance(newvalue, int)
@@ -119,8 +601,8 @@ class Individual:
             elif self.types[key] is str:
                 assert newvalue in self.limits[key]
                 offset = self.offsets[key]
-                upper = len(self.limits[key])
-                self.position[offset:upper] = np.array([0])
+                upper = offset + len(self.limits[key])
+                self.position[offset:upper] = 0.0
                 self.position[offset + self.limits[key].index(newvalue)] = 1.0
             else:
                 raise ValueError("Unknown type")
@@ -168,6 +650,8 @@ class Individual:
         }
         if self.loss is None:
             loss_str = f"{self.loss}"
+        elif self.losses is not None:
+            loss_str = "(" + ", ".join(f"{Decimal(float(loss)):.2E}" for loss in self.losses) + ")"
         else:
             loss_str = f"{Decimal(float(self.loss)):.2E}"
         return f"[{rep}, loss " + loss_str + f", island {self.island}, worker {self.rank}, " f"generation {self.generation}]"
@@ -3,6 +3,7 @@
 from .base import (
     Compose,
     Conditional,
+    InitQuasiRandom,
     InitUniform,
     Propagator,
     SelectMax,
@@ -10,6 +11,7 @@ from .base import (
     SelectUniform,
     Stochastic,
 )
+from .bo import BayesianOptimization
 from .cmaes import (
     ActiveCMA,
     BasicCMA,
@@ -17,6 +19,7 @@ from .cmaes import (
     CMAParameter,
     CMAPropagator,
 )
+from .de import DifferentialEvolution
 from .ga import (
     CrossoverMultiple,
     CrossoverSigmoid,
@@ -26,6 +29,14 @@ from .ga import (
     RandomPointMutation,
 )
 from .nm import ParallelNelderMead
+from .pareto import (
+    SelectPareto,
+    crowding_distance,
+    hypervolume,
+    hypervolume_contributions,
+    non_dominated_sort,
+)
+from .portfolio import Portfolio
 from .pso import (
     BasicPSO,
     CanonicalPSO,
@@ -33,6 +44,8 @@ from .pso import (
     StatelessPSO,
     VelocityClampingPSO,
 )
+from .tabu import Tabu
+from .tpe import TreeParzenEstimator
 
 __all__ = [
     "Propagator",
@@ -42,7 +55,9 @@ __all__ = [
     "SelectMin",
     "SelectMax",
     "SelectUniform",
+    "SelectPareto",
     "InitUniform",
+    "InitQuasiRandom",
     "PointMutation",
     "RandomPointMutation",
     "IntervalMutationNormal",
@@ -60,4 +75,13 @@ __all__ = [
     "BasicCMA",
     "ActiveCMA",
     "ParallelNelderMead",
+    "DifferentialEvolution",
+    "BayesianOptimization",
+    "TreeParzenEstimator",
+    "Portfolio",
+    "Tabu",
+    "non_dominated_sort",
+    "crowding_distance",
+    "hypervolume",
+    "hypervolume_contributions",
 ]
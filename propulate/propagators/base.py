@@ -1,9 +1,11 @@
 import random
-from typing import Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
+import warnings
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from scipy.stats import qmc
 
-from ..population import Individual
+from ..population import Encoding, Individual
 
 
 def _check_compatible(out1: int, in2: int) -> bool:
@@ -25,6 +27,138 @@ def _check_compatible(out1: int, in2: int) -> bool:
     return out1 == in2 or in2 == -1
 
 
+def _get_rng_state(rng: Union[random.Random, np.random.Generator]) -> Any:
+    """
+    Get the state of a random number generator.
+
+    Parameters
+    ----------
+    rng : random.Random | numpy.random.Generator
+        The random number generator.
+
+    Returns
+    -------
+    Any
+        The random number generator's state.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng.bit_generator.state
+    return rng.getstate()
+
+
+def _set_rng_state(rng: Union[random.Random, np.random.Generator], state: Any) -> None:
+    """
+    Set the state of a random number generator.
+
+    Parameters
+    ----------
+    rng : random.Random | numpy.random.Generator
+        The random number generator.
+    state : Any
+        The state as returned by ``_get_rng_state()``.
+    """
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = state
+    else:
+        rng.setstate(state)
+
+
+def _numpy_rng(rng: random.Random) -> np.random.Generator:
+    """
+    Derive a NumPy random number generator for drawing whole arrays at once from the propagator's generator.
+
+    The NumPy generator is seeded from the propagator's generator on every application, so that the latter's state,
+    which is checkpointed, still determines all draws.
+
+    Parameters
+    ----------
+    rng : random.Random
+        The propagator's random number generator.
+
+    Returns
+    -------
+    numpy.random.Generator
+        The NumPy random number generator.
+    """
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+class _PendingProposals:
+    """
+    Bookkeeping of the individuals a propagator proposed on this worker, by position, until they show up evaluated.
+
+    Proposals may never show up evaluated, e.g., if bred outside an optimization run or bred by a wrapping propagator
+    which then discards them. To bound memory, only the most recent proposals are kept via ``trim()``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty bookkeeping."""
+        self._entries: Dict[bytes, Any] = {}  # Insertion-ordered, i.e., oldest proposal first
+
+    def __len__(self) -> int:
+        """Return the number of pending proposals."""
+        return len(self._entries)
+
+    def __contains__(self, position: np.ndarray) -> bool:
+        """Check whether the proposal at the given position is pending."""
+        return position.tobytes() in self._entries
+
+    def add(self, position: np.ndarray, value: Any) -> None:
+        """
+        Record a proposal.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The proposed individual's position.
+        value : Any
+            The data to remember about the proposal.
+        """
+        self._entries[position.tobytes()] = value
+
+    def pop(self, position: np.ndarray, default: Any = None) -> Any:
+        """
+        Remove a proposal once it has been evaluated.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The evaluated individual's position.
+        default : Any, optional
+            The value to return if no proposal is pending at the position. Default is None.
+
+        Returns
+        -------
+        Any
+            The data remembered about the proposal, or ``default``.
+        """
+        return self._entries.pop(position.tobytes(), default)
+
+    def values(self) -> List[Any]:
+        """Return the data remembered about the pending proposals, oldest first."""
+        return list(self._entries.values())
+
+    def trim(self, capacity: int) -> None:
+        """
+        Forget the oldest proposals beyond the given number.
+
+        Parameters
+        ----------
+        capacity : int
+            The maximum number of pending proposals to keep.
+        """
+        for key in list(self._entries)[: max(len(self._entries) - capacity, 0)]:
+            del self._entries[key]
+
+    def state_dict(self) -> Dict[bytes, Any]:
+        """Get the pending proposals for checkpointing."""
+        return dict(self._entries)
+
+    def load_state_dict(self, state: Dict[bytes, Any]) -> None:
+        """Restore the pending proposals from a checkpoint."""
+        self._entries = dict(state)
+
+
 class Propagator:
     """
     Abstract base class for all propagators, i.e., evolutionary operators.
@@ -44,6 +178,16 @@ class Propagator:
     -------
     __call__()
         Apply the propagator.
+    apply_batch()
+        Apply the propagator to each of a batch of inputs.
+    breed_batch()
+        Apply the propagator several times to the same input individuals.
+    set_pending()
+        Pass the individuals currently evaluated by other workers to all propagators accounting for them.
+    state_dict()
+        Get the propagator's internal state for checkpointing.
+    load_state_dict()
+        Restore the propagator's internal state from a checkpoint.
     """
 
     def __init__(self, parents: int = 0, offspring: int = 0, rng: Optional[random.Random] = None) -> None:
@@ -95,6 +239,143 @@ class Propagator:
         """
         raise NotImplementedError()
 
+    def apply_batch(self, batch: Sequence[Union[List[Individual], Individual]]) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the propagator to each of a batch of inputs.
+
+        The base implementation calls the propagator once per input. Propagators that can process a whole batch at once,
+        e.g., by vectorizing over the individuals' positions, override it.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual] | propulate.population.Individual]
+            The inputs, each as it would be passed to ``__call__()``.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            The output of the propagator for each input.
+        """
+        return [self(inds) for inds in batch]  # type: ignore[arg-type]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the propagator ``k`` times to the same input individuals, e.g., to breed ``k`` offspring at once.
+
+        The base implementation applies the propagator to a batch of ``k`` copies of the input. Propagators whose output
+        does not depend on chance, e.g., elitist selection, override it to do their work only once.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The input individuals the propagator is applied to.
+        k : int
+            The number of times to apply the propagator.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            The output of each application.
+        """
+        return self.apply_batch([inds] * k)
+
+    def _nested(self) -> List["Propagator"]:
+        """
+        Get the propagators nested in this one, e.g., the stages of a ``Compose``.
+
+        Returns
+        -------
+        List[propulate.propagators.Propagator]
+            The propagators stored in the attributes of this propagator, directly or in lists.
+        """
+        nested: List[Propagator] = []
+        for value in vars(self).values():
+            if isinstance(value, Propagator):
+                nested.append(value)
+            elif isinstance(value, list) and len(value) > 0 and all(isinstance(item, Propagator) for item in value):
+                nested.extend(value)
+        return nested
+
+    def set_pending(self, pending: List[Individual]) -> bool:
+        """
+        Pass the individuals currently evaluated by other workers to all propagators accounting for them.
+
+        Propagators accounting for pending individuals, e.g., ``BayesianOptimization``, hold them in their ``pending``
+        attribute. The individuals are passed on to all nested propagators, e.g., the arms of a ``Portfolio``.
+
+        Parameters
+        ----------
+        pending : List[propulate.population.Individual]
+            The individuals bred but not yet evaluated by other workers of the island.
+
+        Returns
+        -------
+        bool
+            True if this propagator or any nested one accounts for pending individuals, False if not.
+        """
+        accounts = hasattr(self, "pending")
+        if accounts:
+            self.pending = pending  # type: ignore[attr-defined]
+        for nested in self._nested():
+            accounts = nested.set_pending(pending) or accounts
+        return accounts
+
+    def set_worker(self, rank: int, size: int) -> None:
+        """
+        Pass the worker's index among all breeding workers to all propagators partitioning work across them.
+
+        The base implementation passes it on to all nested propagators, e.g., to the initialization of a
+        ``Conditional``. Propagators partitioning work across the workers, e.g., ``InitQuasiRandom``, override it.
+
+        Parameters
+        ----------
+        rank : int
+            The worker's rank in the Propulate communicator of all breeding workers, i.e., of each worker's leading rank.
+        size : int
+            The number of breeding workers.
+        """
+        for nested in self._nested():
+            nested.set_worker(rank, size)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the propagator's internal state for checkpointing.
+
+        The base implementation contains the state of the random number generator and the states of all nested
+        propagators, e.g., of a ``Compose``. Propagators with additional internal state extend it.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The propagator's state. Must be picklable.
+        """
+        state: Dict[str, Any] = {"rng": _get_rng_state(self.rng)}
+        for name, value in vars(self).items():
+            if isinstance(value, Propagator):
+                state[name] = value.state_dict()
+            elif isinstance(value, list) and len(value) > 0 and all(isinstance(item, Propagator) for item in value):
+                state[name] = [item.state_dict() for item in value]
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the propagator's internal state from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        _set_rng_state(self.rng, state["rng"])
+        for name, value in vars(self).items():
+            if name not in state:
+                continue
+            if isinstance(value, Propagator):
+                value.load_state_dict(state[name])
+            elif isinstance(value, list) and all(isinstance(item, Propagator) for item in value):
+                for item, item_state in zip(value, state[name]):
+                    item.load_state_dict(item_state)
+
 
 class Stochastic(Propagator):
     """
@@ -221,6 +502,46 @@ class Conditional(Propagator):
         else:  # Else apply `false_prop`.
             return self.false_prop(inds)
 
+    def apply_batch(self, batch: Sequence[Union[List[Individual], Individual]]) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the conditional propagator to each of a batch of inputs, passing each branch its inputs as one batch.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual]]
+            The inputs.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            The output for each input.
+        """
+        large = [len(inds) >= self.pop_size for inds in batch]  # type: ignore[arg-type]
+        true_out = iter(self.true_prop.apply_batch([inds for inds, is_large in zip(batch, large) if is_large]))
+        false_out = iter(self.false_prop.apply_batch([inds for inds, is_large in zip(batch, large) if not is_large]))
+        return [next(true_out) if is_large else next(false_out) for is_large in large]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the conditional propagator ``k`` times to the same input individuals.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The input individuals.
+        k : int
+            The number of times to apply the propagator.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            The output of each application.
+        """
+        if len(inds) >= self.pop_size:
+            return self.true_prop.breed_batch(inds, k)
+        else:
+            return self.false_prop.breed_batch(inds, k)
+
 
 class Compose(Propagator):
     """
@@ -288,6 +609,49 @@ class Compose(Propagator):
             inds = p(inds)  # type: ignore
         return inds
 
+    def apply_batch(self, batch: Sequence[Union[List[Individual], Individual]]) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the composed propagator to each of a batch of inputs, passing the whole batch from stage to stage.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual] | propulate.population.Individual]
+            The inputs.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            The output for each input.
+        """
+        outputs = list(batch)
+        for p in self.propagators:
+            outputs = p.apply_batch(outputs)
+        return outputs
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the composed propagator ``k`` times to the same input individuals.
+
+        The first propagator, typically a selection, is applied to the input only once if it does not depend on chance;
+        all following propagators process the ``k`` intermediate results as one batch.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The input individuals.
+        k : int
+            The number of times to apply the propagator.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            The output of each application.
+        """
+        outputs = self.propagators[0].breed_batch(inds, k)
+        for p in self.propagators[1:]:
+            outputs = p.apply_batch(outputs)
+        return outputs
+
 
 class SelectMin(Propagator):
     """
@@ -342,6 +706,25 @@ class SelectMin(Propagator):
             : self.offspring
         ]  # Return `self.offspring` best individuals in terms of loss.
 
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Select the best individuals ``k`` times, sorting the input only once.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The input individuals.
+        k : int
+            The number of times to select.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual]]
+            The selected individuals, once per application.
+        """
+        selected = self(inds)
+        return [list(selected) for _ in range(k)]
+
 
 class SelectMax(Propagator):
     """
@@ -396,6 +779,25 @@ class SelectMax(Propagator):
             : self.offspring
         ]  # Return the `self.offspring` worst individuals in terms of loss.
 
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Select the worst individuals ``k`` times, sorting the input only once.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The input individuals.
+        k : int
+            The number of times to select.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual]]
+            The selected individuals, once per application.
+        """
+        selected = self(inds)
+        return [list(selected) for _ in range(k)]
+
 
 class SelectUniform(Propagator):
     """
@@ -453,8 +855,12 @@ class InitUniform(Stochastic):
     """
     Initialize an individual by uniformly sampling the specified limits for each trait.
 
+    Batches of individuals are sampled at once as arrays of positions, see ``apply_batch()``.
+
     Attributes
     ----------
+    encoding : propulate.population.Encoding
+        The vector encoding of the search space.
     limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
         The search space, i.e., the limits of (hyper-)parameters to be optimized.
 
@@ -487,9 +893,17 @@ class InitUniform(Stochastic):
             The probability of application. Default is 1.0.
         rng : random.Random, optional
             The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If a parameter's type is invalid, i.e., not float (continuous), int (ordinal), or str (categorical).
         """
         super().__init__(parents, 1, probability, rng)
         self.limits = limits
+        if any(not isinstance(limits[key][0], (float, int, str)) for key in limits):
+            raise ValueError("Unknown type of limits. Has to be float for interval, int for ordinal, or string for categorical.")
+        self.encoding = Encoding(limits)
 
     def __call__(self, *inds: Individual) -> Individual:  # type: ignore[override]
         """
@@ -504,32 +918,255 @@ class InitUniform(Stochastic):
         -------
         propulate.population.Individual
             The output individual after application of the propagator.
+        """
+        if self.rng.random() < self.probability:  # Apply only with specified probability.
+            return self._sample(1)[0]  # Instantiate new individual.
+        else:  # Return first input individual w/o changes otherwise.
+            return inds[0]
+
+    def apply_batch(self, batch: Sequence[Union[List[Individual], Individual]]) -> List[Union[List[Individual], Individual]]:
+        """
+        Apply the uniform-initialization propagator to each of a batch of inputs, sampling all new individuals at once.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual] | propulate.population.Individual]
+            The inputs the propagator is applied to.
+
+        Returns
+        -------
+        List[List[propulate.population.Individual] | propulate.population.Individual]
+            A new individual for each input the propagator is applied to, the unchanged input otherwise.
+        """
+        applied = [self.rng.random() < self.probability for _ in batch]
+        new = iter(self._sample(sum(applied)))
+        return [next(new) if is_applied else inds for inds, is_applied in zip(batch, applied)]
+
+    def _sample_unit(self, n: int) -> np.ndarray:
+        """
+        Sample points in the unit hypercube with one dimension per trait, uniformly at random.
+
+        Parameters
+        ----------
+        n : int
+            The number of points.
+
+        Returns
+        -------
+        np.ndarray
+            The points, one row per point.
+        """
+        return _numpy_rng(self.rng).random((n, len(self.encoding.keys)))
+
+    def _sample(self, n: int) -> List[Individual]:
+        """
+        Sample new individuals.
+
+        Parameters
+        ----------
+        n : int
+            The number of individuals.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The new individuals.
+        """
+        if n == 0:
+            return []
+        positions = self.encoding.from_unit(self._sample_unit(n))
+        return [Individual.from_encoding(position, self.encoding) for position in positions]
+
+
+class InitQuasiRandom(InitUniform):
+    """
+    Initialize individuals from a scrambled quasi-random design, partitioned across all workers.
+
+    All workers share one global low-discrepancy sequence (Sobol or Halton) or series of Latin hypercube designs, which
+    is determined by ``seed``. Worker ``rank`` of ``size`` workers takes the points ``rank``, ``rank + size``,
+    ``rank + 2 * size``, and so on. The points that all workers draw concurrently at the start of a run thus form a
+    contiguous, evenly spread part of the global design, covering the search space better than independent uniform
+    draws.
+
+    Attributes
+    ----------
+    design : str
+        The quasi-random design, i.e., "sobol", "halton", or "lhs".
+    index : int
+        The number of points this worker has drawn so far.
+    points_per_worker : int
+        The number of points per worker in each Latin hypercube design.
+    rank : int
+        The worker's index among all workers sharing the design, i.e., its rank in the Propulate communicator.
+    seed : int
+        The seed of the scrambling, which has to be the same on all workers.
+    size : int
+        The number of workers sharing the design.
+
+    Methods
+    -------
+    set_worker()
+        Set the worker's index among all workers sharing the design.
+    state_dict()
+        Get the propagator's internal state for checkpointing.
+    load_state_dict()
+        Restore the propagator's internal state from a checkpoint.
+
+    Notes
+    -----
+    The ``InitQuasiRandom`` class inherits all methods and attributes from the ``InitUniform`` class.
+
+    The ``Propulator`` sets ``rank`` and ``size`` from its Propulate communicator, which contains the leading rank of
+    each (multi-rank) worker across all islands, so that all breeding workers share the design.
+
+    See Also
+    --------
+    :class:`InitUniform` : The parent class.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]],
+        design: str = "sobol",
+        rank: int = 0,
+        size: int = 1,
+        seed: int = 0,
+        points_per_worker: int = 16,
+        parents: int = 0,
+        probability: float = 1.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a quasi-random-initialization propagator.
+
+        Parameters
+        ----------
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The search space, i.e., the limits of (hyper-)parameters to be optimized.
+        design : str, optional
+            The quasi-random design, i.e., "sobol" for a scrambled Sobol sequence, "halton" for a scrambled Halton
+            sequence, or "lhs" for a series of Latin hypercube designs. Default is "sobol".
+        rank : int, optional
+            The worker's index among all workers sharing the design. Default is 0. Set by the ``Propulator`` to the
+            worker's rank in the Propulate communicator of all breeding workers.
+        size : int, optional
+            The number of workers sharing the design. Default is 1. Set by the ``Propulator`` to the size of the
+            Propulate communicator.
+        seed : int, optional
+            The seed of the scrambling, which has to be the same on all workers. Default is 0.
+        points_per_worker : int, optional
+            The number of points per worker in each Latin hypercube design. Default is 16.
+        parents : int, optional
+            The number of parents. Default is 0.
+        probability : float, optional
+            The probability of application. Default is 1.0.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization, only used to decide on application.
 
         Raises
         ------
         ValueError
-            If a parameter's type is invalid, i.e., not float (continuous), int (ordinal), or str (categorical).
+            If the design is unknown, the rank is not within the number of workers, or a parameter's type is invalid.
         """
-        position: MutableMapping[str, Union[int, float, str]] = {}
-        if self.rng.random() < self.probability:  # Apply only with specified probability.
-            for limit in self.limits:  # Randomly sample from specified limits for each trait.
-                if isinstance(self.limits[limit][0], int):  # If ordinal trait of type integer.
-                    if len(self.limits[limit]) == 2:  # Selecting one value in range of ordinal parameter
-                        position[limit] = self.rng.randint(*self.limits[limit])
-                    else:  # Selecting one distinct value from ordinal parameters
-                        position[limit] = self.rng.choice(self.limits[limit])  # type: ignore
-                elif isinstance(self.limits[limit][0], float):  # If interval trait of type float.
-                    position[limit] = self.rng.uniform(*self.limits[limit])
-                elif isinstance(self.limits[limit][0], str):  # If categorical trait of type string.
-                    position[limit] = str(self.rng.choice(self.limits[limit]))
-                else:
-                    raise ValueError(
-                        "Unknown type of limits. Has to be float for interval, " "int for ordinal, or string for categorical."
-                    )
-            ind = Individual(position, self.limits)  # Instantiate new individual.
-        else:  # Return first input individual w/o changes otherwise.
-            ind = inds[0]
-        return ind
+        super().__init__(limits, parents, probability, rng)
+        if design not in ("sobol", "halton", "lhs"):
+            raise ValueError(f"Unknown quasi-random design {design}. Has to be 'sobol', 'halton', or 'lhs'.")
+        if not 0 <= rank < size:
+            raise ValueError(f"Rank {rank} not within the number of workers {size}.")
+        self.design = design
+        self.rank = rank
+        self.size = size
+        self.seed = seed
+        self.points_per_worker = points_per_worker
+        self.index = 0
+        self._sampler: Optional[qmc.QMCEngine] = None  # Sobol or Halton sequence, created on first use
+
+    def set_worker(self, rank: int, size: int) -> None:
+        """
+        Set the worker's index among all workers sharing the design.
+
+        Parameters
+        ----------
+        rank : int
+            The worker's rank in the Propulate communicator of all breeding workers.
+        size : int
+            The number of breeding workers.
+
+        Raises
+        ------
+        ValueError
+            If the rank is not within the number of workers.
+        """
+        if not 0 <= rank < size:
+            raise ValueError(f"Rank {rank} not within the number of workers {size}.")
+        self.rank = rank
+        self.size = size
+        super().set_worker(rank, size)
+
+    def _sample_unit(self, n: int) -> np.ndarray:
+        """
+        Draw this worker's next points of the global design.
+
+        Parameters
+        ----------
+        n : int
+            The number of points.
+
+        Returns
+        -------
+        np.ndarray
+            The points, one row per point.
+        """
+        # Global indices of this worker's next points.
+        global_idx = (self.index + np.arange(n)) * self.size + self.rank
+        self.index += n
+        dim = len(self.encoding.keys)
+        if self.design == "lhs":
+            design_size = self.points_per_worker * self.size
+            points = np.empty((n, dim))
+            for design_idx in np.unique(global_idx // design_size):
+                in_design = global_idx // design_size == design_idx
+                lhs = qmc.LatinHypercube(dim, seed=np.random.default_rng([self.seed, int(design_idx)]))
+                points[in_design] = lhs.random(design_size)[global_idx[in_design] % design_size]
+            return points
+        if self._sampler is None:
+            if self.design == "sobol":
+                self._sampler = qmc.Sobol(dim, seed=self.seed)
+            else:
+                self._sampler = qmc.Halton(dim, seed=self.seed)
+        start = int(global_idx[0]) - self.rank
+        if self._sampler.num_generated > start:
+            self._sampler.reset()
+        if start > self._sampler.num_generated:
+            self._sampler.fast_forward(start - self._sampler.num_generated)
+        with warnings.catch_warnings():  # Only whole designs of 2^m points are balanced, which is fine here.
+            warnings.filterwarnings("ignore", message="The balance properties of Sobol")
+            return self._sampler.random(n * self.size)[self.rank :: self.size]
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the propagator's internal state for checkpointing.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The state, i.e., the state of the random number generator and the number of points drawn so far.
+        """
+        state = super().state_dict()
+        state["index"] = self.index
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the propagator's internal state from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        super().load_state_dict(state)
+        self.index = state["index"]
 
 
 class Gaussian(Propagator):
@@ -0,0 +1,583 @@
+import copy
+import random
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from scipy.linalg import LinAlgError, cho_solve, cholesky, solve_triangular
+from scipy.spatial.distance import cdist
+from scipy.special import log_ndtr, ndtr
+
+from ..population import Encoding, Individual
+from .base import InitUniform, Propagator, _numpy_rng, _PendingProposals
+
+ACQUISITIONS = ("ei", "lcb")
+PENDING_STRATEGIES = ("constant_liar", "local_penalization")
+LIARS = ("min", "mean", "max")
+
+
+class GaussianProcess:
+    """
+    Gaussian process regression model with a Matérn 5/2 kernel whose Cholesky factor is updated incrementally.
+
+    The targets are standardized internally, i.e., the kernel has unit variance for standardized targets.
+
+    Attributes
+    ----------
+    chol : np.ndarray
+        The lower Cholesky factor of the kernel matrix of the training inputs, including the noise.
+    length_scale : float
+        The kernel's length scale.
+    noise : float
+        The noise variance of standardized targets, which also stabilizes the Cholesky decomposition.
+    x : np.ndarray
+        The training inputs, one row per point.
+    y : np.ndarray
+        The training targets.
+
+    Methods
+    -------
+    fit()
+        Fit the model from scratch.
+    update()
+        Add training points, updating the Cholesky factor in :math:`O(n^2)` per point.
+    predict()
+        Predict the posterior mean and standard deviation.
+    mean_gradient()
+        Compute the gradient of the posterior mean.
+    log_marginal_likelihood()
+        Compute the log marginal likelihood of the training targets.
+    """
+
+    def __init__(self, length_scale: float = 0.2, noise: float = 1e-6) -> None:
+        """
+        Initialize an empty Gaussian process model.
+
+        Parameters
+        ----------
+        length_scale : float, optional
+            The kernel's length scale. Default is 0.2.
+        noise : float, optional
+            The noise variance of standardized targets. Default is 1e-6.
+        """
+        self.length_scale = length_scale
+        self.noise = noise
+        self.x = np.zeros((0, 0))
+        self.y = np.zeros(0)
+        self.chol = np.zeros((0, 0))
+        self._alpha = np.zeros(0)
+        self._mean, self._std = 0.0, 1.0
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the Matérn 5/2 kernel between two sets of points.
+
+        Parameters
+        ----------
+        a : np.ndarray
+            The first set of points, one row per point.
+        b : np.ndarray
+            The second set of points, one row per point.
+
+        Returns
+        -------
+        np.ndarray
+            The kernel matrix.
+        """
+        r = np.sqrt(5.0) * cdist(a, b) / self.length_scale
+        return (1.0 + r + r**2 / 3.0) * np.exp(-r)
+
+    def _solve(self) -> None:
+        """Standardize the targets and solve for the weights of the posterior mean."""
+        self._mean = float(self.y.mean())
+        self._std = float(self.y.std()) or 1.0
+        self._alpha = cho_solve((self.chol, True), (self.y - self._mean) / self._std)
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fit the model from scratch, i.e., compute the full Cholesky factor in :math:`O(n^3)`.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The training inputs, one row per point.
+        y : np.ndarray
+            The training targets.
+        """
+        self.x, self.y = x.copy(), y.copy()
+        self.chol = cholesky(self._kernel(x, x) + self.noise * np.eye(len(x)), lower=True)
+        self._solve()
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Add training points, extending the Cholesky factor by the new rows only.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The new training inputs, one row per point.
+        y : np.ndarray
+            The new training targets.
+        """
+        if len(self.x) == 0:
+            self.fit(x, y)
+            return
+        cross = solve_triangular(self.chol, self._kernel(self.x, x), lower=True)
+        try:
+            corner = cholesky(self._kernel(x, x) + self.noise * np.eye(len(x)) - cross.T @ cross, lower=True)
+        except LinAlgError:  # Numerically not positive definite, e.g., for (almost) duplicate points
+            self.fit(np.vstack([self.x, x]), np.concatenate([self.y, y]))
+            return
+        self.chol = np.block([[self.chol, np.zeros((len(self.x), len(x)))], [cross.T, corner]])
+        self.x, self.y = np.vstack([self.x, x]), np.concatenate([self.y, y])
+        self._solve()
+
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict the posterior mean and standard deviation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The inputs, one row per point.
+
+        Returns
+        -------
+        np.ndarray
+            The posterior mean.
+        np.ndarray
+            The posterior standard deviation.
+        """
+        cross = self._kernel(x, self.x)
+        v = solve_triangular(self.chol, cross.T, lower=True)
+        var = np.maximum(1.0 - np.sum(v**2, axis=0), 1e-12)
+        return self._mean + self._std * (cross @ self._alpha), self._std * np.sqrt(var)
+
+    def mean_gradient(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the gradient of the posterior mean with respect to the inputs.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The inputs, one row per point.
+
+        Returns
+        -------
+        np.ndarray
+            The gradients, one row per point.
+        """
+        r = np.sqrt(5.0) * cdist(x, self.x) / self.length_scale
+        weights = -5.0 / (3.0 * self.length_scale**2) * (1.0 + r) * np.exp(-r) * self._alpha
+        return self._std * (weights.sum(axis=1)[:, None] * x - weights @ self.x)
+
+    def log_marginal_likelihood(self) -> float:
+        """
+        Compute the log marginal likelihood of the standardized training targets.
+
+        Returns
+        -------
+        float
+            The log marginal likelihood.
+        """
+        y = (self.y - self._mean) / self._std
+        return float(-0.5 * y @ self._alpha - np.log(np.diag(self.chol)).sum() - 0.5 * len(y) * np.log(2 * np.pi))
+
+
+class BayesianOptimization(Propagator):
+    """
+    Bayesian optimization (BO) propagator proposing individuals by maximizing an acquisition function.
+
+    A Gaussian process (GP) is fitted to the evaluated individuals, whose positions are scaled to the unit hypercube. As
+    individuals arrive, the GP's Cholesky factor is extended by their rows only. It is recomputed from scratch if
+    individuals are removed from the population or, if the length scale is chosen automatically by maximizing the
+    marginal likelihood, whenever the number of individuals has doubled since.
+
+    The acquisition function, i.e., expected improvement or lower confidence bound, is maximized by a vectorized
+    multi-start local search: the best of many uniformly sampled candidates are improved by Gaussian perturbations
+    with adaptive step sizes, all at once.
+
+    Individuals that have been proposed but not yet evaluated, either by this worker or, as set by the ``Propulator``
+    in ``pending``, by other workers of its island, are accounted for to avoid proposing the same point twice. With the
+    constant liar strategy, they are added to the GP with a fictitious loss. With local penalization, the acquisition
+    function is penalized around them, see J. González et al., "Batch Bayesian Optimization via Local Penalization"
+    https://proceedings.mlr.press/v51/gonzalez16a.html.
+
+    Attributes
+    ----------
+    acquisition : str
+        The acquisition function, i.e., "ei" for expected improvement or "lcb" for lower confidence bound.
+    encoding : propulate.population.Encoding
+        The vector encoding of the search space.
+    gp : propulate.propagators.bo.GaussianProcess
+        The Gaussian process model.
+    init : propulate.propagators.Propagator
+        The propagator initializing individuals until ``initial_points`` individuals have been evaluated.
+    initial_points : int
+        The number of evaluated individuals to collect before fitting the GP.
+    kappa : float
+        The exploration weight of the lower confidence bound.
+    liar : str
+        The fictitious loss of pending individuals with the constant liar strategy, i.e., "min", "mean", or "max" of
+        the observed losses.
+    limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space, i.e., the limits of (hyper-)parameters to be optimized.
+    max_pending : int
+        The maximum number of this worker's proposals accounted for as pending until they are evaluated.
+    num_candidates : int
+        The number of uniformly sampled candidates to choose the starting points of the local search from.
+    num_starts : int
+        The number of starting points of the local search.
+    num_steps : int
+        The number of steps of the local search.
+    pending : List[propulate.population.Individual]
+        The individuals currently evaluated by other workers, set by the ``Propulator`` before each breeding.
+    pending_strategy : str
+        How to account for pending individuals, i.e., "constant_liar" or "local_penalization".
+    xi : float
+        The minimum improvement required by expected improvement.
+
+    Methods
+    -------
+    __call__()
+        Propose an individual.
+    breed_batch()
+        Propose several individuals at once, each accounting for the previous ones as pending.
+    state_dict()
+        Get the propagator's internal state for checkpointing, including the pending proposals.
+    load_state_dict()
+        Restore the propagator's internal state from a checkpoint.
+
+    Notes
+    -----
+    The ``BayesianOptimization`` class inherits all methods and attributes from the ``Propagator`` class.
+
+    See Also
+    --------
+    :class:`Propagator` : The parent class.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]],
+        acquisition: str = "ei",
+        pending_strategy: str = "constant_liar",
+        liar: str = "min",
+        initial_points: int = 10,
+        length_scale: Optional[float] = None,
+        noise: float = 1e-6,
+        kappa: float = 2.0,
+        xi: float = 0.0,
+        num_candidates: int = 1024,
+        num_starts: int = 8,
+        num_steps: int = 20,
+        max_pending: Optional[int] = None,
+        init: Optional[Propagator] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a Bayesian optimization propagator.
+
+        Parameters
+        ----------
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The search space, i.e., the limits of (hyper-)parameters to be optimized.
+        acquisition : str, optional
+            The acquisition function, i.e., "ei" for expected improvement or "lcb" for lower confidence bound. Default is
+            "ei".
+        pending_strategy : str, optional
+            How to account for pending individuals, i.e., "constant_liar" or "local_penalization". Default is
+            "constant_liar".
+        liar : str, optional
+            The fictitious loss of pending individuals with the constant liar strategy, i.e., "min", "mean", or "max" of
+            the observed losses. Default is "min".
+        initial_points : int, optional
+            The number of evaluated individuals to collect before fitting the GP. Default is 10.
+        length_scale : float, optional
+            The kernel's length scale in the unit hypercube. Default is None, i.e., chosen by maximizing the marginal
+            likelihood.
+        noise : float, optional
+            The noise variance of standardized losses. Default is 1e-6, i.e., noise-free.
+        kappa : float, optional
+            The exploration weight of the lower confidence bound. Default is 2.0.
+        xi : float, optional
+            The minimum improvement required by expected improvement. Default is 0.0.
+        num_candidates : int, optional
+            The number of uniformly sampled candidates to choose the starting points of the local search from. Default
+            is 1024.
+        num_starts : int, optional
+            The number of starting points of the local search. Default is 8.
+        num_steps : int, optional
+            The number of steps of the local search. Default is 20.
+        max_pending : int, optional
+            The maximum number of this worker's proposals accounted for as pending until they are evaluated. Beyond
+            that, the oldest proposals are forgotten, but never those of the current batch. Default is None, i.e., ten
+            times ``initial_points``.
+        init : propulate.propagators.Propagator, optional
+            The propagator initializing individuals until ``initial_points`` individuals have been evaluated. Default is
+            uniform random initialization.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If the acquisition function, pending strategy, or liar is unknown.
+        """
+        super().__init__(parents=-1, offspring=1, rng=rng)
+        if acquisition not in ACQUISITIONS:
+            raise ValueError(f"Unknown acquisition function {acquisition}. Choose from {', '.join(ACQUISITIONS)}.")
+        if pending_strategy not in PENDING_STRATEGIES:
+            raise ValueError(f"Unknown pending strategy {pending_strategy}. Choose from {', '.join(PENDING_STRATEGIES)}.")
+        if liar not in LIARS:
+            raise ValueError(f"Unknown liar {liar}. Choose from {', '.join(LIARS)}.")
+        self.limits = limits
+        self.encoding = Encoding(limits)
+        self.acquisition = acquisition
+        self.pending_strategy = pending_strategy
+        self.liar = liar
+        self.initial_points = initial_points
+        self.kappa = kappa
+        self.xi = xi
+        self.num_candidates = num_candidates
+        self.num_starts = num_starts
+        self.num_steps = num_steps
+        self.max_pending = 10 * initial_points if max_pending is None else max_pending
+        self.init = InitUniform(limits, rng=self.rng) if init is None else init
+        self.gp = GaussianProcess(length_scale or 0.2, noise)
+        self.pending: List[Individual] = []
+        self._length_scale = length_scale
+        self._keys: List[bytes] = []  # Positions of the individuals in the GP, in order
+        self._refit_size = 0  # Number of individuals at which to refit the GP from scratch
+        self._proposed = _PendingProposals()  # Positions proposed by this worker
+
+        # Scale positions to the unit hypercube, leaving categorical traits one-hot encoded.
+        encoding = self.encoding
+        lower = np.where(encoding.categorical, 0.0, encoding.lower)
+        upper = np.where(encoding.categorical, 1.0, encoding.upper)
+        for trait in np.flatnonzero(encoding.ordinal):
+            values = limits[encoding.keys[trait]]
+            lower[trait], upper[trait] = min(values), max(values)  # type: ignore[type-var]
+        self._shift = np.repeat(lower, encoding.widths)
+        self._scale = np.repeat(np.where(upper > lower, upper - lower, 1.0), encoding.widths)
+        self._categorical = encoding.expand(encoding.categorical)
+
+    def __call__(self, inds: List[Individual]) -> Individual:
+        """
+        Propose an individual.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals to fit the GP to.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The proposed individual, or an initialized individual if fewer than ``initial_points`` have been evaluated.
+        """
+        return self.breed_batch(inds, 1)[0]  # type: ignore[return-value]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Propose several individuals at once, each accounting for the previous ones as pending.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals to fit the GP to.
+        k : int
+            The number of individuals to propose.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The proposed individuals, or initialized individuals if fewer than ``initial_points`` have been evaluated.
+        """
+        observed = {ind.position.tobytes(): ind for ind in inds}
+        for evaluated in inds:
+            self._proposed.pop(evaluated.position)
+        if len(observed) < self.initial_points:
+            offspring = self.init.breed_batch([], k)
+            for ind in offspring:
+                assert isinstance(ind, Individual)
+                self._proposed.add(ind.position, ind.position)
+        else:
+            self._fit(observed)
+            rng = _numpy_rng(self.rng)
+            pending = [ind.position for ind in self.pending if ind.position.tobytes() not in observed]
+            pending += self._proposed.values()
+            offspring = []
+            for _ in range(k):
+                position = self._propose(rng, self._normalize(np.array(pending).reshape(-1, self.encoding.size)))
+                offspring.append(Individual.from_encoding(position, self.encoding))
+                self._proposed.add(position, position)
+                pending.append(position)
+        self._proposed.trim(max(k, self.max_pending))
+        return offspring
+
+    def _normalize(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Scale positions to the unit hypercube.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions, one row per point.
+
+        Returns
+        -------
+        np.ndarray
+            The scaled positions, one row per point.
+        """
+        return (positions - self._shift) / self._scale
+
+    def _fit(self, observed: Dict[bytes, Individual]) -> None:
+        """
+        Fit the GP to the evaluated individuals, adding only new ones to the Cholesky factor if possible.
+
+        Non-finite losses, e.g., of failed evaluations, are replaced by the worst finite loss.
+
+        Parameters
+        ----------
+        observed : Dict[bytes, propulate.population.Individual]
+            The evaluated individuals by their positions.
+        """
+        known = set(self._keys)
+        refit = len(self._keys) == 0 or not known.issubset(observed) or len(observed) >= self._refit_size
+        keys = list(observed) if refit else [key for key in observed if key not in known]
+        if len(keys) == 0:
+            return
+        x = self._normalize(np.stack([observed[key].position for key in keys]))
+        y = np.array([observed[key].loss for key in keys], dtype=np.float64)
+        finite = np.isfinite(y)
+        if not finite.all():
+            y[~finite] = y[finite].max() if finite.any() else np.max(self.gp.y, initial=0.0)
+        if not refit:
+            self.gp.update(x, y)
+            self._keys += keys
+            return
+        if self._length_scale is None:  # Choose length scale with maximum marginal likelihood.
+            likelihoods = []
+            for length_scale in np.sqrt(x.shape[1]) * np.geomspace(0.02, 1.0, 10):
+                self.gp.length_scale = length_scale
+                self.gp.fit(x, y)
+                likelihoods.append((self.gp.log_marginal_likelihood(), length_scale))
+            self.gp.length_scale = max(likelihoods)[1]
+            self._refit_size = 2 * len(keys)
+        else:
+            self._refit_size = np.iinfo(np.int64).max
+        self.gp.fit(x, y)
+        self._keys = keys
+
+    def _propose(self, rng: np.random.Generator, pending: np.ndarray) -> np.ndarray:
+        """
+        Maximize the acquisition function by a vectorized multi-start local search.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            The random number generator.
+        pending : np.ndarray
+            The scaled positions of the pending individuals, one row per individual.
+
+        Returns
+        -------
+        np.ndarray
+            The position maximizing the acquisition function.
+        """
+        encoding = self.encoding
+        candidates = encoding.from_unit(rng.random((self.num_candidates, len(encoding.keys))))
+        best = self._shift + self._scale * self.gp.x[np.argmin(self.gp.y)]
+        candidates = np.vstack([candidates, encoding.snap(best[None, :])])
+        normalized = self._normalize(candidates)
+        score = self._scorer(normalized, pending)
+        values = score(normalized)
+        order = np.argsort(-values)[: self.num_starts]
+        starts, values = candidates[order], values[order]
+        step = np.full(len(starts), 0.1)
+        num_traits = len(encoding.keys)
+        for _ in range(self.num_steps):
+            proposals = starts + rng.normal(size=starts.shape) * step[:, None] * np.where(self._categorical, 0.0, self._scale)
+            for trait in np.flatnonzero(encoding.categorical):  # Change categories with probability 1 / #traits.
+                offset, width = encoding.trait_offsets[trait], encoding.widths[trait]
+                rows = np.flatnonzero(rng.random(len(starts)) < 1.0 / num_traits)
+                proposals[rows, offset : offset + width] = 0.0
+                proposals[rows, offset + rng.integers(width, size=len(rows))] = 1.0
+            proposals = encoding.snap(proposals)
+            proposed_values = score(self._normalize(proposals))
+            better = proposed_values > values
+            starts[better], values[better] = proposals[better], proposed_values[better]
+            step = np.clip(np.where(better, 2.0 * step, 0.5 * step), 1e-3, 0.5)
+        return starts[np.argmax(values)]
+
+    def _scorer(self, candidates: np.ndarray, pending: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Set up the acquisition function to maximize, accounting for the pending individuals.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            The scaled candidate positions to estimate the posterior mean's Lipschitz constant from, one row per point.
+        pending : np.ndarray
+            The scaled positions of the pending individuals, one row per individual.
+
+        Returns
+        -------
+        Callable[[np.ndarray], np.ndarray]
+            The acquisition function of scaled positions.
+        """
+        gp, best = self.gp, float(np.min(self.gp.y))
+        if len(pending) > 0 and self.pending_strategy == "constant_liar":
+            gp = copy.copy(self.gp)
+            lie = getattr(np, self.liar)(self.gp.y)  # np.min, np.mean, or np.max
+            gp.update(pending, np.full(len(pending), lie))
+
+        def acquisition(x: np.ndarray) -> np.ndarray:
+            mean, std = gp.predict(x)
+            if self.acquisition == "lcb":
+                return -(mean - self.kappa * std)
+            z = (best - mean - self.xi) / std
+            return std * (z * ndtr(z) + np.exp(-0.5 * z**2) / np.sqrt(2 * np.pi))
+
+        if len(pending) == 0 or self.pending_strategy == "constant_liar":
+            return acquisition
+
+        # Local penalization: The loss is unlikely to be minimal within the ball around each pending individual in which
+        # it cannot drop below the best loss, given the Lipschitz constant of the posterior mean.
+        lipschitz = max(float(np.max(np.linalg.norm(gp.mean_gradient(candidates), axis=1))), 1e-7)
+        pending_mean, pending_std = gp.predict(pending)
+
+        def penalized(x: np.ndarray) -> np.ndarray:
+            values = acquisition(x)
+            log_values = np.log(np.maximum(values, 1e-300)) if self.acquisition == "ei" else np.log(np.logaddexp(0.0, values))
+            z = (lipschitz * cdist(x, pending) - pending_mean + best) / pending_std
+            return log_values + log_ndtr(z).sum(axis=1)
+
+        return penalized
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the propagator's internal state for checkpointing, including the pending proposals of this worker.
+
+        The GP is not part of the state as it is refitted to the population.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The propagator's state.
+        """
+        state = super().state_dict()
+        state["proposed"] = self._proposed.state_dict()
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the propagator's internal state, including the pending proposals of this worker, from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        super().load_state_dict(state)
+        self._proposed.load_state_dict(state["proposed"])
@@ -1,9 +1,10 @@
+import copy
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from ..population import Individual
+from ..population import Encoding, Individual
 from .base import Propagator, SelectMax, SelectMin, SelectUniform
 
 
@@ -76,6 +77,10 @@ class CMAParameter:
         Update the covariance matrix.
     mahalanobis_norm()
         Compute the Mahalanobis distance.
+    state_dict()
+        Get the strategy parameters for checkpointing.
+    load_state_dict()
+        Restore the strategy parameters from a checkpoint.
     """
 
     def __init__(
@@ -161,7 +166,8 @@ class CMAParameter:
         # Use this initial mean when using multiple islands.
         self.mean = initial_mean
         # 0.3 instead of 0.2 is also often used for greater initial step size
-        self.sigma = 0.2 * ((max(max(limits[i]) for i in limits)) - min(min(limits[i]) for i in limits))
+        encoding = Encoding(limits)  # Search in transformed space for parameters with ``Transformed`` limits.
+        self.sigma = 0.2 * (np.max(encoding.upper) - np.min(encoding.lower))
 
         # Mean of the last generation
         self.old_mean: np.ndarray = initial_mean
@@ -295,6 +301,31 @@ class CMAParameter:
         # NOTE typing seems to be broken here? mypy says this is a floating[Any], the docs say this is float | ndarray
         return np.linalg.norm(np.dot(self.covariance_inv_sqrt, dx))  # type:ignore
 
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the strategy parameters for checkpointing.
+
+        These include the mean, the covariance matrix and its decomposition, the step size, the evolution paths, and
+        the evaluation counters.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A copy of all attributes.
+        """
+        return copy.deepcopy(vars(self))
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the strategy parameters from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The strategy parameters as returned by ``state_dict()``.
+        """
+        vars(self).update(copy.deepcopy(state))
+
 
 class CMAAdapter:
     """
@@ -708,7 +739,8 @@ class CMAPropagator(Propagator):
         # CMA-ES variant specific weights and learning rates
         weights, mu_eff, c_c, c_1, c_mu = adapter.compute_weights(mu, lambd, problem_dimension)
 
-        initial_mean = np.array([[self.numpy_rng.uniform(*limits[limit]) for limit in limits]]).reshape((problem_dimension, 1))
+        encoding = Encoding(limits)  # Search in transformed space for parameters with ``Transformed`` limits.
+        initial_mean = self.numpy_rng.uniform(encoding.lower, encoding.upper).reshape((problem_dimension, 1))
         # 0.3 instead of 0.2 is also often used for greater initial step size
 
         self.par = CMAParameter(
@@ -785,11 +817,8 @@ class CMAPropagator(Propagator):
         arx : numpy.ndarray
             Array of shape [problem_dimension, len(inds)].
         """
-        arx = np.zeros((self.par.problem_dimension, len(inds)))
-        for k, ind in enumerate(inds):
-            for i, (dim, _) in enumerate(self.par.limits.items()):
-                arx[i, k] = ind[dim]
-        return arx
+        positions = np.array([ind.position for ind in inds], dtype=np.float64)
+        return positions.reshape((len(inds), self.par.problem_dimension)).T
 
     def _sample_cma(self) -> Individual:
         """
@@ -811,3 +840,30 @@ class CMAPropagator(Propagator):
         new_ind = Individual(new_x[:, 0], self.par.limits)
 
         return new_ind
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the propagator's internal state for checkpointing, including the CMA-ES strategy parameters.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The propagator's state.
+        """
+        state = super().state_dict()
+        state["numpy_rng"] = self.numpy_rng.bit_generator.state
+        state["par"] = self.par.state_dict()
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the propagator's internal state, including the CMA-ES strategy parameters, from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        super().load_state_dict(state)
+        self.numpy_rng.bit_generator.state = state["numpy_rng"]
+        self.par.load_state_dict(state["par"])
@@ -0,0 +1,354 @@
+import random
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from ..population import Encoding, Individual
+from .base import InitUniform, Propagator, _numpy_rng, _PendingProposals
+
+STRATEGIES = ("rand/1/bin", "best/1/bin", "current-to-pbest/1/bin")
+ADAPTATIONS = ("jade", "shade")
+
+
+class DifferentialEvolution(Propagator):
+    """
+    Asynchronous differential evolution (DE) propagator.
+
+    Each application breeds one trial vector from the DE population, i.e., the ``pop_size`` best individuals evaluated
+    so far by any worker. The target vector is drawn uniformly from the DE population, mutated with the chosen strategy,
+    and recombined with the mutant by binomial crossover. As a trial enters the DE population as soon as it is better
+    than its worst member, this is the steady-state variant of DE suited for asynchronous workers.
+
+    The mutation factor and crossover rate are either fixed or adapted from the successful trials, i.e., those better
+    than their target vector, as proposed by J. Zhang and A. C. Sanderson, "JADE: Adaptive Differential Evolution With
+    Optional External Archive" https://doi.org/10.1109/TEVC.2009.2014613 and R. Tanabe and A. Fukunaga,
+    "Success-History Based Parameter Adaptation for Differential Evolution" https://doi.org/10.1109/CEC.2013.6557555.
+    Each worker adapts its parameters from its own trials, which it recognizes by their positions once they are
+    evaluated. The optional external archive of JADE is not used.
+
+    DE works on the individuals' positions. Integer traits are rounded, ordinal traits snapped to their closest value,
+    and categorical traits set to the category with the largest entry of the mutant's one-hot segment.
+
+    Attributes
+    ----------
+    adaptation : str | None
+        The parameter adaptation scheme, i.e., "jade", "shade", or None for fixed parameters.
+    crossover_rate : float
+        The (initial) crossover rate.
+    encoding : propulate.population.Encoding
+        The vector encoding of the search space.
+    init : propulate.propagators.Propagator
+        The propagator initializing individuals as long as the DE population is not full.
+    learning_rate : float
+        The learning rate of JADE's parameter adaptation.
+    limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space, i.e., the limits of (hyper-)parameters to be optimized.
+    max_pending : int
+        The maximum number of this worker's trials remembered for parameter adaptation until they are evaluated.
+    memory_cr : np.ndarray
+        The memory of crossover rate means.
+    memory_f : np.ndarray
+        The memory of mutation factor location parameters.
+    memory_index : int
+        The index of the memory entry to update next.
+    mutation_factor : float
+        The (initial) mutation factor.
+    p_best : float
+        The fraction of the best individuals to choose the best vector from in the current-to-pbest strategy.
+    pop_size : int
+        The size of the DE population.
+    strategy : str
+        The mutation strategy, i.e., "rand/1/bin", "best/1/bin", or "current-to-pbest/1/bin".
+
+    Methods
+    -------
+    __call__()
+        Breed a trial vector from the DE population.
+    breed_batch()
+        Breed several trial vectors from the DE population at once.
+    state_dict()
+        Get the propagator's internal state for checkpointing, including the adaptation memory.
+    load_state_dict()
+        Restore the propagator's internal state from a checkpoint.
+
+    Notes
+    -----
+    The ``DifferentialEvolution`` class inherits all methods and attributes from the ``Propagator`` class.
+
+    See Also
+    --------
+    :class:`Propagator` : The parent class.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]],
+        strategy: str = "rand/1/bin",
+        pop_size: int = 20,
+        mutation_factor: float = 0.5,
+        crossover_rate: float = 0.9,
+        adaptation: Optional[str] = None,
+        memory_size: int = 5,
+        learning_rate: float = 0.1,
+        p_best: float = 0.1,
+        max_pending: Optional[int] = None,
+        init: Optional[Propagator] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a differential evolution propagator.
+
+        Parameters
+        ----------
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The search space, i.e., the limits of (hyper-)parameters to be optimized.
+        strategy : str, optional
+            The mutation strategy, i.e., "rand/1/bin", "best/1/bin", or "current-to-pbest/1/bin". Default is
+            "rand/1/bin".
+        pop_size : int, optional
+            The size of the DE population. Individuals are initialized until that many have been evaluated. Default is
+            20.
+        mutation_factor : float, optional
+            The mutation factor, i.e., the initial location of the mutation factor's distribution if adapted. Default is
+            0.5.
+        crossover_rate : float, optional
+            The crossover rate, i.e., the initial mean of the crossover rate's distribution if adapted. Default is 0.9.
+        adaptation : str, optional
+            The parameter adaptation scheme, i.e., "jade" or "shade". Default is None, i.e., fixed parameters.
+        memory_size : int, optional
+            The number of entries of SHADE's success history memory. Default is 5.
+        learning_rate : float, optional
+            The learning rate of JADE's parameter adaptation. Default is 0.1.
+        p_best : float, optional
+            The fraction of the best individuals to choose the best vector from in the current-to-pbest strategy.
+            Default is 0.1.
+        max_pending : int, optional
+            The maximum number of this worker's trials remembered for parameter adaptation until they are evaluated.
+            Beyond that, the oldest trials are forgotten. Default is None, i.e., ten times ``pop_size``.
+        init : propulate.propagators.Propagator, optional
+            The propagator initializing individuals while fewer than ``pop_size`` individuals have been evaluated.
+            Default is uniform random initialization.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If the strategy or adaptation scheme is unknown or the DE population has fewer than four individuals.
+        """
+        super().__init__(parents=-1, offspring=1, rng=rng)
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown DE strategy {strategy}. Choose from {', '.join(STRATEGIES)}.")
+        if adaptation is not None and adaptation not in ADAPTATIONS:
+            raise ValueError(f"Unknown parameter adaptation {adaptation}. Choose from {', '.join(ADAPTATIONS)} or None.")
+        if pop_size < 4:
+            raise ValueError("The DE population needs at least four individuals.")
+        self.limits = limits
+        self.encoding = Encoding(limits)
+        self.strategy = strategy
+        self.pop_size = pop_size
+        self.mutation_factor = mutation_factor
+        self.crossover_rate = crossover_rate
+        self.adaptation = adaptation
+        self.learning_rate = learning_rate
+        self.p_best = p_best
+        self.max_pending = 10 * pop_size if max_pending is None else max_pending
+        self.init = InitUniform(limits, rng=self.rng) if init is None else init
+        memory_size = memory_size if adaptation == "shade" else 1
+        self.memory_f = np.full(memory_size, mutation_factor)
+        self.memory_cr = np.full(memory_size, crossover_rate)
+        self.memory_index = 0
+        self._pending = _PendingProposals()  # Parameters and target loss of each trial bred on this worker
+
+    def __call__(self, inds: List[Individual]) -> Individual:
+        """
+        Breed a trial vector from the DE population.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals to form the DE population from.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The trial vector, or an initialized individual if the DE population is not full yet.
+        """
+        return self.breed_batch(inds, 1)[0]  # type: ignore[return-value]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Breed several trial vectors from the DE population at once, vectorized over the population's position matrix.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals to form the DE population from.
+        k : int
+            The number of trial vectors to breed.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The trial vectors, or initialized individuals if the DE population is not full yet.
+        """
+        self._adapt(inds)
+        if len(inds) < self.pop_size:
+            return self.init.breed_batch([], k)
+        population = sorted(inds, key=lambda ind: ind.loss)[: self.pop_size]
+        positions = np.stack([ind.position for ind in population])
+        losses = np.array([ind.loss for ind in population])
+        rng = _numpy_rng(self.rng)
+        factors, rates = self._sample_parameters(rng, k)
+
+        # The first four entries of a random permutation per trial give distinct target and donor indices.
+        idx = rng.random((k, self.pop_size)).argsort(axis=1)[:, :4]
+        target, r1, r2, r3 = idx.T
+        f = factors[:, None]
+        if self.strategy == "rand/1/bin":
+            mutants = positions[r1] + f * (positions[r2] - positions[r3])
+        elif self.strategy == "best/1/bin":
+            mutants = positions[0] + f * (positions[r1] - positions[r2])
+        else:
+            best = rng.integers(max(1, round(self.p_best * self.pop_size)), size=k)
+            mutants = positions[target] + f * (positions[best] - positions[target]) + f * (positions[r1] - positions[r2])
+
+        # Binomial crossover of whole traits, taking at least one trait from the mutant.
+        cross = rng.random((k, len(self.encoding.keys))) < rates[:, None]
+        cross[np.arange(k), rng.integers(len(self.encoding.keys), size=k)] = True
+        trials = np.where(self.encoding.expand(cross), mutants, positions[target])
+        trials = self._repair(trials, positions[target])
+
+        offspring: List[Union[List[Individual], Individual]] = []
+        for position, factor, rate, loss in zip(trials, factors.tolist(), rates.tolist(), losses[target].tolist()):
+            offspring.append(Individual.from_encoding(position, self.encoding))
+            if self.adaptation is not None:
+                self._pending.add(position, (factor, rate, loss))
+        self._pending.trim(self.max_pending)
+        return offspring
+
+    def _sample_parameters(self, rng: np.random.Generator, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample the mutation factor and crossover rate of each trial.
+
+        Adapted mutation factors follow a Cauchy distribution, resampled if not positive and truncated to one. Adapted
+        crossover rates follow a normal distribution clipped to :math:`[0, 1]`. Both are centered at a random memory
+        entry.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            The random number generator.
+        k : int
+            The number of trials.
+
+        Returns
+        -------
+        np.ndarray
+            The mutation factors.
+        np.ndarray
+            The crossover rates.
+        """
+        if self.adaptation is None:
+            return np.full(k, self.mutation_factor), np.full(k, self.crossover_rate)
+        entry = rng.integers(len(self.memory_f), size=k)
+        rates = np.clip(rng.normal(self.memory_cr[entry], 0.1), 0.0, 1.0)
+        factors = np.zeros(k)
+        resample = np.ones(k, dtype=bool)
+        while resample.any():
+            factors[resample] = self.memory_f[entry[resample]] + 0.1 * rng.standard_cauchy(int(resample.sum()))
+            resample = factors <= 0.0
+        return np.minimum(factors, 1.0), rates
+
+    def _adapt(self, inds: List[Individual]) -> None:
+        """
+        Update the adaptation memory with the parameters of this worker's trials that are better than their target.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals, among them this worker's recent trials.
+        """
+        if self.adaptation is None or len(self._pending) == 0:
+            return
+        successes = []
+        for ind in inds:
+            if ind.position in self._pending:
+                factor, rate, target_loss = self._pending.pop(ind.position)
+                if ind.loss < target_loss:
+                    successes.append((factor, rate, target_loss - ind.loss))
+        if len(successes) == 0:
+            return
+        factors, rates, improvements = np.array(successes).T
+        if self.adaptation == "shade" and np.all(np.isfinite(improvements)):
+            weights = improvements / improvements.sum()  # Weighted by improvement over the target
+        else:
+            weights = np.full(len(successes), 1.0 / len(successes))
+        mean_f = np.sum(weights * factors**2) / np.sum(weights * factors)  # Lehmer mean
+        mean_cr = np.sum(weights * rates)
+        if self.adaptation == "jade":
+            self.memory_f[0] += self.learning_rate * (mean_f - self.memory_f[0])
+            self.memory_cr[0] += self.learning_rate * (mean_cr - self.memory_cr[0])
+        else:
+            self.memory_f[self.memory_index] = mean_f
+            self.memory_cr[self.memory_index] = mean_cr
+            self.memory_index = (self.memory_index + 1) % len(self.memory_f)
+
+    def _repair(self, trials: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Map trial positions back into the search space.
+
+        Entries beyond their limits are set halfway between their target's entry and the violated limit before all
+        traits are snapped to valid values.
+
+        Parameters
+        ----------
+        trials : np.ndarray
+            The trial positions, one row per trial.
+        targets : np.ndarray
+            The target positions, one row per trial.
+
+        Returns
+        -------
+        np.ndarray
+            The valid trial positions, one row per trial.
+        """
+        encoding = self.encoding
+        ranged = ~(encoding.categorical | encoding.ordinal)
+        idx = encoding.trait_offsets[ranged]
+        lower, upper = encoding.lower[ranged], encoding.upper[ranged]
+        values = trials[:, idx]
+        values = np.where(values < lower, (lower + targets[:, idx]) / 2, values)
+        trials[:, idx] = np.where(values > upper, (upper + targets[:, idx]) / 2, values)
+        return encoding.snap(trials)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the propagator's internal state for checkpointing, including the adaptation memory and pending trials.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The propagator's state.
+        """
+        state = super().state_dict()
+        state["memory_f"] = self.memory_f.copy()
+        state["memory_cr"] = self.memory_cr.copy()
+        state["memory_index"] = self.memory_index
+        state["pending"] = self._pending.state_dict()
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the propagator's internal state, including the adaptation memory and pending trials, from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        super().load_state_dict(state)
+        self.memory_f = state["memory_f"].copy()
+        self.memory_cr = state["memory_cr"].copy()
+        self.memory_index = state["memory_index"]
+        self._pending.load_state_dict(state["pending"])
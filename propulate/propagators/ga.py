@@ -1,11 +1,133 @@
-import copy
 import random
-from typing import Dict, List, Mapping, Optional, Tuple, Union
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from ..population import Individual
-from .base import Stochastic
+from ..population import Encoding, Individual
+from .base import Stochastic, _numpy_rng
+
+
+def _choose_traits(rng: np.random.Generator, candidates: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Choose distinct traits to mutate uniformly at random for each of a batch of individuals.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        The random number generator.
+    candidates : np.ndarray
+        The boolean mask of the traits that may be chosen.
+    points : np.ndarray
+        The number of traits to choose for each individual.
+
+    Returns
+    -------
+    np.ndarray
+        The boolean mask of the chosen traits with one row per individual.
+    """
+    keys = rng.random((len(points), len(candidates)))
+    keys[:, ~candidates] = np.inf
+    # The traits with the `points` smallest random keys form a uniform sample without replacement.
+    threshold = np.sort(keys, axis=1)[np.arange(len(points)), np.maximum(points, 1) - 1]
+    return (keys <= threshold[:, None]) & (points > 0)[:, None]
+
+
+def _resample_traits(positions: np.ndarray, mutate: np.ndarray, encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+    """
+    Resample the given traits of a batch of positions uniformly within their limits.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        The positions to mutate, one row per individual.
+    mutate : np.ndarray
+        The boolean mask of the traits to resample, one row per individual.
+    encoding : propulate.population.Encoding
+        The search space encoding.
+    rng : numpy.random.Generator
+        The random number generator.
+
+    Returns
+    -------
+    np.ndarray
+        The mutated copy of the positions.
+    """
+    positions = positions.copy()
+    offsets = encoding.trait_offsets
+    rows, traits = np.nonzero(mutate & encoding.continuous)
+    positions[rows, offsets[traits]] = rng.uniform(encoding.lower[traits], encoding.upper[traits])
+    rows, traits = np.nonzero(mutate & ~(encoding.continuous | encoding.categorical | encoding.ordinal))
+    positions[rows, offsets[traits]] = rng.integers(
+        encoding.lower[traits].astype(np.int64), encoding.upper[traits].astype(np.int64), endpoint=True
+    )
+    categorical = mutate & encoding.categorical
+    positions[encoding.expand(categorical)] = 0.0
+    rows, traits = np.nonzero(categorical)
+    positions[rows, offsets[traits] + rng.integers(0, encoding.widths[traits])] = 1.0
+    for row, trait in zip(*np.nonzero(mutate & encoding.ordinal)):  # Ordinal traits with explicitly given values
+        positions[row, offsets[trait]] = rng.choice(encoding.limits[encoding.keys[trait]])
+    return positions
+
+
+def _apply_mutation(
+    propagator: Stochastic,
+    batch: Sequence[Individual],
+    mutate: Callable[[np.ndarray, Encoding, np.random.Generator], np.ndarray],
+) -> List[Individual]:
+    """
+    Apply a mutation to a batch of individuals at once, each with the propagator's probability.
+
+    Parameters
+    ----------
+    propagator : propulate.propagators.Stochastic
+        The mutation.
+    batch : Sequence[propulate.population.Individual]
+        The individuals to mutate.
+    mutate : Callable[[np.ndarray, propulate.population.Encoding, numpy.random.Generator], np.ndarray]
+        The function returning mutated copies of the stacked positions of the individuals the mutation is applied to.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The mutated offspring, or the input individual itself where the mutation is not applied.
+    """
+    applied = [propagator.rng.random() < propagator.probability for _ in batch]
+    parents = [ind for ind, is_applied in zip(batch, applied) if is_applied]
+    if len(parents) == 0:
+        return list(batch)
+    positions = mutate(np.stack([ind.position for ind in parents]), parents[0].encoding, _numpy_rng(propagator.rng))
+    children = iter([parent.spawn(position) for parent, position in zip(parents, positions)])
+    return [next(children) if is_applied else ind for ind, is_applied in zip(batch, applied)]
+
+
+def _apply_crossover(
+    propagator: Stochastic,
+    batch: Sequence[List[Individual]],
+    recombine: Callable[[List[List[Individual]], Encoding, np.random.Generator], np.ndarray],
+) -> List[Individual]:
+    """
+    Apply a crossover to a batch of parent groups at once, each with the propagator's probability.
+
+    Parameters
+    ----------
+    propagator : propulate.propagators.Stochastic
+        The crossover.
+    batch : Sequence[List[propulate.population.Individual]]
+        The groups of parents.
+    recombine : Callable[[List[List[propulate.population.Individual]], propulate.population.Encoding, numpy.random.Generator], np.ndarray]
+        The function returning the offspring positions of the parent groups the crossover is applied to.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        One offspring per parent group, a copy of the first parent where the crossover is not applied.
+    """
+    applied = [propagator.rng.random() < propagator.probability for _ in batch]
+    positions = np.stack([inds[0].position for inds in batch])  # Consider 1st parents.
+    crossed = [inds for inds, is_applied in zip(batch, applied) if is_applied]
+    if len(crossed) > 0:
+        positions[np.flatnonzero(applied)] = recombine(crossed, crossed[0][0].encoding, _numpy_rng(propagator.rng))
+    return [inds[0].spawn(position) for inds, position in zip(batch, positions)]
 
 
 class PointMutation(Stochastic):
@@ -74,29 +196,44 @@ class PointMutation(Stochastic):
         propulate.population.Individual
             The possibly point-mutated individual after application of the propagator.
         """
-        if self.rng.random() < self.probability:  # Apply propagator only with specified probability
-            ind = copy.deepcopy(ind)
-            ind.loss = float("inf")  # Initialize individual's loss attribute.
-            # Determine traits to mutate via random sampling.
-            # Return `self.points` length list of unique elements chosen from `ind.keys()`.
-            # Used for random sampling without replacement.
-            to_mutate = self.rng.sample(sorted(ind.keys()), self.points)
-            # Point-mutate `self.points` randomly chosen traits of individual `ind`.
-            for i in to_mutate:
-                if isinstance(ind[i], int):
-                    # Return randomly selected element from int range(start, stop, step).
-                    if len(self.limits[i]) == 2:
-                        ind[i] = self.rng.randint(*self.limits[i])
-                    # Return randomly selected element from given tuple of elements.
-                    else:
-                        ind[i] = self.rng.choice(self.limits[i])
-                elif isinstance(ind[i], float):
-                    # Return random floating point number within limits.
-                    ind[i] = self.rng.uniform(*self.limits[i])
-                elif isinstance(ind[i], str):
-                    # Return random element from non-empty sequence.
-                    ind[i] = self.rng.choice(self.limits[i])
-        return ind  # Return point-mutated individual.
+        return _apply_mutation(self, [ind], self._mutate)[0]  # Return point-mutated individual.
+
+    def apply_batch(self, batch: Sequence[Individual]) -> List[Individual]:  # type: ignore[override]
+        """
+        Apply the point-mutation propagator to each of a batch of individuals at once.
+
+        Parameters
+        ----------
+        batch : Sequence[propulate.population.Individual]
+            The individuals the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The possibly point-mutated individuals.
+        """
+        return _apply_mutation(self, batch, self._mutate)
+
+    def _mutate(self, positions: np.ndarray, encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+        """
+        Point-mutate ``self.points`` randomly chosen traits of each position by resampling them within their limits.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions, one row per individual.
+        encoding : propulate.population.Encoding
+            The search space encoding.
+        rng : numpy.random.Generator
+            The random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The mutated copy of the positions.
+        """
+        points = np.full(len(positions), self.points)
+        return _resample_traits(positions, _choose_traits(rng, np.ones(len(encoding.keys), dtype=bool), points), encoding, rng)
 
 
 class RandomPointMutation(Stochastic):
@@ -184,27 +321,44 @@ class RandomPointMutation(Stochastic):
         propulate.population.Individual
             The possibly point-mutated individual after application of the propagator.
         """
-        if self.rng.random() < self.probability:  # Apply propagator only with specified probability.
-            ind = copy.deepcopy(ind)
-            ind.loss = float("inf")  # Initialize individual's loss attribute.
-            # Determine traits to mutate via random sampling.
-            # Return `self.points` length list of unique elements chosen from `ind.keys()`.
-            # Used for random sampling without replacement.
-            points = self.rng.randint(self.min_points, self.max_points)
-            to_mutate = self.rng.sample(sorted(ind.keys()), points)
-            # Point-mutate `points` randomly chosen traits of individual `ind`.
-            for i in to_mutate:
-                if isinstance(ind[i], int):
-                    # Return randomly selected element from int range(start, stop, step).
-                    ind[i] = self.rng.randint(*self.limits[i])
-                elif isinstance(ind[i], float):
-                    # Return random floating point number N within limits.
-                    ind[i] = self.rng.uniform(*self.limits[i])
-                elif isinstance(ind[i], str):
-                    # Return random element from non-empty sequence.
-                    ind[i] = self.rng.choice(self.limits[i])
-
-        return ind  # Return point-mutated individual.
+        return _apply_mutation(self, [ind], self._mutate)[0]  # Return point-mutated individual.
+
+    def apply_batch(self, batch: Sequence[Individual]) -> List[Individual]:  # type: ignore[override]
+        """
+        Apply the random-point-mutation propagator to each of a batch of individuals at once.
+
+        Parameters
+        ----------
+        batch : Sequence[propulate.population.Individual]
+            The individuals the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The possibly point-mutated individuals.
+        """
+        return _apply_mutation(self, batch, self._mutate)
+
+    def _mutate(self, positions: np.ndarray, encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+        """
+        Point-mutate a random number of randomly chosen traits of each position by resampling them within their limits.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions, one row per individual.
+        encoding : propulate.population.Encoding
+            The search space encoding.
+        rng : numpy.random.Generator
+            The random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The mutated copy of the positions.
+        """
+        points = rng.integers(self.min_points, self.max_points, size=len(positions), endpoint=True)
+        return _resample_traits(positions, _choose_traits(rng, np.ones(len(encoding.keys), dtype=bool), points), encoding, rng)
 
 
 class IntervalMutationNormal(Stochastic):
@@ -280,25 +434,52 @@ class IntervalMutationNormal(Stochastic):
         propulate.population.Individual
             The possibly interval-mutated output individual after application of the propagator.
         """
-        if self.rng.random() < self.probability:  # Apply propagator only with specified probability.
-            ind = copy.deepcopy(ind)
-            ind.loss = float("inf")  # Initialize individual's loss attribute.
-            # Determine traits of type float.
-            interval_keys: List[str] = [x for x in ind.keys() if isinstance(ind[x], float)]
-            # Determine ´self.points` traits to mutate.
-            to_mutate: List[str] = self.rng.sample(interval_keys, self.points)
-            # Mutate traits by sampling from Gaussian distribution centered around current value
-            # with `sigma_factor` scaled interval width as standard distribution.
-            for key in to_mutate:
-                min_val, max_val = self.limits[key]  # Determine interval boundaries.
-                sigma = (
-                    float(max_val) - float(min_val)
-                ) * self.sigma_factor  # Determine std from interval boundaries and sigma factor.
-                ind[key] = self.rng.gauss(float(ind[key]), sigma)  # Sample new value from Gaussian centered around current value.
-                ind[key] = min(max_val, ind[key])  # Make sure new value is within specified limits.
-                ind[key] = max(min_val, ind[key])
-
-        return ind  # Return point-mutated individual.
+        return _apply_mutation(self, [ind], self._mutate)[0]  # Return point-mutated individual.
+
+    def apply_batch(self, batch: Sequence[Individual]) -> List[Individual]:  # type: ignore[override]
+        """
+        Apply the interval-mutation propagator to each of a batch of individuals at once.
+
+        Parameters
+        ----------
+        batch : Sequence[propulate.population.Individual]
+            The individuals the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The possibly interval-mutated individuals.
+        """
+        return _apply_mutation(self, batch, self._mutate)
+
+    def _mutate(self, positions: np.ndarray, encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+        """
+        Mutate ``self.points`` randomly chosen traits of type float of each position with Gaussian noise.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions, one row per individual.
+        encoding : propulate.population.Encoding
+            The search space encoding.
+        rng : numpy.random.Generator
+            The random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The mutated copy of the positions.
+        """
+        positions = positions.copy()
+        rows, traits = np.nonzero(_choose_traits(rng, encoding.continuous, np.full(len(positions), self.points)))
+        idx = encoding.trait_offsets[traits]
+        min_val, max_val = encoding.lower[traits], encoding.upper[traits]  # Determine interval boundaries.
+        # Mutate traits by sampling from Gaussian distribution centered around current value
+        # with `sigma_factor` scaled interval width as standard distribution.
+        # Make sure new values are within specified limits.
+        sigma = (max_val - min_val) * self.sigma_factor
+        positions[rows, idx] = np.clip(rng.normal(positions[rows, idx], sigma), min_val, max_val)
+        return positions
 
 
 class CrossoverUniform(Stochastic):  # uniform crossover
@@ -361,14 +542,45 @@ class CrossoverUniform(Stochastic):  # uniform crossover
         propulate.population.Individual
             The possibly cross-bred individual after application of the propagator.
         """
-        ind = copy.deepcopy(inds[0])  # Consider 1st parent.
-        ind.loss = float("inf")  # Initialize individual's loss attribute.
-        if self.rng.random() < self.probability:  # Apply propagator only with specified `probability`.
-            # Replace traits in first parent with values of second parent with specified relative parent contribution.
-            for k in ind.keys():
-                if self.rng.random() > self.rel_parent_contrib:
-                    ind[k] = inds[1][k]
-        return ind  # Return offspring.
+        return _apply_crossover(self, [inds], self._recombine)[0]  # Return offspring.
+
+    def apply_batch(self, batch: Sequence[List[Individual]]) -> List[Individual]:  # type: ignore[override]
+        """
+        Apply the uniform-crossover propagator to each of a batch of parent pairs at once.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual]]
+            The parent pairs the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The possibly cross-bred individuals, one per parent pair.
+        """
+        return _apply_crossover(self, batch, self._recombine)
+
+    def _recombine(self, batch: List[List[Individual]], encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+        """
+        Replace traits in first parent with values of second parent with specified relative parent contribution.
+
+        Parameters
+        ----------
+        batch : List[List[propulate.population.Individual]]
+            The parent pairs.
+        encoding : propulate.population.Encoding
+            The search space encoding.
+        rng : numpy.random.Generator
+            The random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The offspring positions, one row per parent pair.
+        """
+        replace = rng.random((len(batch), len(encoding.keys))) > self.rel_parent_contrib
+        first, second = np.stack([inds[0].position for inds in batch]), np.stack([inds[1].position for inds in batch])
+        return np.where(encoding.expand(replace), second, first)
 
 
 class CrossoverMultiple(Stochastic):  # uniform crossover
@@ -418,13 +630,47 @@ class CrossoverMultiple(Stochastic):  # uniform crossover
         propulate.population.Individual
             The possibly cross-bred individual after application of propagator
         """
-        ind = copy.deepcopy(inds[0])  # Consider 1st parent.
-        ind.loss = float("inf")  # Initialize individual's loss attribute.
-        if self.rng.random() < self.probability:  # Apply propagator only with specified `probability`.
-            # Choose traits from all parents with uniform probability.
-            for k in ind.keys():
-                ind[k] = self.rng.choice([parent[k] for parent in inds])
-        return ind  # Return offspring.
+        return _apply_crossover(self, [inds], self._recombine)[0]  # Return offspring.
+
+    def apply_batch(self, batch: Sequence[List[Individual]]) -> List[Individual]:  # type: ignore[override]
+        """
+        Apply the multi-crossover propagator to each of a batch of parent groups at once.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual]]
+            The parent groups the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The possibly cross-bred individuals, one per parent group.
+        """
+        return _apply_crossover(self, batch, self._recombine)
+
+    def _recombine(self, batch: List[List[Individual]], encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+        """
+        Choose traits from all parents with uniform probability.
+
+        Parameters
+        ----------
+        batch : List[List[propulate.population.Individual]]
+            The parent groups.
+        encoding : propulate.population.Encoding
+            The search space encoding.
+        rng : numpy.random.Generator
+            The random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The offspring positions, one row per parent group.
+        """
+        if len({len(inds) for inds in batch}) > 1:  # Parent groups of different sizes cannot be stacked.
+            return np.concatenate([self._recombine([inds], encoding, rng) for inds in batch])
+        parents = np.stack([np.stack([parent.position for parent in inds]) for inds in batch])
+        chosen = rng.integers(0, parents.shape[1], (len(batch), len(encoding.keys)))
+        return np.take_along_axis(parents, encoding.expand(chosen)[:, None, :], axis=1)[:, 0]
 
 
 class CrossoverSigmoid(Stochastic):
@@ -483,18 +729,45 @@ class CrossoverSigmoid(Stochastic):
         propulate.population.Individual
             The possibly cross-bred individual after application of the propagator.
         """
-        ind = copy.deepcopy(inds[0])  # Consider 1st parent.
-        ind.loss = float("inf")  # Initialize individual's loss attribute.
-        if inds[0].loss <= inds[1].loss:
-            delta = inds[0].loss - inds[1].loss
-            fraction = 1 / (1 + np.exp(-delta / self.temperature))
-        else:
-            delta = inds[1].loss - inds[0].loss
-            fraction = 1 - 1 / (1 + np.exp(-delta / self.temperature))
-
-        if self.rng.random() < self.probability:  # Apply propagator only with specified `probability`.
-            # Replace traits in 1st parent with values of 2nd parent with Boltzmann probability.
-            for k in inds[1].keys():
-                if self.rng.random() > fraction:
-                    ind[k] = inds[1][k]
-        return ind  # Return offspring.
+        return _apply_crossover(self, [inds], self._recombine)[0]  # Return offspring.
+
+    def apply_batch(self, batch: Sequence[List[Individual]]) -> List[Individual]:  # type: ignore[override]
+        """
+        Apply the sigmoid-crossover propagator to each of a batch of parent pairs at once.
+
+        Parameters
+        ----------
+        batch : Sequence[List[propulate.population.Individual]]
+            The parent pairs the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The possibly cross-bred individuals, one per parent pair.
+        """
+        return _apply_crossover(self, batch, self._recombine)
+
+    def _recombine(self, batch: List[List[Individual]], encoding: Encoding, rng: np.random.Generator) -> np.ndarray:
+        """
+        Replace traits in 1st parent with values of 2nd parent with Boltzmann probability.
+
+        Parameters
+        ----------
+        batch : List[List[propulate.population.Individual]]
+            The parent pairs.
+        encoding : propulate.population.Encoding
+            The search space encoding.
+        rng : numpy.random.Generator
+            The random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The offspring positions, one row per parent pair.
+        """
+        # The 1st parent's traits are kept with probability sigmoid((f1 - f2) / temperature).
+        delta = np.array([inds[0].loss - inds[1].loss for inds in batch])
+        fraction = 1 / (1 + np.exp(-delta / self.temperature))
+        replace = rng.random((len(batch), len(encoding.keys))) > fraction[:, None]
+        first, second = np.stack([inds[0].position for inds in batch]), np.stack([inds[1].position for inds in batch])
+        return np.where(encoding.expand(replace), second, first)
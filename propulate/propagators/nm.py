@@ -1,5 +1,6 @@
+import copy
 from random import Random
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
@@ -219,3 +220,33 @@ class ParallelNelderMead(Propagator):
 
         position = self.simplex[i].position + self.sigma * (self.simplex[i].position - self.simplex[0].position)
         return Individual(position, self.limits)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the propagator's internal state for checkpointing, including the current simplex, step, and generation.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The propagator's state.
+        """
+        state = super().state_dict()
+        state["generation"] = self.generation
+        state["step"] = self.step
+        state["simplex"] = copy.deepcopy(getattr(self, "simplex", None))  # Only set after the first simplex step
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the propagator's internal state, including the current simplex, step, and generation, from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        super().load_state_dict(state)
+        self.generation = state["generation"]
+        self.step = state["step"]
+        if state["simplex"] is not None:
+            self.simplex = copy.deepcopy(state["simplex"])
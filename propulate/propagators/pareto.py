@@ -0,0 +1,330 @@
+import random
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..population import Individual
+from .base import Propagator
+
+
+def non_dominated_sort(losses: np.ndarray) -> np.ndarray:
+    """
+    Sort points into fronts of mutual non-domination.
+
+    A point dominates another one if it is not worse in any objective and better in at least one. The first front holds
+    all points not dominated by any other point, i.e., the Pareto front, the second front all points only dominated by
+    points of the first one, and so on. The domination relation of all pairs of points is computed at once, after which
+    the fronts are peeled off one by one, each in a single vectorized step, see K. Deb et al., "A fast and elitist
+    multiobjective genetic algorithm: NSGA-II" https://doi.org/10.1109/4235.996017.
+
+    Parameters
+    ----------
+    losses : np.ndarray
+        The losses to be minimized, one row per point and one column per objective.
+
+    Returns
+    -------
+    np.ndarray
+        The index of each point's front, starting at zero for the Pareto front.
+    """
+    losses = np.asarray(losses, dtype=np.float64)
+    not_worse = np.all(losses[:, None, :] <= losses[None, :, :], axis=2)
+    better = np.any(losses[:, None, :] < losses[None, :, :], axis=2)
+    dominates = not_worse & better  # Entry (i, j) is True if point i dominates point j.
+    num_dominating = dominates.sum(axis=0)
+    fronts = np.full(len(losses), -1, dtype=np.int64)
+    front = np.flatnonzero(num_dominating == 0)
+    rank = 0
+    while len(front) > 0:
+        fronts[front] = rank
+        num_dominating -= dominates[front].sum(axis=0)
+        num_dominating[front] = -1  # Exclude already sorted points.
+        front = np.flatnonzero(num_dominating == 0)
+        rank += 1
+    return fronts
+
+
+def crowding_distance(losses: np.ndarray) -> np.ndarray:
+    """
+    Compute the crowding distance of the points of a front.
+
+    The crowding distance of a point is the sum over all objectives of the normalized distance between its two
+    neighbors along the objective. The extreme points of each objective are assigned an infinite distance so that they
+    are always retained.
+
+    Parameters
+    ----------
+    losses : np.ndarray
+        The finite losses of the front's points, one row per point and one column per objective.
+
+    Returns
+    -------
+    np.ndarray
+        The crowding distance of each point.
+    """
+    losses = np.asarray(losses, dtype=np.float64)
+    num = len(losses)
+    if num <= 2:
+        return np.full(num, np.inf)
+    order = np.argsort(losses, axis=0, kind="stable")
+    ordered = np.take_along_axis(losses, order, axis=0)
+    span = ordered[-1] - ordered[0]
+    gaps = np.empty_like(ordered)
+    gaps[1:-1] = (ordered[2:] - ordered[:-2]) / np.where(span > 0.0, span, 1.0)
+    gaps[[0, -1]] = np.inf
+    distance = np.zeros_like(losses)
+    np.put_along_axis(distance, order, gaps, axis=0)
+    return distance.sum(axis=1)
+
+
+def hypervolume(losses: np.ndarray, reference: Union[Sequence[float], np.ndarray]) -> float:
+    """
+    Compute the hypervolume dominated by a set of points and bounded by a reference point.
+
+    For two objectives, the points are swept in order of the first objective, which costs O(n log n). For more
+    objectives, the volume is sliced along the last objective and the slices' volumes are computed recursively.
+
+    Parameters
+    ----------
+    losses : np.ndarray
+        The losses to be minimized, one row per point and one column per objective.
+    reference : Sequence[float] | np.ndarray
+        The reference point, which should be dominated by all points of interest. Points not dominating it do not
+        contribute to the hypervolume.
+
+    Returns
+    -------
+    float
+        The hypervolume.
+    """
+    losses = np.asarray(losses, dtype=np.float64).reshape(len(losses), -1)
+    reference = np.asarray(reference, dtype=np.float64)
+    losses = losses[np.all(losses < reference, axis=1)]
+    if len(losses) == 0:
+        return 0.0
+    return _hypervolume(losses, reference)
+
+
+def _hypervolume(losses: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Compute the hypervolume of points all dominating the reference point.
+
+    Parameters
+    ----------
+    losses : np.ndarray
+        The losses, one row per point and one column per objective.
+    reference : np.ndarray
+        The reference point.
+
+    Returns
+    -------
+    float
+        The hypervolume.
+    """
+    if losses.shape[1] == 1:
+        return float(reference[0] - losses[:, 0].min())
+    if losses.shape[1] == 2:
+        x, y = losses[np.lexsort((losses[:, 1], losses[:, 0]))].T
+        # The slab between consecutive values of the first objective is bounded by the best second objective so far.
+        return float(np.sum((np.append(x[1:], reference[0]) - x) * (reference[1] - np.minimum.accumulate(y))))
+    losses = losses[np.argsort(losses[:, -1], kind="stable")]
+    depths = np.append(losses[1:, -1], reference[-1]) - losses[:, -1]
+    return float(sum(depth * _hypervolume(losses[: i + 1, :-1], reference[:-1]) for i, depth in enumerate(depths) if depth > 0.0))
+
+
+def hypervolume_contributions(losses: np.ndarray, reference: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+    """
+    Compute the hypervolume contribution of each point, i.e., the hypervolume lost when removing it from the set.
+
+    For two objectives, the contributions of a front of mutually non-dominated points are computed at once from the
+    neighbors of each point when sorted by the first objective. Otherwise, the hypervolume is recomputed without each
+    point.
+
+    Parameters
+    ----------
+    losses : np.ndarray
+        The losses to be minimized, one row per point and one column per objective.
+    reference : Sequence[float] | np.ndarray
+        The reference point.
+
+    Returns
+    -------
+    np.ndarray
+        The hypervolume contribution of each point.
+    """
+    losses = np.asarray(losses, dtype=np.float64).reshape(len(losses), -1)
+    reference = np.asarray(reference, dtype=np.float64)
+    if losses.shape[1] == 2 and np.all(non_dominated_sort(losses) == 0):
+        order = np.lexsort((losses[:, 1], losses[:, 0]))
+        x, y = np.minimum(losses[order], reference).T
+        contributions = np.empty(len(losses))
+        contributions[order] = (np.append(x[1:], reference[0]) - x) * (np.append(reference[1], y[:-1]) - y)
+        return contributions
+    total = hypervolume(losses, reference)
+    mask = np.ones(len(losses), dtype=bool)
+    contributions = np.empty(len(losses))
+    for i in range(len(losses)):
+        mask[i] = False
+        contributions[i] = total - hypervolume(losses[mask], reference)
+        mask[i] = True
+    return contributions
+
+
+def stack_losses(inds: List[Individual]) -> np.ndarray:
+    """
+    Collect the losses of all objectives of individuals.
+
+    Individuals without multi-objective losses, e.g., timed-out evaluations, are assigned their scalar loss in all
+    objectives. Failed evaluations with NaN losses are considered worst.
+
+    Parameters
+    ----------
+    inds : List[propulate.population.Individual]
+        The individuals.
+
+    Returns
+    -------
+    np.ndarray
+        The losses, one row per individual and one column per objective.
+    """
+    num_objectives = max((len(ind.losses) for ind in inds if ind.losses is not None), default=1)
+    losses = np.array(
+        [ind.losses if ind.losses is not None else np.full(num_objectives, ind.loss) for ind in inds], dtype=np.float64
+    ).reshape(len(inds), num_objectives)
+    losses[np.isnan(losses)] = np.inf
+    return losses
+
+
+class SelectPareto(Propagator):
+    """
+    Select a specified number of best performing individuals in terms of multiple objectives.
+
+    The individuals are sorted into fronts of mutual non-domination, which are selected in order until the next front
+    does not fit completely. The remaining individuals are chosen from this last front either by their crowding distance
+    as in NSGA-II, see K. Deb et al., "A fast and elitist multiobjective genetic algorithm: NSGA-II"
+    https://doi.org/10.1109/4235.996017, or by repeatedly discarding the individual contributing least to the front's
+    hypervolume as in SMS-EMOA, see N. Beume et al., "SMS-EMOA: Multiobjective selection based on dominated
+    hypervolume" https://doi.org/10.1016/j.ejor.2006.08.008.
+
+    Used in place of ``SelectMin`` in a composed propagator, e.g., the one returned by
+    ``propulate.utils.get_default_propagator()``, this yields a steady-state multi-objective evolutionary algorithm. It
+    can also be used as the emigration propagator.
+
+    Attributes
+    ----------
+    method : str
+        The criterion to choose individuals from the last selected front, either ``"crowding"`` or ``"hypervolume"``.
+    reference : np.ndarray, optional
+        The reference point for the hypervolume.
+
+    Methods
+    -------
+    __call__()
+        Apply the Pareto selection.
+
+    Notes
+    -----
+    The ``SelectPareto`` class inherits all methods and attributes from the ``Propagator`` class.
+
+    See Also
+    --------
+    :class:`Propagator` : The parent class.
+    """
+
+    def __init__(
+        self,
+        offspring: int,
+        method: str = "crowding",
+        reference: Optional[Union[Sequence[float], np.ndarray]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a Pareto selection propagator.
+
+        Parameters
+        ----------
+        offspring : int
+            The number of offspring (individuals to be selected).
+        method : str, optional
+            The criterion to choose individuals from the last selected front, either ``"crowding"`` for the crowding
+            distance or ``"hypervolume"`` for the hypervolume contribution. Default is ``"crowding"``.
+        reference : Sequence[float] | np.ndarray, optional
+            The reference point for the hypervolume. Default is the worst loss in each objective among the last front,
+            shifted by a tenth of the front's extent.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If the method is unknown.
+        """
+        super().__init__(-1, offspring, rng)
+        if method not in ("crowding", "hypervolume"):
+            raise ValueError(f"Unknown selection method {method}, use 'crowding' or 'hypervolume'.")
+        self.method = method
+        self.reference = None if reference is None else np.asarray(reference, dtype=np.float64)
+
+    def __call__(self, inds: List[Individual]) -> List[Individual]:
+        """
+        Apply the Pareto selection.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The input individuals the propagator is applied to.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The selected individuals, ordered by front.
+
+        Raises
+        ------
+        ValueError
+            If more individuals than put in shall be selected.
+        """
+        if len(inds) < self.offspring:
+            raise ValueError(f"Has to have at least {self.offspring} individuals to select the {self.offspring} best ones.")
+        losses = stack_losses(inds)
+        fronts = non_dominated_sort(losses)
+        order = np.argsort(fronts, kind="stable")
+        num_complete = int(np.searchsorted(fronts[order], fronts[order[self.offspring - 1]], side="left"))
+        selected = order[:num_complete].tolist()
+        last = order[num_complete : num_complete + int(np.sum(fronts == fronts[order[self.offspring - 1]]))]
+        selected += last[self._truncate(losses[last], self.offspring - num_complete)].tolist()
+        return [inds[i] for i in selected]
+
+    def _truncate(self, losses: np.ndarray, num: int) -> np.ndarray:
+        """
+        Choose the given number of points from a front.
+
+        Parameters
+        ----------
+        losses : np.ndarray
+            The losses of the front's points, one row per point and one column per objective.
+        num : int
+            The number of points to choose.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the chosen points.
+        """
+        if num == len(losses):
+            return np.arange(num)
+        # Non-finite losses, e.g., from timed-out evaluations, are moved just beyond the finite ones.
+        finite = np.isfinite(losses)
+        worst, best = np.where(finite, losses, -np.inf).max(axis=0), np.where(finite, losses, np.inf).min(axis=0)
+        worst, best = np.where(np.isfinite(worst), worst, 0.0), np.where(np.isfinite(best), best, 0.0)
+        losses = np.where(finite, losses, worst + np.maximum(worst - best, 1.0))
+        if self.method == "crowding":
+            return np.argsort(-crowding_distance(losses), kind="stable")[:num]
+        reference = self.reference
+        if reference is None:
+            low, high = losses.min(axis=0), losses.max(axis=0)
+            reference = high + 0.1 * np.where(high > low, high - low, 1.0)
+        remaining = np.arange(len(losses))
+        while len(remaining) > num:  # Discard the least contributing point and update the contributions.
+            remaining = np.delete(remaining, np.argmin(hypervolume_contributions(losses[remaining], reference)))
+        return remaining
@@ -0,0 +1,241 @@
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..population import Individual
+from .base import Propagator, _numpy_rng
+
+
+class Portfolio(Propagator):
+    """
+    Allocate breeding between a portfolio of propagators with a multi-armed bandit.
+
+    Each offspring is bred by one of the wrapped propagators, the arms of the bandit, and records the arm's index in its
+    ``operator`` attribute. Once evaluated, an offspring is credited with the fraction of the individuals evaluated
+    before it that it improves upon. As the offspring travel with the island's population, all workers of an island
+    derive the same statistics from their populations without additional communication, and breeding shifts to the
+    propagators currently producing improvements, wherever they were bred.
+
+    The arms are chosen by the upper confidence bound (UCB) on their mean credit or by Thompson sampling, see P. Auer et
+    al., "Finite-time Analysis of the Multiarmed Bandit Problem" https://doi.org/10.1023/A:1013689704352. Only the
+    ``window`` most recent offspring of each arm are considered so that the allocation follows the propagators'
+    changing productivity in the course of the optimization.
+
+    Attributes
+    ----------
+    exploration : float
+        The weight of the exploration term of the upper confidence bound.
+    pending : List[propulate.population.Individual]
+        The individuals currently being evaluated by other workers of the island, set by the ``Propulator`` and passed
+        on to the propagators accounting for them.
+    policy : str
+        The bandit policy, either ``"ucb"`` or ``"thompson"``.
+    propagators : List[propulate.propagators.Propagator]
+        The propagators to choose from, each breeding a single individual from the active population.
+    window : int
+        The number of most recent offspring per propagator to credit it with.
+
+    Methods
+    -------
+    __call__()
+        Breed an individual with the propagator chosen by the bandit.
+    breed_batch()
+        Breed several individuals at once.
+    statistics()
+        Get the number of credited offspring and the mean credit of each propagator.
+
+    Notes
+    -----
+    The ``Portfolio`` class inherits all methods and attributes from the ``Propagator`` class.
+
+    Offspring bred without a velocity are given a zero velocity, so that PSO-type propagators can continue from
+    individuals bred by other propagators.
+
+    See Also
+    --------
+    :class:`Propagator` : The parent class.
+    """
+
+    def __init__(
+        self,
+        propagators: Sequence[Propagator],
+        policy: str = "ucb",
+        exploration: float = 1.0,
+        window: int = 50,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a portfolio propagator.
+
+        Parameters
+        ----------
+        propagators : Sequence[propulate.propagators.Propagator]
+            The propagators to choose from, each breeding a single individual from the active population, e.g., the
+            default genetic propagator, PSO, CMA-ES, or Nelder-Mead, each with its own initialization.
+        policy : str, optional
+            The bandit policy, either ``"ucb"`` for the upper confidence bound or ``"thompson"`` for Thompson sampling.
+            Default is ``"ucb"``.
+        exploration : float, optional
+            The weight of the exploration term of the upper confidence bound. Default is 1.0.
+        window : int, optional
+            The number of most recent offspring per propagator to credit it with. Default is 50.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If no propagators are given, the policy is unknown, or the window is not positive.
+        """
+        super().__init__(parents=-1, offspring=1, rng=rng)
+        if len(propagators) == 0:
+            raise ValueError("The portfolio needs at least one propagator.")
+        if policy not in ("ucb", "thompson"):
+            raise ValueError(f"Unknown bandit policy {policy}, use 'ucb' or 'thompson'.")
+        if window < 1:
+            raise ValueError("The window has to contain at least one offspring.")
+        self.propagators = list(propagators)
+        self.policy = policy
+        self.exploration = exploration
+        self.window = window
+        self.pending: List[Individual] = []
+        # Credit of evaluated offspring by (birth island, worker rank, generation), derived from the population
+        self._credits: Dict[Tuple[int, int, int], Tuple[float, int, float]] = {}
+
+    def __call__(self, inds: List[Individual]) -> Individual:
+        """
+        Breed an individual with the propagator chosen by the bandit.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The active individuals of the island.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The bred individual.
+        """
+        return self.breed_batch(inds, 1)[0]  # type: ignore[return-value]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Breed several individuals at once, each with the propagator chosen by the bandit.
+
+        Arms chosen for earlier individuals of the batch count as pulled without credit yet, which spreads the batch
+        over promising arms. Propagators accounting for pending individuals are passed those of the other workers and
+        the individuals bred by other arms earlier in the batch.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The active individuals of the island.
+        k : int
+            The number of individuals to breed.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The bred individuals.
+        """
+        counts, means = self.statistics(inds)
+        successes = counts * means
+        rng = _numpy_rng(self.rng)
+        arms = np.empty(k, dtype=np.int64)
+        for i in range(k):
+            if self.policy == "thompson":
+                score = rng.beta(1.0 + successes, 1.0 + counts - successes)
+            else:
+                total = max(counts.sum(), 1.0)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    score = np.where(
+                        counts > 0, successes / counts + self.exploration * np.sqrt(2.0 * math.log(total) / counts), np.inf
+                    )
+            best = np.flatnonzero(score == score.max())
+            arms[i] = best[0] if len(best) == 1 else rng.choice(best)  # Break ties at random.
+            counts[arms[i]] += 1.0
+
+        offspring: Dict[int, Individual] = {}
+        for arm in np.unique(arms).tolist():
+            idx = np.flatnonzero(arms == arm).tolist()
+            self.propagators[arm].set_pending(self.pending + list(offspring.values()))
+            for i, ind in zip(idx, self.propagators[arm].breed_batch(inds, len(idx))):
+                assert isinstance(ind, Individual)
+                ind.operator = arm
+                if ind.velocity is None:
+                    ind.velocity = np.zeros_like(ind.position)
+                offspring[i] = ind
+        return [offspring[i] for i in range(k)]
+
+    def statistics(self, inds: List[Individual]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the number of credited offspring and the mean credit of each propagator.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The active individuals of the island.
+
+        Returns
+        -------
+        np.ndarray
+            The number of each propagator's most recent offspring within the window.
+        np.ndarray
+            The mean credit of these offspring, i.e., the mean fraction of previously evaluated individuals they
+            improved upon. Zero for propagators without credited offspring.
+        """
+        self._update_credits(inds)
+        num_arms = len(self.propagators)
+        counts, means = np.zeros(num_arms), np.zeros(num_arms)
+        if len(self._credits) == 0:
+            return counts, means
+        evaltimes, arms, credits = (np.array(column) for column in zip(*self._credits.values()))
+        arms = arms.astype(np.int64)
+        order = np.argsort(-evaltimes, kind="stable")  # Most recent first
+        arms, credits = arms[order], credits[order]
+        # Position of each offspring among the offspring of its arm, counted from the most recent one
+        recent = np.zeros(len(arms), dtype=np.int64)
+        for arm in range(num_arms):
+            mask = arms == arm
+            recent[mask] = np.arange(mask.sum())
+        keep = recent < self.window
+        counts = np.bincount(arms[keep], minlength=num_arms).astype(np.float64)
+        sums = np.bincount(arms[keep], weights=credits[keep], minlength=num_arms)
+        means = np.divide(sums, counts, out=np.zeros(num_arms), where=counts > 0)
+        return counts, means
+
+    def _update_credits(self, inds: List[Individual]) -> None:
+        """
+        Credit the offspring that have been evaluated since the last update, and forget those no longer in the population.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The active individuals of the island.
+        """
+        evaltimes = np.array([ind.evaltime for ind in inds], dtype=np.float64)
+        losses = np.array([ind.loss for ind in inds], dtype=np.float64)
+        losses[np.isnan(losses)] = np.inf  # Failed evaluations are worst.
+        credits: Dict[Tuple[int, int, int], Tuple[float, int, float]] = {}
+        new: List[int] = []
+        for idx, ind in enumerate(inds):
+            if not 0 <= ind.operator < len(self.propagators) or not np.isfinite(ind.evaltime):
+                continue
+            key = (ind.island, ind.rank, ind.generation)
+            if key in self._credits:
+                credits[key] = self._credits[key]
+            elif key not in credits:
+                credits[key] = (ind.evaltime, ind.operator, np.nan)
+                new.append(idx)
+        if len(new) > 0:
+            # Fraction of the individuals evaluated before each new offspring that it improves upon, counting ties half
+            earlier = evaltimes[None, :] < evaltimes[new, None]
+            better = (losses[None, :] > losses[new, None]) + 0.5 * (losses[None, :] == losses[new, None])
+            num_earlier = earlier.sum(axis=1)
+            improved = np.divide((earlier * better).sum(axis=1), num_earlier, out=np.full(len(new), 0.5), where=num_earlier > 0)
+            for idx, credit in zip(new, improved.tolist()):
+                ind = inds[idx]
+                credits[(ind.island, ind.rank, ind.generation)] = (ind.evaltime, ind.operator, credit)
+        self._credits = credits
@@ -1,12 +1,30 @@
 from random import Random
-from typing import Dict, List, MutableMapping, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
-from ..population import Individual
+from ..population import Encoding, Individual
 from ..propagators import Propagator, Stochastic
 
 
+def _limits_as_array(limits: Dict[str, Tuple[float, float]]) -> np.ndarray:
+    """
+    Get the limits of the particles' positions, i.e., transformed for parameters with ``Transformed`` limits.
+
+    Parameters
+    ----------
+    limits : Dict[str, Tuple[float, float]]
+        The borders of the continuous search domain.
+
+    Returns
+    -------
+    np.ndarray
+        The lower and upper limits of each parameter, shape (2, number of parameters).
+    """
+    encoding = Encoding(limits)
+    return np.array([encoding.lower, encoding.upper])
+
+
 class BasicPSO(Propagator):
     """
     This propagator implements the most basic PSO variant one possibly could think of.
@@ -87,7 +105,7 @@ class BasicPSO(Propagator):
         self.rank = rank
         self.limits = limits
         self.rng = rng
-        self.limits_as_array: np.ndarray = np.array(list(limits.values())).T
+        self.limits_as_array: np.ndarray = _limits_as_array(limits)
 
     def __call__(self, individuals: List[Individual]) -> Individual:
         """
@@ -175,16 +193,13 @@ class BasicPSO(Propagator):
         propulate.population.Individual
             The new ``Individual`` object resulting from the PSO update step.
         """
-        new_p = Individual(
+        return Individual(
             position,
             self.limits,
             velocity=velocity,
             generation=generation,
             rank=self.rank,
         )
-        for i, k in enumerate(self.limits):
-            new_p[k] = new_p.position[i]
-        return new_p
 
 
 class VelocityClampingPSO(BasicPSO):
@@ -518,7 +533,7 @@ class InitUniformPSO(Stochastic):
         """
         super().__init__(parents, 1, probability, rng)
         self.limits = limits
-        self.limits_as_array = np.array(list(limits.values())).T
+        self.limits_as_array = _limits_as_array(limits)
         if isinstance(v_init_limit, np.ndarray):
             assert v_init_limit.shape[-1] == self.limits_as_array.shape[-1]
         self.v_limits = v_init_limit
@@ -546,14 +561,9 @@ class InitUniformPSO(Stochastic):
 
             particle = Individual(position, self.limits, velocity, rank=self.rank)  # Instantiate new particle.
 
-            for index, limit in enumerate(self.limits):
-                # Since Py 3.7, iterating over dicts is stable, so we can do the following.
-
+            for limit in self.limits:
                 if not isinstance(self.limits[limit][0], float):  # Check search space for validity
                     raise TypeError("PSO only works on continuous search spaces!")
-
-                # Randomly sample from specified limits for each trait.
-                particle[limit] = particle.position[index]
             return particle
         else:
             particle = individuals[0]
@@ -645,12 +655,10 @@ class StatelessPSO(Propagator):
         if len(own_p) > 0:
             old_p = max(own_p, key=lambda p: p.generation)
         else:  # No own particle found in given parameters, thus creating new one.
-            initial_p: MutableMapping[str, float] = dict()
-            for k in self.limits:
-                initial_p[k] = self.rng.uniform(*self.limits[k])
-            # NOTE complains about incompatible type when it should not?
+            # Randomly sample from specified limits for each trait.
+            position = np.array([self.rng.uniform(low, high) for low, high in _limits_as_array(self.limits).T])
             old_p = Individual(
-                initial_p,  # type:ignore
+                position,
                 limits=self.limits,
                 generation=0,
                 rank=self.rank,
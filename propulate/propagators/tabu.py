@@ -0,0 +1,222 @@
+import random
+from typing import List, Mapping, Optional, Set, Tuple, Union
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ..population import Encoding, Individual
+from .base import Propagator
+
+
+class Tabu(Propagator):
+    """
+    Re-breed proposals of a propagator that duplicate already evaluated individuals.
+
+    The positions of the island's evaluated individuals are kept in an index. Each proposal of the wrapped propagator is
+    checked against this index, against the individuals currently being evaluated by other workers of the island, and
+    against the other proposals of the same batch. Colliding proposals are bred again, up to ``max_retries`` times,
+    after which the last proposal is accepted anyway.
+
+    Two positions collide if they are identical, or, for a positive ``epsilon``, if they differ by at most ``epsilon``
+    times the extent of the limits in each trait. Identical positions are found via a hash set. Near-duplicates are
+    found via a logarithmic number of k-d trees of geometrically decreasing size. New positions form a new tree, which is
+    merged with the next larger ones as long as they are not more than twice as large, so that each position is only
+    rebuilt into a logarithmic number of trees.
+
+    Attributes
+    ----------
+    encoding : propulate.population.Encoding
+        The vector encoding of the search space.
+    epsilon : float
+        The relative distance in each trait up to which positions collide.
+    max_retries : int
+        The maximum number of times to breed a colliding proposal again.
+    pending : List[propulate.population.Individual]
+        The individuals currently being evaluated by other workers of the island, set by the ``Propulator``.
+    propagator : propulate.propagators.Propagator
+        The wrapped propagator, breeding a single individual from the active population.
+    rejected : int
+        The number of colliding proposals bred again.
+
+    Methods
+    -------
+    __call__()
+        Breed an individual not colliding with known positions.
+    breed_batch()
+        Breed several individuals at once.
+
+    Notes
+    -----
+    The ``Tabu`` class inherits all methods and attributes from the ``Propagator`` class.
+
+    See Also
+    --------
+    :class:`Propagator` : The parent class.
+    """
+
+    def __init__(
+        self,
+        propagator: Propagator,
+        limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]],
+        epsilon: float = 0.0,
+        max_retries: int = 10,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a tabu propagator.
+
+        Parameters
+        ----------
+        propagator : propulate.propagators.Propagator
+            The propagator to wrap, breeding a single individual from the active population.
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The search space, i.e., the limits of (hyper-)parameters to be optimized.
+        epsilon : float, optional
+            The relative distance in each trait up to which positions collide, as a fraction of the extent of the
+            trait's limits. Default is 0.0, i.e., only identical positions collide.
+        max_retries : int, optional
+            The maximum number of times to breed a colliding proposal again. Default is 10.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If ``epsilon`` or ``max_retries`` is negative.
+        """
+        super().__init__(parents=-1, offspring=1, rng=rng)
+        if epsilon < 0.0:
+            raise ValueError("The collision distance epsilon has to be non-negative.")
+        if max_retries < 0:
+            raise ValueError("The maximum number of retries has to be non-negative.")
+        self.propagator = propagator
+        self.encoding = Encoding(limits)
+        self.epsilon = epsilon
+        self.max_retries = max_retries
+        self.pending: List[Individual] = []
+        self.rejected = 0
+
+        # Scale each entry of the position by the extent of its trait's limits. One-hot entries are not scaled.
+        encoding = self.encoding
+        self._scale = np.ones(encoding.size)
+        ranged = ~(encoding.categorical | encoding.ordinal)
+        self._scale[encoding.trait_offsets[ranged]] = encoding.upper[ranged] - encoding.lower[ranged]
+        for trait in np.flatnonzero(encoding.ordinal):
+            self._scale[encoding.trait_offsets[trait]] = np.ptp(np.asarray(limits[encoding.keys[trait]], dtype=np.float64))
+        self._scale[self._scale <= 0.0] = 1.0
+
+        self._indexed: Set[Tuple[int, int, int]] = set()  # (birth island, worker rank, generation) of indexed individuals
+        self._hashes: Set[bytes] = set()  # Identical positions
+        self._trees: List[cKDTree] = []  # Scaled positions for near-duplicates, in order of decreasing size
+
+    def __call__(self, inds: List[Individual]) -> Individual:
+        """
+        Breed an individual not colliding with known positions.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The active individuals of the island.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The bred individual.
+        """
+        return self.breed_batch(inds, 1)[0]  # type: ignore[return-value]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Breed several individuals at once, none colliding with known positions or with each other.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The active individuals of the island.
+        k : int
+            The number of individuals to breed.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The bred individuals.
+        """
+        self._add(inds)
+        self.propagator.set_pending(self.pending)
+        offspring = self.propagator.breed_batch(inds, k)
+        todo = list(range(k))
+        for retry in range(self.max_retries + 1):
+            accepted = [ind for i, ind in enumerate(offspring) if i not in todo and isinstance(ind, Individual)] + self.pending
+            colliding = []
+            for i in todo:
+                ind = offspring[i]
+                assert isinstance(ind, Individual)
+                if self._known(ind.position) or any(self._collide(ind.position, other.position) for other in accepted):
+                    colliding.append(i)
+                else:
+                    accepted.append(ind)
+            todo = colliding
+            if len(todo) == 0 or retry == self.max_retries:
+                break
+            self.rejected += len(todo)
+            for i, ind in zip(todo, self.propagator.breed_batch(inds, len(todo))):
+                offspring[i] = ind
+        return offspring
+
+    def _add(self, inds: List[Individual]) -> None:
+        """
+        Add the positions of evaluated individuals not indexed yet to the index.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals.
+        """
+        new = [ind for ind in inds if (ind.island, ind.rank, ind.generation) not in self._indexed]
+        if len(new) == 0:
+            return
+        self._indexed.update((ind.island, ind.rank, ind.generation) for ind in new)
+        if self.epsilon == 0.0:
+            self._hashes.update(ind.position.tobytes() for ind in new)
+            return
+        self._trees.append(cKDTree(np.stack([ind.position for ind in new]) / self._scale))
+        while len(self._trees) > 1 and self._trees[-2].n <= 2 * self._trees[-1].n:
+            smaller = self._trees.pop()
+            self._trees[-1] = cKDTree(np.vstack([self._trees[-1].data, smaller.data]))
+
+    def _known(self, position: np.ndarray) -> bool:
+        """
+        Check whether a position collides with an indexed position.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The position.
+
+        Returns
+        -------
+        bool
+            True if the position collides with an indexed position, False if not.
+        """
+        if self.epsilon == 0.0:
+            return position.tobytes() in self._hashes
+        point, bound = position / self._scale, np.nextafter(self.epsilon, np.inf)
+        return any(np.isfinite(tree.query(point, k=1, p=np.inf, distance_upper_bound=bound)[0]) for tree in self._trees)
+
+    def _collide(self, position: np.ndarray, other: np.ndarray) -> bool:
+        """
+        Check whether two positions collide.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            The one position.
+        other : np.ndarray
+            The other position.
+
+        Returns
+        -------
+        bool
+            True if the positions collide, False if not.
+        """
+        return bool(np.max(np.abs(position - other) / self._scale) <= self.epsilon)
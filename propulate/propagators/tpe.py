@@ -0,0 +1,297 @@
+import math
+import random
+from typing import List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from scipy.special import logsumexp, ndtr, ndtri
+
+from ..population import Encoding, Individual
+from .base import InitUniform, Propagator, _numpy_rng
+
+
+class TreeParzenEstimator(Propagator):
+    """
+    Tree-structured Parzen estimator (TPE) propagator.
+
+    The evaluated individuals are split into the ``gamma`` fraction with the lowest losses and the rest. For each trait,
+    one Parzen estimator of its distribution is fitted to each group, i.e., a mixture of truncated Gaussians centered at
+    the individuals' values for continuous and integer traits, and smoothed category frequencies for categorical and
+    ordinal traits. Candidates are drawn from the estimators of the good individuals and the one maximizing the ratio of
+    the densities of the good and the other individuals is proposed, see J. Bergstra et al., "Algorithms for
+    Hyper-Parameter Optimization" https://papers.nips.cc/paper/4443-algorithms-for-hyper-parameter-optimization.
+
+    The estimators work directly on the individuals' positions, i.e., in transformed space for ``Transformed`` limits
+    and on the one-hot segments of categorical traits, and are vectorized over all traits, Gaussian components, and
+    candidates. Breeding costs O(n log n) for sorting the population and O(n) for evaluating the densities of a fixed
+    number of candidates.
+
+    Attributes
+    ----------
+    encoding : propulate.population.Encoding
+        The vector encoding of the search space.
+    gamma : float
+        The fraction of individuals with the lowest losses considered good.
+    init : propulate.propagators.Propagator
+        The propagator initializing individuals until ``initial_points`` individuals have been evaluated.
+    initial_points : int
+        The number of evaluated individuals to collect before fitting the estimators.
+    limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space, i.e., the limits of (hyper-)parameters to be optimized.
+    num_candidates : int
+        The number of candidates drawn per proposal.
+
+    Methods
+    -------
+    __call__()
+        Propose an individual.
+    breed_batch()
+        Propose several individuals at once.
+
+    Notes
+    -----
+    The ``TreeParzenEstimator`` class inherits all methods and attributes from the ``Propagator`` class.
+
+    See Also
+    --------
+    :class:`Propagator` : The parent class.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]],
+        gamma: float = 0.15,
+        initial_points: int = 10,
+        num_candidates: int = 24,
+        init: Optional[Propagator] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize a tree-structured Parzen estimator propagator.
+
+        Parameters
+        ----------
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The search space, i.e., the limits of (hyper-)parameters to be optimized.
+        gamma : float, optional
+            The fraction of individuals with the lowest losses considered good. Default is 0.15.
+        initial_points : int, optional
+            The number of evaluated individuals to collect before fitting the estimators. Default is 10.
+        num_candidates : int, optional
+            The number of candidates drawn per proposal. Default is 24.
+        init : propulate.propagators.Propagator, optional
+            The propagator initializing individuals until ``initial_points`` individuals have been evaluated. Default is
+            uniform random initialization.
+        rng : random.Random, optional
+            The separate random number generator for the Propulate optimization.
+
+        Raises
+        ------
+        ValueError
+            If ``gamma`` is not in :math:`(0, 1)` or fewer than two initial points are requested.
+        """
+        super().__init__(parents=-1, offspring=1, rng=rng)
+        if not 0.0 < gamma < 1.0:
+            raise ValueError("The fraction of good individuals gamma has to be in (0, 1).")
+        if initial_points < 2:
+            raise ValueError("At least two initial points are needed to split them into good and bad ones.")
+        self.limits = limits
+        self.encoding = Encoding(limits)
+        self.gamma = gamma
+        self.initial_points = initial_points
+        self.num_candidates = num_candidates
+        self.init = InitUniform(limits, rng=self.rng) if init is None else init
+
+        # Continuous and integer traits are modeled by Gaussian mixtures, integer ones on bins of unit width.
+        encoding = self.encoding
+        self._ranged = np.flatnonzero(~(encoding.categorical | encoding.ordinal))
+        integer = ~encoding.continuous[self._ranged]
+        self._lower = encoding.lower[self._ranged] - 0.5 * integer
+        self._upper = encoding.upper[self._ranged] + 0.5 * integer
+        # Categorical and ordinal traits are modeled by category frequencies.
+        self._discrete: List[Tuple[int, np.ndarray]] = [
+            (trait, np.asarray(limits[encoding.keys[trait]], dtype=np.float64) if encoding.ordinal[trait] else np.arange(width))
+            for trait, width in enumerate(encoding.widths.tolist())
+            if encoding.categorical[trait] or encoding.ordinal[trait]
+        ]
+
+    def __call__(self, inds: List[Individual]) -> Individual:
+        """
+        Propose an individual.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals to fit the estimators to.
+
+        Returns
+        -------
+        propulate.population.Individual
+            The proposed individual, or an initialized individual if fewer than ``initial_points`` have been evaluated.
+        """
+        return self.breed_batch(inds, 1)[0]  # type: ignore[return-value]
+
+    def breed_batch(self, inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        """
+        Propose several individuals at once, each the best of its own set of candidates.
+
+        Parameters
+        ----------
+        inds : List[propulate.population.Individual]
+            The evaluated individuals to fit the estimators to.
+        k : int
+            The number of individuals to propose.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The proposed individuals, or initialized individuals if fewer than ``initial_points`` have been evaluated.
+        """
+        if len(inds) < self.initial_points:
+            return self.init.breed_batch([], k)
+        rng = _numpy_rng(self.rng)
+        encoding = self.encoding
+        losses = np.array([ind.loss for ind in inds], dtype=np.float64)
+        losses[np.isnan(losses)] = np.inf  # Failed evaluations are bad.
+        positions = np.stack([ind.position for ind in inds])[np.argsort(losses, kind="stable")]
+        num_good = min(max(math.ceil(self.gamma * len(inds)), 1), len(inds) - 1)
+        good, bad = positions[:num_good], positions[num_good:]
+
+        num = k * self.num_candidates
+        candidates = np.zeros((num, encoding.size))
+        score = np.zeros(num)  # Log density ratio of good and bad individuals
+        if len(self._ranged) > 0:
+            idx = encoding.trait_offsets[self._ranged]
+            good_mixture = self._fit_mixture(good[:, idx])
+            values = self._sample_mixture(rng, *good_mixture, num)
+            candidates[:, idx] = values
+            score += (self._log_mixture(values, *good_mixture) - self._log_mixture(values, *self._fit_mixture(bad[:, idx]))).sum(
+                axis=1
+            )
+        for trait, values in self._discrete:
+            good_probs, bad_probs = self._frequencies(good, trait, values), self._frequencies(bad, trait, values)
+            category = rng.choice(len(values), size=num, p=good_probs)
+            offset = encoding.trait_offsets[trait]
+            if encoding.categorical[trait]:
+                candidates[np.arange(num), offset + category] = 1.0
+            else:
+                candidates[:, offset] = values[category]
+            score += np.log(good_probs[category]) - np.log(bad_probs[category])
+
+        best = np.argmax(score.reshape(k, self.num_candidates), axis=1) + self.num_candidates * np.arange(k)
+        return [Individual.from_encoding(position, encoding) for position in encoding.snap(candidates[best])]
+
+    def _fit_mixture(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fit the truncated Gaussian mixtures of all continuous and integer traits.
+
+        Each individual contributes one component, whose bandwidth is the larger distance to its neighbors. A wide
+        prior component at the center of the limits regularizes the estimate.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The traits' values, one row per individual.
+
+        Returns
+        -------
+        np.ndarray
+            The components' means, one row per component.
+        np.ndarray
+            The components' standard deviations, one row per component.
+        np.ndarray
+            The log of the components' probability mass within the limits, one row per component.
+        """
+        lower, upper = self._lower, self._upper
+        width = upper - lower
+        means = np.vstack([values, 0.5 * (lower + upper)])
+        order = np.argsort(means, axis=0)
+        ordered = np.take_along_axis(means, order, axis=0)
+        padded = np.vstack([lower, ordered, upper])
+        gaps = np.maximum(ordered - padded[:-2], padded[2:] - ordered)
+        stds = np.empty_like(means)
+        np.put_along_axis(stds, order, gaps, axis=0)
+        stds[-1] = width  # Prior component
+        stds = np.clip(stds, width / min(100.0, len(means) + 1.0), width)
+        mass = ndtr((upper - means) / stds) - ndtr((lower - means) / stds)
+        return means, stds, np.log(np.maximum(mass, 1e-300))
+
+    def _sample_mixture(
+        self, rng: np.random.Generator, means: np.ndarray, stds: np.ndarray, log_mass: np.ndarray, num: int
+    ) -> np.ndarray:
+        """
+        Draw values from the truncated Gaussian mixtures of all continuous and integer traits.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            The random number generator.
+        means : np.ndarray
+            The components' means, one row per component.
+        stds : np.ndarray
+            The components' standard deviations, one row per component.
+        log_mass : np.ndarray
+            The log of the components' probability mass within the limits, one row per component.
+        num : int
+            The number of values to draw per trait.
+
+        Returns
+        -------
+        np.ndarray
+            The values, one row per draw.
+        """
+        component = rng.integers(len(means), size=(num, means.shape[1]))
+        mean, std = np.take_along_axis(means, component, axis=0), np.take_along_axis(stds, component, axis=0)
+        # Inverse transform sampling within the limits
+        low, high = ndtr((self._lower - mean) / std), ndtr((self._upper - mean) / std)
+        unit = np.clip(low + rng.random(mean.shape) * (high - low), 1e-12, 1.0 - 1e-12)
+        return np.clip(mean + std * ndtri(unit), self._lower, self._upper)
+
+    @staticmethod
+    def _log_mixture(values: np.ndarray, means: np.ndarray, stds: np.ndarray, log_mass: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the log density of the truncated Gaussian mixtures of all continuous and integer traits.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values, one row per point.
+        means : np.ndarray
+            The components' means, one row per component.
+        stds : np.ndarray
+            The components' standard deviations, one row per component.
+        log_mass : np.ndarray
+            The log of the components' probability mass within the limits, one row per component.
+
+        Returns
+        -------
+        np.ndarray
+            The log densities, one row per point.
+        """
+        z = (values[:, None, :] - means) / stds
+        log_pdf = -0.5 * z**2 - np.log(stds) - 0.5 * np.log(2 * np.pi) - log_mass
+        return logsumexp(log_pdf, axis=1) - np.log(len(means))
+
+    def _frequencies(self, positions: np.ndarray, trait: int, values: np.ndarray) -> np.ndarray:
+        """
+        Estimate the category probabilities of a categorical or ordinal trait, smoothed by a uniform prior of weight one.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The individuals' positions, one row per individual.
+        trait : int
+            The trait's index.
+        values : np.ndarray
+            The trait's categories or values.
+
+        Returns
+        -------
+        np.ndarray
+            The probability of each category.
+        """
+        offset = self.encoding.trait_offsets[trait]
+        if self.encoding.categorical[trait]:  # Sum of the one-hot segments
+            counts = positions[:, offset : offset + len(values)].sum(axis=0)
+        else:
+            counts = np.bincount(np.abs(positions[:, offset, None] - values).argmin(axis=1), minlength=len(values))
+        return (counts + 1.0 / len(values)) / (len(positions) + 1.0)
@@ -1,25 +1,95 @@
 import copy
 import inspect
 import logging
-import os
 import pickle
 import random
+import signal
+import threading
 import time
 from operator import attrgetter
 from pathlib import Path
-from typing import Callable, Final, Generator, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Final, Generator, List, Optional, Tuple, Type, Union
 
 import deepdiff
 import numpy as np
 from mpi4py import MPI
 
-from ._globals import DUMP_TAG, INDIVIDUAL_TAG
+from ._globals import INDIVIDUAL_TAG, PENDING_TAG
+from .artifacts import ARTIFACT_KEY, PARENT_ARTIFACT_KEY, ArtifactStore
+from .checkpoint import (
+    AsyncCheckpointWriter,
+    CheckpointLog,
+    CheckpointPolicy,
+    HDF5CheckpointLog,
+    archive_checkpoints,
+    atomic_write,
+    load_island_population,
+    load_worker_state,
+    read_layout,
+    reshard_populations,
+    write_hdf5_population,
+    write_layout,
+)
 from .population import Individual
 from .propagators import Propagator, SelectMin
+from .propagators.pareto import non_dominated_sort, stack_losses
 from .surrogate import Surrogate
+from .warm_start import WarmStart
 
 log = logging.getLogger(__name__)  # Get logger instance.
 SURROGATE_KEY: Final[str] = "_s"  # Key for ``Surrogate`` data in ``Individual``
+_deadline: Optional[float] = None  # Wall-clock deadline of the running evaluation on this rank
+
+
+def evaluation_deadline() -> Optional[float]:
+    """
+    Return the wall-clock deadline of the loss function evaluation currently running on this rank.
+
+    Loss functions can poll the deadline to stop cooperatively once the ``eval_timeout`` of the ``Propulator`` is
+    exceeded. This is the only way to stop hanging plain loss functions of multi-rank workers, which are never
+    interrupted. Their ranks should agree on stopping at the same point, e.g., via
+    ``comm.allreduce(time.time() > propulate.evaluation_deadline(), op=MPI.LOR)``.
+
+    Returns
+    -------
+    float, optional
+        The deadline as seconds since the epoch, comparable to ``time.time()``. None if no evaluation with a time limit
+        is running.
+    """
+    return _deadline
+
+
+class _EvaluationTimeoutError(BaseException):
+    """
+    Raised inside a running loss function once its per-evaluation time limit is exceeded.
+
+    Derives from ``BaseException`` rather than ``Exception`` so that it is not swallowed by a generic
+    ``except Exception`` within the loss function.
+    """
+
+
+def _set_loss(ind: Individual, loss: Any) -> None:
+    """
+    Set an individual's loss from the value returned by the loss function.
+
+    Parameters
+    ----------
+    ind : propulate.population.Individual
+        The evaluated individual.
+    loss : float | Sequence[float] | np.ndarray
+        The loss, or the losses of all objectives for multi-objective optimization. The first objective is used as
+        the individual's scalar ``loss``.
+    """
+    if np.ndim(loss) == 0:
+        ind.loss, ind.losses = float(loss), None
+    else:
+        ind.losses = np.asarray(loss, dtype=np.float64).ravel()
+        ind.loss = float(ind.losses[0])
+
+
+def _raise_evaluation_timeout(signum: int, frame: object) -> None:
+    """Signal handler interrupting a loss function evaluation that exceeded its time limit."""
+    raise _EvaluationTimeoutError()
 
 
 class Propulator:
@@ -34,9 +104,13 @@ class Propulator:
     ----------
     checkpoint_path : str | pathlib.Path
         The path where checkpoints are loaded from and stored to.
+    artifact_store : propulate.artifacts.ArtifactStore, optional
+        The store for artifacts of evaluated individuals.
     emigration_propagator : Type[propulate.Propagator]
         The emigration propagator, i.e., how to choose individuals for emigration that are sent to the destination
         island. Should be some kind of selection operator.
+    eval_timeout : float, optional
+        The maximum wall-clock time in seconds a single evaluation of the loss function may take.
     generation : int
         The current generation.
     generations : int
@@ -55,18 +129,38 @@ class Propulator:
         The migration probability.
     migration_topology : np.ndarray
         The migration topology.
+    pending : Dict[Tuple[int, int], propulate.population.Individual]
+        The individuals other workers of the island are currently evaluating by their rank and generation. Only tracked
+        if the propagator or a nested one accounts for them in its ``pending`` attribute, e.g., ``BayesianOptimization``
+        within a ``Portfolio``.
     population : List[propulate.population.Individual]
         The population list of individuals on that island.
     propagator : propulate.Propagator
         The evolutionary operator.
     propulate_comm : MPI.Comm
         The Propulate world communicator, consisting of rank 0 of each worker's sub communicator.
+    ranks_per_candidate : Callable[[propulate.population.Individual], int], optional
+        The function determining the number of ranks to evaluate each candidate on.
     rng : random.Random
         The separate random number generator for the Propulate optimization.
+    seed_queue : List[propulate.population.Individual]
+        The warm-start seeds the worker evaluates again before breeding new individuals.
+    start_time : float
+        The time stamp at which the ``Propulator`` was set up. The time budget is measured from here.
     surrogate : propulate.surrogate.Surrogate, optional
         The local surrogate model.
+    time_budget : float, optional
+        The overall wall-clock time budget in seconds after which no new individuals are bred.
+    timeout_loss : float
+        The penalty loss recorded for individuals whose evaluation exceeded ``eval_timeout``.
+    worker_context : Any
+        The persistent worker context returned by ``worker_setup`` and passed to the loss function.
+    worker_setup : Callable[[MPI.Comm], Any], optional
+        The hook setting up the persistent worker context.
     worker_sub_comm : MPI.Comm
         The worker's internal communicator for parallelized evaluation of single individuals.
+    worker_teardown : Callable[[Any], None], optional
+        The hook releasing the persistent worker context.
 
     Methods
     -------
@@ -93,6 +187,17 @@ class Propulator:
         island_displs: Optional[np.ndarray] = None,
         island_counts: Optional[np.ndarray] = None,
         surrogate_factory: Optional[Callable[[], Surrogate]] = None,
+        time_budget: Optional[float] = None,
+        eval_timeout: Optional[float] = None,
+        timeout_loss: float = float("inf"),
+        worker_setup: Optional[Callable[[MPI.Comm], Any]] = None,
+        worker_teardown: Optional[Callable[[Any], None]] = None,
+        ranks_per_candidate: Optional[Callable[[Individual], int]] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        checkpoint_format: str = "pickle",
+        async_checkpointing: bool = True,
+        checkpoint_policy: Optional[CheckpointPolicy] = None,
+        warm_start: Optional[WarmStart] = None,
     ) -> None:
         """
         Initialize Propulator with given parameters.
@@ -100,7 +205,9 @@ class Propulator:
         Parameters
         ----------
         loss_fn : Union[Callable, Generator[float, None, None]]
-            The loss function to be minimized.
+            The loss function to be minimized. For multi-objective optimization, it returns a sequence of losses, which
+            are stored in the individual's ``losses``, while its ``loss`` is set to the first objective. Use a Pareto
+            selection like ``propulate.propagators.SelectPareto`` to breed on all objectives.
         propagator : propulate.propagators.Propagator
             The propagator to apply for breeding.
         rng : random.Random
@@ -135,8 +242,73 @@ class Propulator:
         surrogate_factory : Callable[[], propulate.surrogate.Surrogate], optional
            Function that returns a new instance of a ``Surrogate`` model.
            Only used when ``loss_fn`` is a generator function.
+        time_budget : float, optional
+            The overall wall-clock time budget in seconds, measured from the instantiation of the ``Propulator``. A
+            worker only breeds another individual if its longest evaluation so far still fits into the remaining
+            budget. The final synchronization and checkpoint are run afterward, so leave some slack to the job's
+            actual wall-clock limit. Default is None, i.e., no time budget.
+        eval_timeout : float, optional
+            The maximum wall-clock time in seconds a single evaluation of the loss function may take. Exceeding
+            evaluations are assigned ``timeout_loss``. Generator loss functions are checked and stopped after each
+            yield. Evaluations of single-rank workers are additionally interrupted via ``SIGALRM`` where available
+            (main thread on POSIX systems). The signal is only handled between Python bytecodes, i.e., it cannot
+            interrupt long-running calls into C extensions or MPI. Evaluations of multi-rank workers are never
+            interrupted, as the ranks could be hit at different points, e.g., inside a collective. Their generator loss
+            functions stop consistently on all ranks at the same yield, while their plain loss functions run to
+            completion and are penalized afterward if they exceeded the limit on any rank. Hence, a hanging plain loss
+            function of a multi-rank worker stalls its worker, unless it polls ``propulate.evaluation_deadline()`` and
+            stops itself. Generator loss functions are recommended for multi-rank workers. Default is None, i.e., no
+            timeout.
+        timeout_loss : float, optional
+            The penalty loss recorded for evaluations exceeding ``eval_timeout``. Default is ``inf``.
+        worker_setup : Callable[[MPI.Comm], Any], optional
+            Hook called once on each rank of each worker at the start of the optimization with the worker's sub
+            communicator. Its return value, the worker context, is passed to every call of ``loss_fn`` as additional
+            last positional argument, i.e., ``loss_fn(ind, ctx)`` or ``loss_fn(ind, subgroup_comm, ctx)`` for
+            multi-rank workers. Use it to build expensive resources like datasets, process groups, or compiled models
+            once per worker instead of once per evaluation. Default is None.
+        worker_teardown : Callable[[Any], None], optional
+            Hook called once on each rank of each worker at the end of the optimization with the worker context.
+            Default is None.
+        ranks_per_candidate : Callable[[propulate.population.Individual], int], optional
+            Function returning the number of ranks to evaluate a bred candidate on, e.g., derived from its
+            hyperparameters or an estimate of its cost. If given, the ranks of each worker's sub communicator form a
+            pool that is dynamically split into variable-size groups, each evaluating one candidate concurrently. The
+            loss function is then always called with the candidate's communicator, i.e., ``loss_fn(ind, comm)``.
+            Requests are clipped to the pool size. Not supported with surrogate models. Default is None, i.e., all
+            ranks of the worker evaluate each candidate together.
+        artifact_store : propulate.artifacts.ArtifactStore, optional
+            The store for artifacts of evaluated individuals, e.g., trained weights, enabling population-based training.
+            If given, the loss function finds the path to save the individual's artifact at under ``ind["_artifact"]``
+            and the path of the closest evaluated individual's artifact to warm-start from under
+            ``ind["_parent_artifact"]`` (None if there is none). Each worker deletes artifacts of its own individuals
+            that are inactive or not among the best active individuals of its island. Default is None.
+        checkpoint_format : str, optional
+            The checkpoint format, either ``"pickle"`` for logs of pickled individuals or ``"hdf5"`` for columnar HDF5
+            files, which can be analyzed without unpickling, e.g., via ``propulate.checkpoint.read_hdf5_columns()``.
+            With ``"hdf5"``, the final island checkpoint ``island_{idx}_ckpt.h5`` is written in parallel by all ranks of
+            the island if ``h5py`` is built with MPI support. Default is ``"pickle"``.
+        async_checkpointing : bool, optional
+            Whether checkpoints are written by a background thread of each worker, overlapping checkpoint I/O with the
+            evaluations. The final checkpoint waits for all pending writes. Default is True.
+        checkpoint_policy : propulate.checkpoint.CheckpointPolicy, optional
+            The policy determining when each worker dumps its checkpoint, e.g., every N seconds
+            (``IntervalCheckpointPolicy``), every K evaluated individuals (``VolumeCheckpointPolicy``), upon a signal
+            (``SignalCheckpointPolicy``, which also ends the optimization upon ``SIGTERM``), or only at the end
+            (``ShutdownCheckpointPolicy``). Policies can be combined via ``AnyCheckpointPolicy``. The final checkpoint is
+            always dumped. Default is None, i.e., dump after every generation.
+        warm_start : propulate.warm_start.WarmStart, optional
+            The results of previous studies to seed the initial population with if no checkpoint is resumed from. Seeds
+            are distributed over all islands and workers and either adopted with their previous losses or evaluated
+            again first. Default is None, i.e., the initial population is bred by the propagator.
+
+        Raises
+        ------
+        ValueError
+            If ``ranks_per_candidate`` is combined with a surrogate model or the checkpoint format is unknown.
         """
         # Set class attributes.
+        self.start_time = time.time()  # Reference time stamp for time budget
         self.loss_fn = loss_fn  # Callable loss function
         self.propagator = propagator  # Evolutionary propagator
         if generations == 0:  # If number of iterations requested == 0.
@@ -149,6 +321,24 @@ class Propulator:
         self.island_comm = island_comm  # Intra-island communicator
         self.propulate_comm = propulate_comm  # Propulate world communicator
         self.worker_sub_comm = worker_sub_comm  # Sub communicator for each (multi rank) worker
+        self.time_budget = time_budget  # Overall wall-clock time budget
+        self.eval_timeout = eval_timeout  # Wall-clock time limit for a single evaluation
+        self.timeout_loss = timeout_loss  # Penalty loss for timed-out evaluations
+        self.max_evalperiod = 0.0  # Longest evaluation duration on this worker so far
+        self.worker_setup = worker_setup  # Hook setting up the persistent worker context
+        self.worker_teardown = worker_teardown  # Hook releasing the persistent worker context
+        self.worker_context: Any = None  # Persistent worker context passed to the loss function
+        self.ranks_per_candidate = ranks_per_candidate  # Number of ranks to evaluate each candidate on
+        self.held_candidates: List[Tuple[Individual, int]] = []  # Bred candidates not fitting into last round, in order
+        self.artifact_store = artifact_store  # Store for artifacts of evaluated individuals
+        if self.ranks_per_candidate is not None and surrogate_factory is not None:
+            raise ValueError("Variable-size workers via `ranks_per_candidate` do not support surrogate models.")
+        if checkpoint_format not in ("pickle", "hdf5"):
+            raise ValueError(f"Unknown checkpoint format {checkpoint_format}, use 'pickle' or 'hdf5'.")
+        self.checkpoint_format = checkpoint_format  # Checkpoint file format
+        self.checkpoint_policy = CheckpointPolicy() if checkpoint_policy is None else checkpoint_policy
+        self.num_undumped = 0  # Number of individuals evaluated since the worker's last checkpoint dump
+        self.last_dump_time = self.start_time  # Time stamp of the worker's last checkpoint dump
 
         # Always initialize the ``Surrogate`` as the class attribute has to be set for ``None`` checks later.
         self.surrogate = None if surrogate_factory is None else surrogate_factory()
@@ -167,31 +357,135 @@ class Propulator:
 
         self.intra_requests: list[MPI.Request] = []  # Keep track of intra-island send requests.
         self.intra_buffers: list[Individual] = []  # Send buffers for intra-island communication
+        # Partition work such as a quasi-random initial design across all breeding workers, i.e., the leading ranks.
+        self.propagator.set_worker(self.propulate_comm.rank, self.propulate_comm.size)
+        # Share individuals with the island's workers already when bred if any nested propagator accounts for them.
+        self.share_pending = self.propagator.set_pending([])
+        self.pending: Dict[Tuple[int, int], Individual] = {}
+        self.latest_generations: Dict[int, int] = {}  # Latest generation evaluated by each worker of the island
 
         # Load initial population of evaluated individuals from checkpoint if exists.
-        load_ckpt_file = self.checkpoint_path / f"island_{self.island_idx}_ckpt.pickle"
-        if not os.path.isfile(load_ckpt_file):  # If not exists, check for backup file.
-            load_ckpt_file = load_ckpt_file.with_suffix(".bkp")
-
-        if os.path.isfile(load_ckpt_file):
-            with open(load_ckpt_file, "rb") as f:
-                try:
-                    self.population = pickle.load(f)
-                    self.generation = (
-                        max([x.generation for x in self.population if x.rank == self.island_comm.rank]) + 1
-                    )  # Determine generation to be evaluated next from population checkpoint.
-                    if self.island_comm.rank == 0:
-                        log.info(
-                            "Valid checkpoint file found. " f"Resuming from generation {self.generation} of loaded population..."
-                        )
-                except OSError:
-                    self.population = []
-                    if self.island_comm.rank == 0:
-                        log.info("No valid checkpoint file. Initializing population randomly...")
-        else:
-            self.population = []
+        checkpoint_log_type = HDF5CheckpointLog if self.checkpoint_format == "hdf5" else CheckpointLog
+        # Number of workers on each island of the current and the checkpointed run
+        island_sizes = [size for _, size in sorted(set(self.propulate_comm.allgather((self.island_idx, self.island_comm.size))))]
+        saved_island_sizes = self.propulate_comm.bcast(read_layout(self.checkpoint_path) if self.propulate_comm.rank == 0 else None)
+        resharded = saved_island_sizes is not None and saved_island_sizes != island_sizes
+        if resharded:  # Elastic restart with different layout
+            assert saved_island_sizes is not None
+            population = self._reshard(saved_island_sizes, island_sizes)
+        else:  # Read checkpoint only once per island and broadcast it to the island's workers.
+            population = self.island_comm.bcast(
+                load_island_population(self.checkpoint_path, self.island_idx, self.checkpoint_format)
+                if self.island_comm.rank == 0
+                else None
+            )
+        if self.propulate_comm.rank == 0:
+            write_layout(self.checkpoint_path, island_sizes)
+        self.population: List[Individual] = population
+        self.seed_queue: List[Individual] = []  # Warm-start seeds to evaluate again before breeding
+        seeded = len(self.population) == 0 and warm_start is not None
+        if seeded:  # Seed initial population with results of previous studies.
+            assert warm_start is not None
+            self._seed(warm_start, len(island_sizes))
+        elif len(self.population) > 0:
+            self.generation = (
+                max([x.generation for x in self.population if x.rank == self.island_comm.rank], default=-1) + 1
+            )  # Determine generation to be evaluated next from population checkpoint.
             if self.island_comm.rank == 0:
-                log.info("No valid checkpoint file given. Initializing population randomly...")
+                log.info("Valid checkpoint file found. " f"Resuming from generation {self.generation} of loaded population...")
+        elif self.island_comm.rank == 0:
+            log.info("No valid checkpoint file given. Initializing population randomly...")
+        # Append-only log of the population events this worker originates
+        self.checkpoint_log: Union[CheckpointLog, HDF5CheckpointLog, AsyncCheckpointWriter] = checkpoint_log_type(
+            self.checkpoint_path, self.island_idx, self.island_comm.rank
+        )
+        if async_checkpointing:  # Write checkpoint log in background thread.
+            self.checkpoint_log = AsyncCheckpointWriter(self.checkpoint_log)
+        if resharded or seeded:  # Checkpoint initial population from scratch, each worker the individuals it is breeder of.
+            for ind in self.population:
+                if ind.rank == self.island_comm.rank:
+                    self.checkpoint_log.record_individual(ind)
+            self.checkpoint_log.flush()
+        # Restore optimizer state, e.g., propagator internals and random number generator states, to resume exactly.
+        state = load_worker_state(self.checkpoint_path, self.island_idx, self.island_comm.rank)
+        if len(self.population) > 0 and state is not None:
+            self._load_state(state)
+        if self.artifact_store is not None:  # Track artifacts of own individuals from before a restart.
+            for ind in self.population:
+                if ind.island == self.island_idx and ind.rank == self.island_comm.rank:
+                    self.artifact_store.add(ind)
+
+    def _seed(self, warm_start: WarmStart, num_islands: int) -> None:
+        """
+        Seed the initial population with the results of previous studies.
+
+        The seeds are distributed round-robin over the islands and their workers. Seeds to be evaluated again are queued
+        for breeding by their worker, all others are added to the population with negative generations.
+
+        Parameters
+        ----------
+        warm_start : propulate.warm_start.WarmStart
+            The warm start providing the seeds.
+        num_islands : int
+            The number of islands.
+        """
+        assert self.propulate_comm is not None
+        seeds = self.propulate_comm.bcast(warm_start.seeds() if self.propulate_comm.rank == 0 else None)
+        for idx, seed in enumerate(seeds):
+            if idx % num_islands != self.island_idx:
+                continue
+            island_seed_idx = idx // num_islands
+            rank = island_seed_idx % self.island_comm.size
+            if idx < warm_start.reevaluate:
+                if rank == self.island_comm.rank:
+                    self.seed_queue.append(seed)
+                continue
+            seed.generation = -1 - island_seed_idx // self.island_comm.size  # Unique among the worker's seeds
+            seed.rank, seed.island, seed.current = rank, self.island_idx, rank
+            seed.migration_steps, seed.migration_history = 0, str(self.island_idx)
+            self.population.append(seed)
+        log.info(
+            f"Island {self.island_idx} Worker {self.island_comm.rank}: Warm-starting with {len(self.population)} seeds in "
+            f"island population and {len(self.seed_queue)} seeds to evaluate again..."
+        )
+
+    def _reshard(self, saved_island_sizes: List[int], island_sizes: List[int]) -> List[Individual]:
+        """
+        Load the populations of all islands of a checkpoint written with a different layout and reshard them.
+
+        Rank 0 of the Propulate world communicator reads the old checkpoint, reshards it, see
+        ``propulate.checkpoint.reshard_populations()``, and archives the old checkpoint files. Each island's population
+        is then sent to the island's worker 0 and broadcast within the island.
+
+        Parameters
+        ----------
+        saved_island_sizes : List[int]
+            The number of workers on each island of the checkpointed run.
+        island_sizes : List[int]
+            The number of workers on each island of the current run.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            This island's resharded population.
+        """
+        assert self.propulate_comm is not None
+        ranks = self.propulate_comm.gather((self.island_idx, self.island_comm.rank))  # Island and island rank of each worker
+        send = None
+        if self.propulate_comm.rank == 0:
+            assert ranks is not None
+            populations = [
+                load_island_population(self.checkpoint_path, island_idx, self.checkpoint_format)
+                for island_idx in range(len(saved_island_sizes))
+            ]
+            resharded = reshard_populations(populations, island_sizes)
+            archive_path = archive_checkpoints(self.checkpoint_path)
+            log.info(
+                f"Resharding checkpoint of {sum(len(p) for p in populations)} individuals from island sizes "
+                f"{saved_island_sizes} to {island_sizes}. Archived old checkpoint in {archive_path}."
+            )
+            send = [resharded[island_idx] if island_rank == 0 else None for island_idx, island_rank in ranks]
+        return self.island_comm.bcast(self.propulate_comm.scatter(send))
 
     def _get_active_individuals(self) -> Tuple[List[Individual], int]:
         """
@@ -207,6 +501,78 @@ class Propulator:
         active_pop = [ind for ind in self.population if ind.active]
         return active_pop, len(active_pop)
 
+    def _breed_offspring(self, generation: int, k: int = 1) -> List[Individual]:
+        """
+        Apply propagator to current population of active individuals to breed new individuals of this worker.
+
+        All individuals are bred with a single call of the propagator's ``breed_batch()``.
+
+        Parameters
+        ----------
+        generation : int
+            The generation to assign to the first new individual. The others are assigned the subsequent generations.
+        k : int, optional
+            The number of individuals to breed. Default is 1.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The newly bred individuals.
+        """
+        active_pop, _ = self._get_active_individuals()
+        if self.share_pending:
+            self.propagator.set_pending(list(self.pending.values()))
+        # Evaluate warm-start seeds again first, afterward breed new individuals from active population.
+        offspring: List[Union[List[Individual], Individual]] = list(self.seed_queue[:k])
+        del self.seed_queue[:k]
+        if len(offspring) < k:
+            offspring += self.propagator.breed_batch(active_pop, k - len(offspring))
+        for idx, ind in enumerate(offspring):
+            assert isinstance(ind, Individual)
+            ind.generation = generation + idx  # Set generation.
+            ind.rank = self.island_comm.rank  # Set worker rank.
+            ind.active = True  # If True, individual is active for breeding.
+            ind.island = self.island_idx  # Set birth island.
+            ind.current = self.island_comm.rank  # Set worker responsible for migration.
+            ind.migration_steps = 0  # Set number of migration steps performed.
+            ind.migration_history = str(self.island_idx)
+            if self.share_pending:
+                self._share_pending(ind)
+            self._assign_artifacts(ind, active_pop)
+        return offspring  # type: ignore[return-value]
+
+    def _share_pending(self, ind: Individual) -> None:
+        """
+        Send a newly bred, not yet evaluated individual to all other workers of the island.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The newly bred individual.
+        """
+        for r in range(self.island_comm.size):
+            if r == self.island_comm.rank:
+                continue
+            self.intra_buffers.append(copy.deepcopy(ind))
+            self.intra_requests.append(self.island_comm.isend(self.intra_buffers[-1], dest=r, tag=PENDING_TAG))
+
+    def _assign_artifacts(self, ind: Individual, active_pop: List[Individual]) -> None:
+        """
+        Pass the paths of the individual's own artifact and its parent's artifact to the loss function.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The newly bred individual.
+        active_pop : List[propulate.population.Individual]
+            The active individuals to choose the parent from.
+        """
+        if self.artifact_store is None:
+            return
+        parent = self.artifact_store.find_parent(ind, active_pop)
+        ind[ARTIFACT_KEY] = self.artifact_store.path_for(ind)
+        ind[PARENT_ARTIFACT_KEY] = None if parent is None else self.artifact_store.path_for(parent)
+
     def _breed(self) -> Individual:
         """
         Apply propagator to current population of active individuals to breed new individual.
@@ -220,16 +586,7 @@ class Propulator:
             self.propulate_comm is not None
         ):  # Only processes in the Propulate world communicator, consisting of rank 0 of each worker's sub
             # communicator, are involved in the actual optimization routine.
-            active_pop, _ = self._get_active_individuals()
-            ind = self.propagator(active_pop)  # Breed new individual from active population.
-            assert isinstance(ind, Individual)
-            ind.generation = self.generation  # Set generation.
-            ind.rank = self.island_comm.rank  # Set worker rank.
-            ind.active = True  # If True, individual is active for breeding.
-            ind.island = self.island_idx  # Set birth island.
-            ind.current = self.island_comm.rank  # Set worker responsible for migration.
-            ind.migration_steps = 0  # Set number of migration steps performed.
-            ind.migration_history = str(self.island_idx)
+            ind = self._breed_offspring(self.generation)[0]
         else:  # The other processes do not breed themselves.
             ind = None
 
@@ -240,67 +597,263 @@ class Propulator:
         assert isinstance(ind, Individual)
         return ind  # Return new individual.
 
+    def _interrupt_available(self) -> bool:
+        """
+        Check whether running loss function evaluations can be interrupted via ``SIGALRM`` on this process.
+
+        Returns
+        -------
+        bool
+            True if interval timers are supported and Propulate runs in the main thread, False if not.
+        """
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    def _loss_fn_args(self, ind: Individual, comm: MPI.Comm) -> Tuple[Any, ...]:
+        """
+        Assemble the positional arguments the loss function is called with.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual to evaluate.
+        comm : MPI.Comm
+            The communicator of the ranks evaluating the individual.
+
+        Returns
+        -------
+        Tuple[Any, ...]
+            The individual, followed by the communicator for multi-rank evaluations and the worker context if a
+            ``worker_setup`` hook is given.
+        """
+        args: Tuple[Any, ...] = (ind,)
+        if comm != MPI.COMM_SELF:
+            args += (comm,)
+        if self.worker_setup is not None:
+            args += (self.worker_context,)
+        return args
+
+    def _setup_worker(self) -> None:
+        """Set up the persistent worker context on all ranks of the worker via the ``worker_setup`` hook."""
+        if self.worker_setup is not None:
+            self.worker_context = self.worker_setup(self.worker_sub_comm)
+
+    def _teardown_worker(self) -> None:
+        """Release the persistent worker context on all ranks of the worker via the ``worker_teardown`` hook."""
+        if self.worker_teardown is not None:
+            self.worker_teardown(self.worker_context)
+        self.worker_context = None
+
     def _evaluate_individual(self) -> None:
         """Breed and evaluate individual."""
+        if self.ranks_per_candidate is not None:
+            self._evaluate_candidates()
+            return
         ind = self._breed()  # Breed new individual.
         start_time = time.time()  # Start evaluation timer.
+        timed_out = self._evaluate(ind, self.worker_sub_comm)
+        self.max_evalperiod = max(self.max_evalperiod, time.time() - start_time)
+        if self.propulate_comm is None:
+            return
+        ind.evaltime = time.time()  # Stop evaluation timer.
+        ind.evalperiod = ind.evaltime - start_time  # Calculate evaluation duration.
+        self._share_individual(ind, timed_out)
+
+    def _evaluate(self, ind: Individual, comm: MPI.Comm) -> bool:
+        """
+        Evaluate the loss of an individual on all ranks of the given communicator.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual to evaluate. Its loss is set in place.
+        comm : MPI.Comm
+            The communicator of the ranks evaluating the individual.
+
+        Returns
+        -------
+        bool
+            True if the evaluation exceeded the time limit, False if not.
+        """
+        start_time = time.time()  # Start evaluation timer.
 
         # Signal start of run to surrogate model.
         if self.surrogate is not None:
             self.surrogate.start_run(ind)
 
-        # Check if ``loss_fn`` is generator, prerequisite for surrogate model.
-        if inspect.isgeneratorfunction(self.loss_fn):
-
-            def loss_gen(individual: Individual) -> Generator[float, None, None]:
-                if self.worker_sub_comm != MPI.COMM_SELF:
-                    # NOTE mypy complains here. no idea why
-                    for x in self.loss_fn(individual, self.worker_sub_comm):  # type: ignore
-                        yield x
-                else:
+        is_generator = inspect.isgeneratorfunction(self.loss_fn)
+        # Arm hard time limit for evaluation. Multi-rank evaluations are not interrupted, as the signal could hit their
+        # ranks at different points, e.g., inside a collective, so that the ranks could no longer stop consistently.
+        # Single-rank candidates of variable-size workers are evaluated on a split communicator of size one.
+        interrupt = self.eval_timeout is not None and self._interrupt_available() and comm.size == 1
+        if interrupt:
+            assert self.eval_timeout is not None
+            previous_handler = signal.signal(signal.SIGALRM, _raise_evaluation_timeout)
+            signal.setitimer(signal.ITIMER_REAL, self.eval_timeout)
+        timed_out = False
+        global _deadline
+        if self.eval_timeout is not None:  # Publish deadline for loss functions stopping cooperatively.
+            _deadline = start_time + self.eval_timeout
+
+        try:
+            # Check if ``loss_fn`` is generator, prerequisite for surrogate model.
+            if is_generator:
+
+                def loss_gen(individual: Individual) -> Generator[float, None, None]:
                     # NOTE mypy complains here. no idea why
-                    for x in self.loss_fn(individual):  # type: ignore
+                    for x in self.loss_fn(*self._loss_fn_args(individual, comm)):  # type: ignore
                         yield x
 
-            last = float("inf")
-            for idx, last in enumerate(loss_gen(ind)):
-                log.debug(
-                    f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation} -- Individual loss iteration {idx}: Value {last}"
-                )
-                if self.surrogate is not None:
-                    if self.surrogate.cancel(last):  # Check cancel for each yield.
+                last = float("inf")
+                for idx, last in enumerate(loss_gen(ind)):
+                    if self.island_comm is not None:  # Only a worker's leading rank belongs to the island communicator.
                         log.debug(
-                            f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: PRUNING\n"
-                            f"{ind}"
+                            f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation} -- Individual loss iteration {idx}: Value {last}"
                         )
-                        break
-            ind.loss = float(last)  # Set final loss as individual's loss.
-        else:
-            # Define local ``loss_fn`` for parallelized evaluation.
-            def loss_fn(individual: Individual) -> float:
-                if self.worker_sub_comm != MPI.COMM_SELF:
-                    # NOTE this is not a generator, but mypy thinks it is
-                    return self.loss_fn(individual, self.worker_sub_comm)  # type: ignore
-                else:
+                    if self.eval_timeout is not None:  # Check time limit for each yield.
+                        timed_out = time.time() - start_time > self.eval_timeout
+                        if comm.size > 1:  # Let rank 0 decide for all ranks evaluating the individual.
+                            timed_out = comm.bcast(timed_out, root=0)
+                        if timed_out:
+                            break
+                    if self.surrogate is not None:
+                        cancel = self.surrogate.cancel(last)
+                        if comm.size > 1:  # Only rank 0 holds the synchronized surrogate and decides for all.
+                            cancel = comm.bcast(cancel, root=0)
+                        if cancel:  # Check cancel for each yield.
+                            if self.island_comm is not None:
+                                log.debug(
+                                    f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: PRUNING\n"
+                                    f"{ind}"
+                                )
+                            break
+                _set_loss(ind, last)  # Set final loss as individual's loss.
+            else:
+                # Define local ``loss_fn`` for parallelized evaluation.
+                def loss_fn(individual: Individual) -> float:
                     # NOTE this is not a generator, but mypy thinks it is
-                    return self.loss_fn(individual)  # type: ignore
+                    return self.loss_fn(*self._loss_fn_args(individual, comm))  # type: ignore
+
+                _set_loss(ind, loss_fn(ind))  # Evaluate its loss.
+            if interrupt:  # Disarm time limit.
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        except _EvaluationTimeoutError:
+            timed_out = True
+        finally:
+            _deadline = None
+            if interrupt:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+
+        if self.eval_timeout is not None and not is_generator and comm.size > 1:
+            # Penalize completed evaluations that exceeded the time limit on any rank evaluating the individual.
+            timed_out = comm.allreduce(time.time() - start_time > self.eval_timeout, op=MPI.LOR)
+        if timed_out:
+            ind.loss, ind.losses = float(self.timeout_loss), None  # Record penalty loss.
+
+        # Add final value to surrogate. Timed-out runs are incomplete and thus not used to update the surrogate.
+        if self.surrogate is not None and not timed_out:
+            self.surrogate.update(ind.loss)
+        return timed_out
 
-            ind.loss = float(loss_fn(ind))  # Evaluate its loss.
+    def _evaluate_candidates(self) -> None:
+        """
+        Breed a round of candidates and evaluate them concurrently on variable-size groups of the worker's ranks.
+
+        The worker's rank 0 breeds as many candidates at once as could fit into the worker's pool of ranks, i.e., one
+        per rank, and packs them greedily into the pool in order, using as many ranks for each candidate as
+        ``ranks_per_candidate`` requests. The candidates not fitting into the remaining ranks are held back for the next
+        round, where they go first. Each candidate is evaluated on its own communicator split from the worker's sub
+        communicator and consumes one generation. The round ends once all its candidates have been evaluated.
+        """
+        assert self.ranks_per_candidate is not None
+        pool_size = self.worker_sub_comm.size
+        candidates: Optional[List[Tuple[Individual, int]]] = None
+        if self.worker_sub_comm.rank == 0:
+            candidates = []
+            remaining = self.generations - self.generation if self.generations > -1 else pool_size
+            active_pop, _ = self._get_active_individuals()
+            for ind, _ in self.held_candidates:  # Parent artifacts may have been deleted meanwhile.
+                self._assign_artifacts(ind, active_pop)
+            # Held-back candidates take the next generations, the newly bred ones the subsequent generations.
+            num_bred = min(remaining, pool_size) - len(self.held_candidates)
+            if num_bred > 0:
+                for ind in self._breed_offspring(self.generation + len(self.held_candidates), num_bred):
+                    # Clip requested number of ranks to size of worker's pool.
+                    self.held_candidates.append((ind, min(max(int(self.ranks_per_candidate(ind)), 1), pool_size)))
+            free = pool_size
+            while len(self.held_candidates) > 0 and self.held_candidates[0][1] <= free:
+                candidates.append(self.held_candidates.pop(0))
+                free -= candidates[-1][1]
+            log.debug(
+                f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: "
+                f"Evaluating {len(candidates)} candidate(s) on {[ranks for _, ranks in candidates]} of {pool_size} ranks."
+            )
+        candidates = self.worker_sub_comm.bcast(candidates, root=0)
+        assert candidates is not None
+
+        # Assign consecutive ranks of the worker's pool to each candidate.
+        color, offset = MPI.UNDEFINED, 0
+        for idx, (_, ranks) in enumerate(candidates):
+            if offset <= self.worker_sub_comm.rank < offset + ranks:
+                color = idx
+            offset += ranks
+        candidate_comm = self.worker_sub_comm.Split(color, key=self.worker_sub_comm.rank)
+
+        start_time = time.time()  # Start evaluation timer.
+        result = None
+        if color != MPI.UNDEFINED:
+            ind = candidates[color][0]
+            timed_out = self._evaluate(ind, candidate_comm)
+            if candidate_comm.rank == 0:
+                evaltime = time.time()
+                result = (color, ind.loss, ind.losses, evaltime, evaltime - start_time, timed_out)
+            candidate_comm.Free()
+        results = self.worker_sub_comm.gather(result, root=0)
+        self.max_evalperiod = max(self.max_evalperiod, time.time() - start_time)
+        # Each candidate consumes one generation. The last one is accounted for by the caller.
+        self.generation += len(candidates) - 1
 
-        # Add final value to surrogate.
-        if self.surrogate is not None:
-            self.surrogate.update(ind.loss)
         if self.propulate_comm is None:
             return
-        ind.evaltime = time.time()  # Stop evaluation timer.
-        ind.evalperiod = ind.evaltime - start_time  # Calculate evaluation duration.
+        assert results is not None
+        for res in results:
+            if res is None:
+                continue
+            idx, loss, losses, evaltime, evalperiod, timed_out = res
+            ind = candidates[idx][0]
+            ind.loss, ind.losses, ind.evaltime, ind.evalperiod = loss, losses, evaltime, evalperiod
+            self._share_individual(ind, timed_out)
+
+    def _share_individual(self, ind: Individual, timed_out: bool) -> None:
+        """
+        Add an evaluated individual to the worker-local population and send it to all other workers of the island.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The evaluated individual.
+        timed_out : bool
+            Whether the individual's evaluation exceeded the time limit.
+        """
+        for key in (ARTIFACT_KEY, PARENT_ARTIFACT_KEY):
+            if key in ind:
+                # Remove artifact paths from individual as ``__eq__`` fails otherwise. They are derived from its identity.
+                del ind[key]
         self.population.append(ind)  # Add evaluated individual to worker-local population.
+        if self.artifact_store is not None:
+            self.artifact_store.add(ind)
+            self.artifact_store.collect_garbage(self.population, self.island_idx, self.island_comm.rank)
+        if timed_out:
+            log.warning(
+                f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {ind.generation}: "
+                f"Evaluation exceeded time limit of {self.eval_timeout} s. Assigned penalty loss {self.timeout_loss}."
+            )
         log.debug(
-            f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: BREEDING\n"
+            f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {ind.generation}: BREEDING\n"
             f"Bred and evaluated individual {ind}."
         )
 
-        if self.surrogate is not None:
+        if self.surrogate is not None and not timed_out:
             # Add surrogate model data to individual for synchronization.
             ind[SURROGATE_KEY] = self.surrogate.data()
 
@@ -311,9 +864,11 @@ class Propulator:
             self.intra_buffers.append(copy.deepcopy(ind))
             self.intra_requests.append(self.island_comm.isend(self.intra_buffers[-1], dest=r, tag=INDIVIDUAL_TAG))
 
-        if self.surrogate is not None:
+        if SURROGATE_KEY in ind:
             # Remove data from individual again as ``__eq__`` fails otherwise.
             del ind[SURROGATE_KEY]
+        self.checkpoint_log.record_individual(ind)  # Record new individual for checkpointing.
+        self.num_undumped += 1
 
     def _receive_intra_island_individuals(self) -> None:
         """Check for and possibly receive incoming individuals evaluated by other workers within own island."""
@@ -341,12 +896,27 @@ class Propulator:
                     del ind_temp[SURROGATE_KEY]
 
                 self.population.append(ind_temp)  # Add received individual to own worker-local population.
+                if self.share_pending:
+                    self.latest_generations[ind_temp.rank] = max(
+                        self.latest_generations.get(ind_temp.rank, -1), ind_temp.generation
+                    )
 
                 log_string += f"Added individual {ind_temp} from W{stat.Get_source()} to own population.\n"
+        if self.share_pending:
+            self._receive_pending()
         _, n_active = self._get_active_individuals()
         log_string += f"After probing within island: {n_active}/{len(self.population)} active."
         log.debug(log_string)
 
+    def _receive_pending(self) -> None:
+        """Receive the individuals other workers of the island have bred and forget those evaluated in the meantime."""
+        stat = MPI.Status()
+        while self.island_comm.iprobe(source=MPI.ANY_SOURCE, tag=PENDING_TAG, status=stat):
+            ind = self.island_comm.recv(source=stat.Get_source(), tag=PENDING_TAG)
+            self.pending[(ind.rank, ind.generation)] = ind
+        # Messages with different tags may overtake each other, so a pending individual may arrive after its result.
+        self.pending = {key: ind for key, ind in self.pending.items() if key[1] > self.latest_generations.get(key[0], -1)}
+
     def _send_emigrants(self) -> None:
         """
         Perform migration, i.e., island sends individuals out to other islands.
@@ -416,6 +986,38 @@ class Propulator:
             synchronized = False
         return synchronized
 
+    def _continue_breeding(self) -> bool:
+        """
+        Determine whether this worker breeds and evaluates another individual.
+
+        A worker stops once it has completed the requested number of generations, if a time budget is set, once
+        its longest evaluation so far would no longer fit into the remaining budget, or once its checkpoint policy
+        asks to stop, e.g., upon a ``SIGTERM``.
+
+        Returns
+        -------
+        bool
+            True if the worker should continue, False if not.
+        """
+        proceed = self.generations <= -1 or self.generation < self.generations
+        if self.time_budget is not None:
+            if proceed and time.time() - self.start_time + self.max_evalperiod > self.time_budget:
+                proceed = False
+                if self.propulate_comm is not None:
+                    log.info(
+                        f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: "
+                        f"Time budget of {self.time_budget} s exhausted. Stop breeding."
+                    )
+        if proceed and self.propulate_comm is not None and self.checkpoint_policy.should_stop():
+            proceed = False
+            log.info(
+                f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: "
+                f"Checkpoint policy requested to stop. Stop breeding."
+            )
+        if self.worker_sub_comm != MPI.COMM_SELF:  # Let worker's rank 0 decide for all its ranks.
+            proceed = self.worker_sub_comm.bcast(proceed, root=0)
+        return proceed
+
     def propulate(self, logging_interval: int = 10, debug: int = -1) -> None:
         """
         Execute evolutionary algorithm in parallel.
@@ -435,21 +1037,25 @@ class Propulator:
         """
         if self.worker_sub_comm != MPI.COMM_SELF:
             self.generation = self.worker_sub_comm.bcast(self.generation, root=0)
+        self._setup_worker()  # Set up persistent worker context.
         if self.propulate_comm is None:
-            while self.generations <= -1 or self.generation < self.generations:
+            self.checkpoint_policy.start()  # Handle signals like the worker's rank 0, which decides when to stop.
+            while self._continue_breeding():
                 # Breed and evaluate individual.
                 self._evaluate_individual()
                 self.generation += 1
+            self.checkpoint_policy.stop()
+            self._teardown_worker()  # Release persistent worker context.
             return
 
         if self.island_comm.rank == 0:
             log.info(f"Island {self.island_idx} has {self.island_comm.size} workers.")
 
-        dump = True if self.island_comm.rank == 0 else False
+        self.checkpoint_policy.start()  # E.g., install signal handlers.
         self.propulate_comm.barrier()
 
         # Loop over generations.
-        while self.generations <= -1 or self.generation < self.generations:
+        while self._continue_breeding():
             if self.generation % int(logging_interval) == 0:
                 log.info(f"Island {self.island_idx} Worker {self.island_comm.rank}: In generation {self.generation}...")
 
@@ -462,14 +1068,14 @@ class Propulator:
             # Clean up requests and buffers.
             self._intra_send_cleanup()
 
-            if dump:  # Dump checkpoint.
+            if self._determine_worker_dumping_next():  # Dump checkpoint according to checkpoint policy.
                 self._dump_checkpoint()
 
-            dump = self._determine_worker_dumping_next()  # Determine worker dumping checkpoint in the next generation.
-
             # Go to next generation.
             self.generation += 1
 
+        self._teardown_worker()  # Release persistent worker context.
+
         # Having completed all generations, the workers have to wait for each other.
         # Once all workers are done, they should check for incoming messages once again
         # so that each of them holds the complete final population and the found optimum
@@ -484,11 +1090,8 @@ class Propulator:
         self._receive_intra_island_individuals()
         self.propulate_comm.barrier()
 
-        # Final checkpointing on rank 0.
-        if self.island_comm.rank == 0:
-            self._dump_final_checkpoint()  # Dump checkpoint.
-        self.propulate_comm.barrier()
-        _ = self._determine_worker_dumping_next()
+        # Final checkpointing.
+        self._dump_final_checkpoint()  # Dump checkpoint.
         self.propulate_comm.barrier()
 
     def _intra_send_cleanup(self) -> None:
@@ -499,46 +1102,75 @@ class Propulator:
         self.intra_requests = [r for i, r in enumerate(self.intra_requests) if i not in completed]
         self.intra_buffers = [b for i, b in enumerate(self.intra_buffers) if i not in completed]
 
+    def _state(self) -> Dict[str, Any]:
+        """
+        Get this worker's optimizer state for checkpointing.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The states of the propagator, the surrogate model, and the random number generators.
+        """
+        return {
+            "propagator": self.propagator.state_dict(),
+            "surrogate": None if self.surrogate is None else self.surrogate.state_dict(),
+            "rng": self.rng.getstate(),
+            "numpy_rng": np.random.get_state(),
+        }
+
+    def _load_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore this worker's optimizer state from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The optimizer state as returned by ``_state()``.
+        """
+        self.propagator.load_state_dict(state["propagator"])
+        if self.surrogate is not None and state["surrogate"] is not None:
+            self.surrogate.load_state_dict(state["surrogate"])
+        self.rng.setstate(state["rng"])
+        np.random.set_state(state["numpy_rng"])
+
     def _dump_checkpoint(self) -> None:
-        """Dump checkpoint to file."""
+        """Append the population events this worker originated since the last dump to its checkpoint log."""
         log.debug(
             f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: " f"Dumping checkpoint..."
         )
-        save_ckpt_file = self.checkpoint_path / f"island_{self.island_idx}_ckpt.pickle"
-        if os.path.isfile(save_ckpt_file):
-            try:
-                os.replace(save_ckpt_file, save_ckpt_file.with_suffix(".bkp"))
-            except OSError as e:
-                log.warning(e)
-        with open(save_ckpt_file, "wb") as f:
-            pickle.dump(self.population, f)
-
-        dest = self.island_comm.rank + 1 if self.island_comm.rank + 1 < self.island_comm.size else 0
-        self.island_comm.send(True, dest=dest, tag=DUMP_TAG)
+        self.checkpoint_log.record_state(self._state())
+        self.checkpoint_log.flush()
+        self.num_undumped, self.last_dump_time = 0, time.time()
 
     def _determine_worker_dumping_next(self) -> bool:
-        """Determine the worker who dumps the checkpoint in the next generation."""
-        dump = False
-        stat = MPI.Status()
-        probe_dump = self.island_comm.iprobe(source=MPI.ANY_SOURCE, tag=DUMP_TAG, status=stat)
-        if probe_dump:
-            dump = self.island_comm.recv(source=stat.Get_source(), tag=DUMP_TAG)
-            log.debug(
-                f"Island {self.island_idx} Worker {self.island_comm.rank} Generation {self.generation}: "
-                f"Going to dump next: {dump}. Before: Worker {stat.Get_source()}"
-            )
-        return dump
+        """
+        Determine whether this worker dumps its checkpoint after the current generation.
+
+        As each worker only appends the events it originated to its own checkpoint log, the workers decide
+        independently according to the checkpoint policy without coordination.
+
+        Returns
+        -------
+        bool
+            True if the worker dumps its checkpoint, False if not.
+        """
+        return self.checkpoint_policy.should_dump(self.num_undumped, time.time() - self.last_dump_time)
 
     def _dump_final_checkpoint(self) -> None:
-        """Dump final checkpoint."""
+        """Dump final checkpoint, i.e., flush the checkpoint log and write the full population of the island."""
+        self.checkpoint_policy.stop()  # E.g., restore signal handlers.
+        self.checkpoint_log.record_state(self._state())
+        self.checkpoint_log.flush()
+        if isinstance(self.checkpoint_log, AsyncCheckpointWriter):
+            self.checkpoint_log.close()  # Wait for pending background writes.
+        if self.checkpoint_format == "hdf5":  # Write full population in parallel if possible.
+            write_hdf5_population(self.checkpoint_path / f"island_{self.island_idx}_ckpt.h5", self.population, self.island_comm)
+            return
+        if self.island_comm.rank != 0:
+            return
         save_ckpt_file = self.checkpoint_path / f"island_{self.island_idx}_ckpt.pickle"
-        if os.path.isfile(save_ckpt_file):
-            try:
-                os.replace(save_ckpt_file, save_ckpt_file.with_suffix(".bkp"))
-            except OSError as e:
-                log.warning(e)
-            with open(save_ckpt_file, "wb") as f:
-                pickle.dump(self.population, f)
+        # Write to temporary file first so that a crash never leaves a truncated checkpoint, keep old one as backup.
+        atomic_write(save_ckpt_file, pickle.dumps(self.population), save_ckpt_file.with_suffix(".bkp"))
 
     def _check_for_duplicates(self, active: bool, debug: int = 1) -> Tuple[List[List[Union[Individual, int]]], List[Individual]]:
         """
@@ -597,7 +1229,8 @@ class Propulator:
         Returns
         -------
         List[List[propulate.population.Individual] | propulate.population.Individual]
-            The top-n best individuals on each island.
+            The top-n best individuals on each island. For multi-objective losses, the individuals of each island's
+            Pareto front instead, ordered by the first objective.
         """
         if self.propulate_comm is None:
             return None
@@ -627,7 +1260,17 @@ class Propulator:
                     f"individuals active ({len(occurrences)} unique)"
                 )
         self.propulate_comm.barrier()
-        if debug == 0:
+        best: Union[Individual, List[Individual]]
+        if any(ind.losses is not None for ind in self.population):  # Report the Pareto front of multiple objectives.
+            unique_pop = self._get_unique_individuals()
+            fronts = non_dominated_sort(stack_losses(unique_pop))
+            best = sorted([ind for ind, front in zip(unique_pop, fronts) if front == 0], key=attrgetter("loss"))
+            if self.island_comm.rank == 0 and debug > 0:
+                res_str = f"Pareto front of {len(best)} individual(s) on island {self.island_idx}:\n"
+                for i, ind in enumerate(best):
+                    res_str += f"({i+1}): {ind}\n"
+                log.info(res_str)
+        elif debug == 0:
             best = min(self.population, key=attrgetter("loss"))
             if self.island_comm.rank == 0:
                 log.info(f"Top result on island {self.island_idx}: {best}")
@@ -1,5 +1,6 @@
+import copy
 import random
-from typing import Any, Dict, Tuple, TypeVar, Union
+from typing import Any, Dict, List, Tuple, TypeVar, Union
 
 import GPy
 import numpy as np
@@ -141,6 +142,30 @@ class Surrogate:
         """
         raise NotImplementedError()
 
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the surrogate model's internal state for checkpointing.
+
+        The base implementation returns a copy of all attributes. Override it if some of them are not picklable.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The surrogate model's state.
+        """
+        return copy.deepcopy(vars(self))
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the surrogate model's internal state from a checkpoint.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        vars(self).update(copy.deepcopy(state))
+
 
 class StaticSurrogate(Surrogate):
     """
@@ -585,3 +610,231 @@ class DynamicSurrogate(Surrogate):
 
         # Return the latest loss value as all other values are already shared.
         return (self.history_X[-1], self.history_Y[-1])
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Get the surrogate model's internal state for checkpointing.
+
+        GPy models cannot be copied reliably, so the history and the fitted parameters of the global model are stored
+        instead. The local model only lives during a single run and is not stored.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The surrogate model's state.
+        """
+        return {
+            "history_X": self.history_X.copy(),
+            "history_Y": self.history_Y.copy(),
+            "first_run": self.first_run,
+            "max_idx": self.max_idx,
+            "allowed_loss_margin": self.allowed_loss_margin,
+            "global_parameters": None if self.global_gpr is None else self.global_gpr.param_array.copy(),
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the surrogate model's internal state from a checkpoint, rebuilding the global model.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state as returned by ``state_dict()``.
+        """
+        self.history_X = state["history_X"].copy()
+        self.history_Y = state["history_Y"].copy()
+        self.first_run = state["first_run"]
+        self.max_idx = state["max_idx"]
+        self.allowed_loss_margin = state["allowed_loss_margin"]
+        self.global_gpr = None
+        if state["global_parameters"] is not None:
+            self.global_gpr = GPy.models.GPRegression(self.history_X, self.history_Y, self.global_kernel)
+            self.global_gpr[:] = state["global_parameters"]
+
+
+class ASHASurrogate(Surrogate):
+    """
+    Surrogate model implementing asynchronous successive halving (ASHA) with optional Hyperband brackets.
+
+    Each yield of the loss function counts as one unit of resource, e.g., one epoch. Rungs are placed at geometrically
+    increasing resources ``min_resource * reduction_factor**k``. When a run reaches a rung, its interim loss is recorded
+    there and the run is only continued, i.e., promoted to the next rung, if its loss is among the best
+    ``1 / reduction_factor`` of all losses recorded at this rung so far. As long as fewer than ``reduction_factor``
+    losses have been recorded at a rung, runs are always promoted.
+
+    Rung records are exchanged via the regular intra-island synchronization, i.e., promotion decisions of each worker
+    are based on the rung records of all finished or stopped runs on its island. Merging just adds the incoming records
+    to the rungs and is thus commutative.
+
+    With ``brackets > 1``, runs are assigned to Hyperband brackets round-robin by their generation. Bracket ``s`` starts
+    stopping runs only at resource ``min_resource * reduction_factor**s``, which hedges against too aggressive early
+    stopping. Each bracket keeps its own rungs.
+
+    Loosely based on the paper:
+    A System for Massively Parallel Hyperparameter Tuning
+    https://arxiv.org/abs/1810.05934
+
+    Attributes
+    ----------
+    min_resource : int
+        The resource, i.e., number of yields, at the first rung.
+    reduction_factor : int
+        The reduction factor eta. Only the best ``1 / reduction_factor`` of the runs at a rung are promoted.
+    brackets : int
+        The number of Hyperband brackets.
+    rungs : Dict[Tuple[int, int], List[float]]
+        The losses recorded at each rung, keyed by bracket and resource.
+    bracket : int
+        The bracket of the current run.
+    resource : int
+        The resource consumed by the current run so far.
+    current_run : List[Tuple[Tuple[int, int], float]]
+        The rung records of the current run.
+
+    Methods
+    -------
+    __init__()
+        Override the parent class's constructor to include the successive halving parameters.
+    start_run()
+        Reset the consumed resource and assign the run to a bracket.
+    update()
+        Do nothing as rung records are collected in ``cancel()``.
+    cancel()
+        Record the loss at a rung and stop the run if it is not among the best ``1 / reduction_factor`` there.
+    merge()
+        Add incoming rung records to the rungs.
+    data()
+        Return the rung records of the current run.
+
+    Notes
+    -----
+    The ``ASHASurrogate`` class implements all methods from the ``Surrogate`` class.
+
+    See Also
+    --------
+    :class:`Surrogate` : The parent class.
+    """
+
+    def __init__(self, min_resource: int = 1, reduction_factor: int = 3, brackets: int = 1) -> None:
+        """
+        Initialize an ASHA surrogate with empty rungs.
+
+        Parameters
+        ----------
+        min_resource : int, optional
+            The resource, i.e., number of yields, at the first rung. Default is 1.
+        reduction_factor : int, optional
+            The reduction factor eta. Default is 3.
+        brackets : int, optional
+            The number of Hyperband brackets. Default is 1, i.e., plain ASHA.
+
+        Raises
+        ------
+        ValueError
+            If ``min_resource`` or ``brackets`` is smaller than 1 or ``reduction_factor`` is smaller than 2.
+        """
+        if min_resource < 1 or brackets < 1:
+            raise ValueError("Minimum resource and number of brackets must be at least 1.")
+        if reduction_factor < 2:
+            raise ValueError("Reduction factor must be at least 2.")
+        self.min_resource = min_resource
+        self.reduction_factor = reduction_factor
+        self.brackets = brackets
+        self.rungs: Dict[Tuple[int, int], List[float]] = {}
+        self.bracket: int = 0
+        self.resource: int = 0
+        self.current_run: List[Tuple[Tuple[int, int], float]] = []
+
+    def _is_rung(self, resource: int) -> bool:
+        """
+        Check whether the given resource is a rung of the current run's bracket.
+
+        Parameters
+        ----------
+        resource : int
+            The resource consumed so far.
+
+        Returns
+        -------
+        bool
+            True if the resource is a rung, False otherwise.
+        """
+        rung = self.min_resource * self.reduction_factor**self.bracket
+        while rung < resource:
+            rung *= self.reduction_factor
+        return rung == resource
+
+    def start_run(self, ind: Individual) -> None:
+        """
+        Reset the consumed resource and assign the run to a bracket.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual containing the current configuration.
+        """
+        self.resource = 0
+        self.bracket = max(ind.generation, 0) % self.brackets
+        self.current_run = []
+
+    def update(self, loss: float) -> None:
+        """
+        Do nothing as all rung records of the current run are collected in ``cancel()``.
+
+        Parameters
+        ----------
+        loss : float
+            The (unused) final loss of the current run.
+        """
+        return
+
+    def cancel(self, loss: float) -> bool:
+        """
+        Record the loss if the run reached a rung and stop it if it is not among the best runs at this rung.
+
+        Parameters
+        ----------
+        loss : float
+            The next interim loss of the current run.
+
+        Returns
+        -------
+        bool
+            True if the current run is cancelled, False otherwise.
+        """
+        self.resource += 1
+        if not self._is_rung(self.resource):
+            return False
+
+        key = (self.bracket, self.resource)
+        recorded = self.rungs.setdefault(key, [])
+        recorded.append(float(loss))
+        self.current_run.append((key, float(loss)))
+        if len(recorded) < self.reduction_factor:  # Promote while there are too few runs to compare with.
+            return False
+        # Promote only if among the best ``1 / reduction_factor`` of the losses recorded at this rung.
+        num_promoted = len(recorded) // self.reduction_factor
+        return bool(loss > np.partition(np.asarray(recorded), num_promoted - 1)[num_promoted - 1])
+
+    def merge(self, data: List[Tuple[Tuple[int, int], float]]) -> None:
+        """
+        Add the rung records of another run to the rungs.
+
+        Parameters
+        ----------
+        data : List[Tuple[Tuple[int, int], float]]
+            The rung records of the incoming run.
+        """
+        for (bracket, resource), loss in data:
+            self.rungs.setdefault((bracket, resource), []).append(loss)
+
+    def data(self) -> List[Tuple[Tuple[int, int], float]]:
+        """
+        Return the rung records of the current run.
+
+        Returns
+        -------
+        List[Tuple[Tuple[int, int], float]]
+            The rung records of the current run as (bracket, resource) keys and losses.
+        """
+        return list(self.current_run)
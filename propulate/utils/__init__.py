@@ -36,6 +36,7 @@ def get_default_propagator(
     random_init_prob: float = 0.1,
     sigma_factor: float = 0.05,
     rng: Optional[random.Random] = None,
+    init: Optional[Propagator] = None,
 ) -> Propagator:
     """
     Get Propulate's default evolutionary optimization propagator.
@@ -57,6 +58,9 @@ def get_default_propagator(
         Default is 0.05.
     rng : random.Random, optional
         The separate random number generator for the Propulate optimization.
+    init : propagators.Propagator, optional
+        The propagator initializing individuals while the breeding population is still smaller than ``pop_size``, e.g.,
+        ``InitQuasiRandom`` for a globally stratified initial design. Default is uniform random sampling.
 
     Returns
     -------
@@ -86,7 +90,8 @@ def get_default_propagator(
             ]
         )
 
-    init = InitUniform(limits, rng=rng)
+    if init is None:
+        init = InitUniform(limits, rng=rng)
     propagator = Conditional(pop_size, propagator, init)  # Initialize random if population size < specified `pop_size`.
     return propagator
 
@@ -0,0 +1,214 @@
+import logging
+import math
+import pickle
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .checkpoint import load_island_population, read_hdf5_population
+from .population import Individual
+
+log = logging.getLogger(__name__)  # Get logger instance.
+
+
+def load_results(source: Union[str, Path, Sequence[Individual]]) -> List[Individual]:
+    """
+    Load the evaluated individuals of a previous study.
+
+    Parameters
+    ----------
+    source : str | pathlib.Path | Sequence[propulate.population.Individual]
+        The previous study's results, i.e., a checkpoint directory, whose islands are all loaded, a single pickle or HDF5
+        population checkpoint, or the individuals themselves, e.g., as returned by ``Propulator.summarize()``.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The evaluated individuals.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source is neither a directory, a file, nor a sequence of individuals.
+    """
+    if not isinstance(source, (str, Path)):
+        return list(source)
+    path = Path(source)
+    if path.is_dir():
+        island_idxs = sorted({int(file.name.split("_")[1]) for file in path.glob("island_*_*")})
+        population = []
+        for island_idx in island_idxs:
+            island = load_island_population(path, island_idx, "pickle")
+            population += island if len(island) > 0 else load_island_population(path, island_idx, "hdf5")
+        return population
+    if path.is_file() and path.suffix == ".h5":
+        return read_hdf5_population(path)
+    if path.is_file():
+        with open(path, "rb") as f:
+            return list(pickle.load(f))
+    raise FileNotFoundError(f"No previous results found at {path}.")
+
+
+class WarmStart:
+    """
+    Seed the initial population of an optimization run with the results of previous studies on related problems.
+
+    The evaluated individuals of all sources are mapped into the current search space: Each parameter takes the value of
+    the same-named parameter of the previous study, or of the parameter given in ``param_map``, if this value lies within
+    the current limits. Otherwise, e.g., for parameters newly added to the search space, the value in ``defaults`` is
+    used. Individuals that cannot be mapped are skipped, as are individuals with non-finite loss. Parameters of the
+    previous studies that are not part of the current search space are dropped, i.e., the current search space may be a
+    subset of the previous ones. Duplicates are merged, keeping the lower loss.
+
+    The best ``num_seeds`` mapped individuals are distributed round-robin over the islands and their workers. The best
+    ``reevaluate`` of them are evaluated again as the first individuals of their workers. All others are added to the
+    initial populations with their previous losses, without evaluating them, as if they had been evaluated by their
+    worker in generations before the first one, i.e., with negative generations. Seeding only takes place if no
+    checkpoint is resumed from.
+
+    Attributes
+    ----------
+    defaults : Dict[str, float | int | str]
+        The values of parameters that cannot be mapped from the previous studies.
+    limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The current search space.
+    num_seeds : int, optional
+        The maximum number of seeds.
+    param_map : Dict[str, str]
+        The names of the previous studies' parameters for the parameters of the current search space.
+    reevaluate : int
+        The number of best seeds to evaluate again.
+    sources : List[str | pathlib.Path | Sequence[propulate.population.Individual]]
+        The previous studies' results.
+
+    Methods
+    -------
+    map_individual()
+        Map an individual of a previous study into the current search space.
+    seeds()
+        Get the seeds for the initial population, sorted by loss.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]],
+        sources: Sequence[Union[str, Path, Sequence[Individual]]],
+        num_seeds: Optional[int] = None,
+        reevaluate: int = 0,
+        param_map: Optional[Dict[str, str]] = None,
+        defaults: Optional[Dict[str, Union[float, int, str]]] = None,
+    ) -> None:
+        """
+        Initialize a warm start.
+
+        Parameters
+        ----------
+        limits : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+            The current search space.
+        sources : Sequence[str | pathlib.Path | Sequence[propulate.population.Individual]]
+            The previous studies' results, see ``load_results()``.
+        num_seeds : int, optional
+            The maximum number of seeds. Default is None, i.e., all mappable individuals.
+        reevaluate : int, optional
+            The number of best seeds to evaluate again instead of adopting their previous losses. Default is 0.
+        param_map : Dict[str, str], optional
+            The names of the previous studies' parameters for renamed parameters of the current search space.
+            Default is None, i.e., parameters are matched by name.
+        defaults : Dict[str, float | int | str], optional
+            The values of parameters that cannot be mapped from the previous studies. Default is None.
+
+        Raises
+        ------
+        ValueError
+            If ``num_seeds`` or ``reevaluate`` is negative.
+        """
+        if (num_seeds is not None and num_seeds < 0) or reevaluate < 0:
+            raise ValueError("Number of seeds and re-evaluated seeds must not be negative.")
+        self.limits = limits
+        self.sources = list(sources)
+        self.num_seeds = num_seeds
+        self.reevaluate = reevaluate
+        self.param_map = {} if param_map is None else param_map
+        self.defaults = {} if defaults is None else defaults
+
+    def _in_limits(self, key: str, value: Union[float, int, str]) -> bool:
+        """
+        Check whether a value lies within the current limits of a parameter.
+
+        Parameters
+        ----------
+        key : str
+            The parameter's name.
+        value : float | int | str
+            The value.
+
+        Returns
+        -------
+        bool
+            True if the value is valid for the parameter, False otherwise.
+        """
+        limit = self.limits[key]
+        if isinstance(limit[0], str) or (isinstance(limit[0], int) and len(limit) > 2):
+            return value in limit  # Categorical or discrete ordinal parameter
+        if isinstance(value, str) or (isinstance(limit[0], int) and float(value) != round(float(value))):
+            return False
+        return float(limit[0]) <= float(value) <= float(limit[1])
+
+    def map_individual(self, ind: Individual) -> Optional[Individual]:
+        """
+        Map an individual of a previous study into the current search space.
+
+        Parameters
+        ----------
+        ind : propulate.population.Individual
+            The individual of the previous study.
+
+        Returns
+        -------
+        propulate.population.Individual, optional
+            The mapped individual with the previous loss, or None if it cannot be mapped.
+        """
+        position: Dict[str, Union[float, int, str]] = {}
+        for key, limit in self.limits.items():
+            source_key = self.param_map.get(key, key)
+            value = ind[source_key] if source_key in ind.limits else None
+            if value is None or not self._in_limits(key, value):
+                if key not in self.defaults:
+                    return None
+                value = self.defaults[key]
+            if isinstance(limit[0], float):
+                value = float(value)
+            elif isinstance(limit[0], int):
+                value = int(value)
+            position[key] = value
+        mapped = Individual(position, self.limits)
+        mapped.loss = ind.loss
+        mapped.evaltime, mapped.evalperiod = ind.evaltime, ind.evalperiod
+        return mapped
+
+    def seeds(self) -> List[Individual]:
+        """
+        Get the seeds for the initial population from the previous studies' results, sorted by loss.
+
+        Returns
+        -------
+        List[propulate.population.Individual]
+            The best ``num_seeds`` mapped, unique individuals of the previous studies.
+        """
+        unique: Dict[bytes, Individual] = {}
+        num_results = 0
+        for source in self.sources:
+            for ind in load_results(source):
+                num_results += 1
+                if not math.isfinite(ind.loss):  # E.g., penalty loss of timed-out evaluation
+                    continue
+                mapped = self.map_individual(ind)
+                if mapped is None:
+                    continue
+                key = np.asarray(mapped.position, dtype=np.float64).tobytes()
+                if key not in unique or mapped.loss < unique[key].loss:
+                    unique[key] = mapped
+        seeds = sorted(unique.values(), key=lambda ind: ind.loss)[: self.num_seeds]
+        log.info(f"Warm start: Mapped {len(unique)} of {num_results} previous results into search space, using {len(seeds)}.")
+        return seeds
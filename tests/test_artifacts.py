@@ -0,0 +1,92 @@
+import pathlib
+import random
+
+import numpy as np
+from mpi4py import MPI
+
+from propulate import ArtifactStore, Propulator
+from propulate.population import Individual
+from propulate.utils import get_default_propagator, set_logger_config
+from propulate.utils.benchmark_functions import get_function_search_space
+
+
+def test_find_parent(tmp_path: pathlib.Path) -> None:
+    """
+    Test that the closest individual with an existing artifact is chosen as parent.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary artifact directory.
+    """
+    store = ArtifactStore(tmp_path)
+    limits = {"a": (0.0, 100.0), "b": (0.0, 1.0)}
+    population = []
+    for generation, position in enumerate([[10.0, 0.0], [40.0, 0.2], [50.0, 1.0]]):
+        ind = Individual(np.array(position), limits, generation=generation, rank=0)
+        ind.island = 0
+        population.append(ind)
+    child = Individual(np.array([45.0, 0.0]), limits)
+    assert ArtifactStore(tmp_path).find_parent(child, population) is None  # No artifacts yet.
+    for ind in population[::2]:
+        store.path_for(ind).write_text(str(ind.generation))
+    # Without normalization by the limits, the third individual would be closest.
+    assert store.find_parent(child, population) is population[0]
+    store.path_for(population[1]).mkdir()
+    assert ArtifactStore(tmp_path).find_parent(child, population) is population[1]
+
+    population[0].loss, population[1].loss, population[2].loss = 1.0, 2.0, 3.0
+    population[1].active = False
+    store = ArtifactStore(tmp_path, keep=1)
+    store.collect_garbage(population, island=0, rank=0)
+    assert all(store.path_for(ind).exists() for ind in population)  # Untracked artifacts are not deleted.
+    for ind in population:
+        store.add(ind)
+    store.collect_garbage(population, island=0, rank=0)
+    assert [store.path_for(ind).exists() for ind in population] == [True, False, False]
+
+    store.path_for(population[1]).mkdir()
+    assert store.find_parent(child, population) is population[0]  # Deleted artifacts are not looked up again.
+
+
+def test_propulator_artifacts(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test population-based training, i.e., warm-starting children from their parents' artifacts.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    store = ArtifactStore(mpi_tmp_path / "artifacts", keep=2)
+    trained_steps = []
+
+    def pbt_sphere(params: Individual) -> float:
+        steps = 0
+        if params["_parent_artifact"] is not None:
+            try:
+                steps = int(params["_parent_artifact"].read_text())
+            except FileNotFoundError:  # Parent artifact deleted meanwhile, start from scratch.
+                pass
+        params["_artifact"].write_text(str(steps + 1))  # Warm-started training continues from the parent's state.
+        trained_steps.append(steps + 1)
+        return benchmark_function({key: params[key] for key in limits})
+
+    propulator = Propulator(
+        loss_fn=pbt_sphere,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+        artifact_store=store,
+    )
+    propulator.propulate()
+    assert max(trained_steps) > 1  # Some children were warm-started.
+    assert all("_artifact" not in ind and "_parent_artifact" not in ind for ind in propulator.population)
+    own = [ind for ind in propulator.population if ind.rank == MPI.COMM_WORLD.rank]
+    assert sum(store.path_for(ind).exists() for ind in own) <= store.keep  # Garbage collected
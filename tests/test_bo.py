@@ -0,0 +1,130 @@
+import pathlib
+import random
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator
+from propulate.propagators import BayesianOptimization, Conditional, InitUniform
+from propulate.propagators.bo import GaussianProcess
+from propulate.utils.benchmark_functions import get_function_search_space, sphere
+
+
+@pytest.mark.parametrize("pending_strategy", ["constant_liar", "local_penalization"])
+def test_bo(pending_strategy: str, mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test Propulator to optimize a benchmark function using a Bayesian optimization propagator.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    pending_strategy : str
+        How to account for individuals evaluated concurrently.
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    function, limits = get_function_search_space("sphere")
+    propagator = BayesianOptimization(limits, pending_strategy=pending_strategy, initial_points=4, rng=rng)
+    propulator = Propulator(
+        loss_fn=function,
+        propagator=propagator,
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+    )
+    propulator.propulate()
+    propulator.summarize()
+    if MPI.COMM_WORLD.size == 1:  # Workers may propose the same point before receiving each other's pending ones.
+        assert len({ind.position.tobytes() for ind in propulator.population}) == len(propulator.population)
+    assert len(propulator.pending) == 0
+
+
+@pytest.mark.mpi_skip
+def test_gaussian_process_update() -> None:
+    """Test that incrementally updating the Cholesky factor gives the same model as fitting it from scratch."""
+    rng = np.random.default_rng(42)
+    x, y = rng.random((30, 3)), rng.random(30)
+    full, incremental = GaussianProcess(0.3), GaussianProcess(0.3)
+    full.fit(x, y)
+    incremental.fit(x[:10], y[:10])
+    for start in range(10, 30, 5):
+        incremental.update(x[start : start + 5], y[start : start + 5])
+    assert np.allclose(incremental.chol, full.chol)
+    test = rng.random((50, 3))
+    assert np.allclose(incremental.predict(test), full.predict(test))
+    mean, std = full.predict(x)
+    assert np.allclose(mean, y, atol=1e-3) and np.all(std < 1e-2)
+    step = 1e-6 * np.eye(3)
+    numerical = (full.predict(test[:1] + step)[0] - full.predict(test[:1] - step)[0]) / 2e-6
+    assert np.allclose(full.mean_gradient(test[:1])[0], numerical, rtol=1e-4)
+
+
+@pytest.mark.mpi_skip
+def test_bo_mixed_search_space() -> None:
+    """Test that BO proposals lie within a mixed search space, improve on the initial ones, and avoid pending points."""
+    limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {
+        "x": (-5.12, 5.12),
+        "y": (-5.12, 5.12),
+        "int": (0, 5),
+        "ordinal": (1, 2, 4, 8),
+        "cat": ("a", "b", "c"),
+    }
+    for pending_strategy in ["constant_liar", "local_penalization"]:
+        propagator = BayesianOptimization(limits, pending_strategy=pending_strategy, rng=random.Random(42))
+        population = []
+        for generation in range(40):
+            ind = propagator(population)
+            assert -5.12 <= ind["x"] <= 5.12 and 0 <= ind["int"] <= 5 and ind["ordinal"] in limits["ordinal"]
+            assert ind["cat"] in limits["cat"] and ind.position[-3:].sum() == 1.0
+            ind.loss = sphere({"x": ind["x"], "y": ind["y"]}) + ind["int"] + (ind["cat"] != "b") + np.log2(ind["ordinal"])
+            ind.generation = generation
+            population.append(ind)
+        assert min(ind.loss for ind in population[10:]) < min(ind.loss for ind in population[:10])
+
+        batch = propagator.breed_batch(population, 4)
+        positions = np.array([ind.position for ind in batch])
+        assert np.min(np.linalg.norm(positions[:, None] - positions[None], axis=-1) + np.eye(4)) > 1e-3
+        # Proposals of other workers in ``pending`` are avoided as well.
+        propagator.load_state_dict(propagator.state_dict() | {"proposed": {}})
+        propagator.pending = batch  # type: ignore[assignment]
+        assert all(np.linalg.norm(propagator(population).position - positions, axis=1).min() > 1e-3 for _ in range(3))
+
+    # Proposals that never show up evaluated are forgotten beyond ``max_pending``, but not those of the current batch.
+    propagator = BayesianOptimization(limits, max_pending=2, rng=random.Random(42))
+    propagator.breed_batch(population, 3)
+    assert len(propagator.state_dict()["proposed"]) == 3
+    propagator(population)
+    assert len(propagator.state_dict()["proposed"]) == 2
+
+    with pytest.raises(ValueError):
+        BayesianOptimization(limits, acquisition="pi")
+    with pytest.raises(ValueError):
+        BayesianOptimization(limits, pending_strategy="kriging_believer")
+
+
+def test_bo_nested_pending(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that workers share their pending individuals if BO is nested in another propagator.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    function, limits = get_function_search_space("sphere")
+    bo = BayesianOptimization(limits, initial_points=4, rng=rng)
+    propulator = Propulator(
+        loss_fn=function,
+        propagator=Conditional(4, bo, InitUniform(limits, rng=rng)),
+        rng=rng,
+        generations=5,
+        checkpoint_path=mpi_tmp_path,
+    )
+    assert propulator.share_pending
+    propulator.propulate()
+    assert len(propulator.pending) == 0
@@ -0,0 +1,465 @@
+import copy
+import os
+import pathlib
+import pickle
+import random
+import signal
+from typing import List
+
+import h5py
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import (
+    AnyCheckpointPolicy,
+    IntervalCheckpointPolicy,
+    Propulator,
+    ShutdownCheckpointPolicy,
+    SignalCheckpointPolicy,
+    VolumeCheckpointPolicy,
+)
+from propulate.checkpoint import (
+    AsyncCheckpointWriter,
+    CheckpointLog,
+    HDF5CheckpointLog,
+    individual_key,
+    load_island_population,
+    load_worker_state,
+    read_hdf5_columns,
+    read_hdf5_population,
+    read_layout,
+    reshard_populations,
+    write_hdf5_population,
+    write_layout,
+)
+from propulate.population import Individual
+from propulate.utils import get_default_propagator, set_logger_config
+from propulate.utils.benchmark_functions import get_function_search_space
+
+
+def make_individuals(num: int, rank: int = 0) -> List[Individual]:
+    """
+    Create evaluated individuals of a worker on island 0.
+
+    Parameters
+    ----------
+    num : int
+        The number of individuals.
+    rank : int, optional
+        The worker's rank. Default is 0.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The individuals.
+    """
+    individuals = []
+    for generation in range(num):
+        ind = Individual(
+            np.array([float(generation), float(rank)]), {"a": (0.0, 100.0), "b": (0.0, 10.0)}, generation=generation, rank=rank
+        )
+        ind.island, ind.current, ind.migration_steps, ind.loss = 0, rank, 0, float(generation)
+        ind.migration_history = "0"
+        individuals.append(ind)
+    return individuals
+
+
+def test_checkpoint_log_replay(tmp_path: pathlib.Path) -> None:
+    """
+    Test recovering a population from the checkpoint logs of several workers, including deactivations.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    population = []
+    for rank in range(2):
+        checkpoint_log = CheckpointLog(tmp_path, 0, rank)
+        individuals = make_individuals(5, rank)
+        for ind in individuals:
+            checkpoint_log.record_individual(ind)
+        population += individuals
+        checkpoint_log.flush()
+    # Worker 1 deactivates an individual recorded by worker 0. Buffered records are lost without flushing.
+    population[2].active = False
+    checkpoint_log.record_deactivation(population[2])
+    assert CheckpointLog.load_population(tmp_path, 0) == make_individuals(5, 0) + make_individuals(5, 1)
+
+    checkpoint_log.flush()
+    recovered = CheckpointLog.load_population(tmp_path, 0)
+    assert sorted(recovered, key=lambda ind: (ind.rank, ind.generation)) == population
+    assert CheckpointLog.load_population(tmp_path, 1) == []
+
+
+def test_checkpoint_log_truncated(tmp_path: pathlib.Path) -> None:
+    """
+    Test that a record truncated by a crash is dropped and the log can be appended to afterward.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    individuals = make_individuals(4)
+    checkpoint_log = CheckpointLog(tmp_path, 0, 0)
+    for ind in individuals[:3]:
+        checkpoint_log.record_individual(ind)
+    checkpoint_log.flush()
+    with open(checkpoint_log.log_path, "r+b") as f:
+        f.truncate(checkpoint_log.log_path.stat().st_size - 5)  # Simulate crash while writing the last record.
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals[:2]
+
+    checkpoint_log = CheckpointLog(tmp_path, 0, 0)
+    checkpoint_log.record_individual(individuals[3])
+    checkpoint_log.flush()
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals[:2] + individuals[3:]
+
+
+def test_checkpoint_log_compaction(tmp_path: pathlib.Path) -> None:
+    """
+    Test compaction of the checkpoint log into a snapshot and recovery from snapshot plus log.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    individuals = make_individuals(9)
+    checkpoint_log = CheckpointLog(tmp_path, 0, 0, compaction_threshold=4)
+    for ind in individuals[:5]:
+        checkpoint_log.record_individual(ind)
+    checkpoint_log.record_deactivation(individuals[1])
+    individuals[1].active = False
+    checkpoint_log.flush()  # Six records in log exceed threshold.
+    assert checkpoint_log.snapshot_path.is_file() and checkpoint_log.log_backup_path.is_file()
+    assert not checkpoint_log.log_path.exists()
+    for ind in individuals[5:]:
+        checkpoint_log.record_individual(ind)
+    checkpoint_log.flush()  # Four records in log are fewer than the five records in the snapshot.
+    assert checkpoint_log.log_path.stat().st_size > 0
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals
+
+    # Records still in the log after compaction, e.g., if truncating failed, are not replayed twice.
+    log_data = checkpoint_log.log_path.read_bytes()
+    checkpoint_log.compact()
+    checkpoint_log.log_path.write_bytes(log_data)
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals
+
+
+def test_checkpoint_integrity(tmp_path: pathlib.Path) -> None:
+    """
+    Test recovery from corrupted records, snapshots, optimizer states, and final checkpoints.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    individuals = make_individuals(12)
+    checkpoint_log = CheckpointLog(tmp_path, 0, 0, compaction_threshold=4)
+    for ind in individuals[:10]:  # Log is compacted after four and eight records.
+        checkpoint_log.record_individual(ind)
+        checkpoint_log.record_state({"generation": ind.generation})
+        checkpoint_log.flush()
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals[:10]
+
+    def corrupt(path: pathlib.Path, position: int) -> None:
+        data = bytearray(path.read_bytes())
+        data[position] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+    corrupt(checkpoint_log.snapshot_path, -10)  # Recovered from previous snapshot and compacted log
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals[:10]
+    corrupt(checkpoint_log.state_path, -3)  # Previous state is used instead.
+    assert load_worker_state(tmp_path, 0, 0) == {"generation": 8}
+
+    for ind in individuals[10:]:
+        checkpoint_log.record_individual(ind)
+    checkpoint_log.flush()
+    corrupt(checkpoint_log.log_path, checkpoint_log.log_path.stat().st_size - 10)  # Corrupted last record is dropped.
+    assert CheckpointLog.load_population(tmp_path, 0) == individuals[:11]
+
+    ckpt_file = tmp_path / "final" / "island_0_ckpt.pickle"
+    ckpt_file.parent.mkdir()
+    ckpt_file.with_suffix(".bkp").write_bytes(pickle.dumps(individuals[:5]))
+    ckpt_file.write_bytes(pickle.dumps(individuals)[:-20])  # Truncated by crash
+    assert load_island_population(ckpt_file.parent, 0) == individuals[:5]
+
+
+def test_hdf5_checkpoint_log(tmp_path: pathlib.Path) -> None:
+    """
+    Test recovering a population from the HDF5 checkpoint logs of several workers and reading subsets of columns.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    population = []
+    for rank in range(2):
+        checkpoint_log = HDF5CheckpointLog(tmp_path, 0, rank, chunk_size=2)
+        individuals = make_individuals(5, rank)
+        individuals[4].velocity = np.ones(2)  # Velocity column is created later on.
+        for ind in individuals[:3]:
+            checkpoint_log.record_individual(ind)
+        checkpoint_log.flush()
+        for ind in individuals[3:]:
+            checkpoint_log.record_individual(ind)
+        checkpoint_log.flush()
+        population += individuals
+    population[2].active = False
+    checkpoint_log.record_deactivation(population[2])
+    population[7].loss = 100.0  # Later changes to recorded individuals are not recorded.
+    checkpoint_log.flush()
+    population[7].loss = 2.0
+
+    recovered = HDF5CheckpointLog.load_population(tmp_path, 0)
+    assert recovered == population
+    assert [ind.velocity is None for ind in recovered] == [ind.velocity is None for ind in population]
+    assert recovered[4].velocity is not None and np.array_equal(recovered[4].velocity, np.ones(2))
+
+    columns = read_hdf5_columns(tmp_path / "island_0_worker_1.h5", ["loss", "generation"], rows=slice(1, None, 2))
+    assert set(columns) == {"loss", "generation"}
+    assert np.array_equal(columns["generation"], [1, 3])
+    assert np.array_equal(read_hdf5_columns(tmp_path / "island_0_worker_0.h5", ["loss"], np.array([0, 4]))["loss"], [0.0, 4.0])
+
+    # Rows of an interrupted append, i.e., not committed, are ignored and overwritten by the next append.
+    with h5py.File(tmp_path / "island_0_worker_0.h5", "a") as h5_file:
+        h5_file["loss"].resize(7, axis=0)
+    assert len(read_hdf5_population(tmp_path / "island_0_worker_0.h5")) == 5
+    checkpoint_log = HDF5CheckpointLog(tmp_path, 0, 0)
+    checkpoint_log.record_individual(population[0])
+    checkpoint_log.flush()
+    assert read_hdf5_population(tmp_path / "island_0_worker_0.h5") == make_individuals(5) + make_individuals(1)
+
+
+def test_write_hdf5_population(tmp_path: pathlib.Path) -> None:
+    """
+    Test writing a full population to an HDF5 checkpoint and reading it back, memory-mapped.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    population = make_individuals(3, 0) + make_individuals(2, 1)
+    population[1].active = False
+    population[3].migration_history = "0-1"
+    path = tmp_path / "island_0_ckpt.h5"
+    write_hdf5_population(path, population)
+    write_hdf5_population(path, population[:2])
+    assert read_hdf5_population(path) == population[:2]
+    recovered = read_hdf5_population(path.with_suffix(".bkp"))
+    assert recovered == population
+    assert recovered[3].migration_history == "0-1"
+    assert read_hdf5_columns(path, ["migration_history"])["migration_history"].tolist() == ["0", "0"]
+    columns = read_hdf5_columns(path, ["position", "loss"], rows=slice(1, 2))  # Contiguous columns are memory-mapped.
+    assert isinstance(columns["loss"], np.memmap) and np.array_equal(columns["position"], [[1.0, 0.0]])
+    write_hdf5_population(path, [])
+    assert read_hdf5_population(path) == [] and len(read_hdf5_columns(path, ["loss"])["loss"]) == 0
+
+
+@pytest.mark.parametrize("checkpoint_log_type", [CheckpointLog, HDF5CheckpointLog])
+def test_async_checkpoint_writer(checkpoint_log_type: type, tmp_path: pathlib.Path) -> None:
+    """
+    Test writing checkpoint logs in a background thread, including compaction and errors in the writer thread.
+
+    Parameters
+    ----------
+    checkpoint_log_type : type
+        The checkpoint log class.
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    individuals = make_individuals(20)
+    kwargs = {"compaction_threshold": 3} if checkpoint_log_type is CheckpointLog else {}
+    writer = AsyncCheckpointWriter(checkpoint_log_type(tmp_path, 0, 0, **kwargs), max_pending=1)
+    for ind in individuals:
+        writer.record_individual(ind)
+        if ind.generation % 4 == 0:
+            writer.record_deactivation(ind)
+            ind.active = False
+        writer.flush()
+    writer.close()
+    assert checkpoint_log_type.load_population(tmp_path, 0) == individuals
+
+    writer = AsyncCheckpointWriter(checkpoint_log_type(tmp_path / "missing", 0, 0, **kwargs))
+    writer.record_individual(individuals[0])
+    writer.flush()
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+
+def test_checkpoint_policies() -> None:
+    """Test the decisions of the checkpoint policies."""
+    assert not IntervalCheckpointPolicy(10.0).should_dump(1, 5.0)
+    assert IntervalCheckpointPolicy(10.0).should_dump(1, 10.0)
+    assert not IntervalCheckpointPolicy(10.0).should_dump(0, 20.0)  # Nothing to dump
+    assert not VolumeCheckpointPolicy(3).should_dump(2, 100.0)
+    assert VolumeCheckpointPolicy(3).should_dump(3, 0.0)
+    assert not ShutdownCheckpointPolicy().should_dump(100, 100.0)
+
+    signal_policy = SignalCheckpointPolicy([signal.SIGUSR1])
+    policy = AnyCheckpointPolicy(VolumeCheckpointPolicy(3), signal_policy)
+    previous_handler = signal.getsignal(signal.SIGUSR1)
+    policy.start()
+    assert not policy.should_dump(1, 0.0)
+    os.kill(os.getpid(), signal.SIGUSR1)
+    assert policy.should_dump(1, 0.0)
+    assert not policy.should_dump(1, 0.0)  # Signal is only handled once.
+    assert policy.should_dump(3, 0.0)
+    assert not policy.should_stop()  # ``SIGUSR1`` does not end the optimization.
+    policy.stop()
+    assert signal.getsignal(signal.SIGUSR1) == previous_handler
+
+    signal_policy = SignalCheckpointPolicy()
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    signal_policy.start()
+    assert not signal_policy.should_stop()
+    os.kill(os.getpid(), signal.SIGTERM)
+    assert signal_policy.should_dump(1, 0.0)
+    assert signal_policy.should_stop()
+    assert signal_policy.should_stop()  # Stopping is not reset by dumping.
+    signal_policy.stop()
+    assert signal.getsignal(signal.SIGTERM) == previous_handler
+
+
+def test_propulator_shutdown_checkpoint_policy(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that no checkpoint is dumped during the optimization with the shutdown checkpoint policy.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    log_path = mpi_tmp_path / f"island_0_worker_{MPI.COMM_WORLD.rank}.log"
+
+    def sphere(params: Individual) -> float:
+        assert not log_path.exists()  # Checkpoint log is not written during the optimization.
+        return benchmark_function(params)
+
+    propulator = Propulator(
+        loss_fn=sphere,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+        async_checkpointing=False,
+        checkpoint_policy=ShutdownCheckpointPolicy(),
+    )
+    propulator.propulate()
+    assert log_path.exists()
+    assert len(CheckpointLog.load_population(mpi_tmp_path, 0)) == 10 * MPI.COMM_WORLD.size
+
+
+def test_propulator_signal_checkpoint_policy_stop(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that a ``SIGTERM`` ends the optimization orderly with the final synchronization and checkpoint.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    evaluations = []
+
+    def terminated_sphere(params: Individual) -> float:
+        evaluations.append(params)
+        if len(evaluations) == 3:  # Scheduler terminates the job.
+            os.kill(os.getpid(), signal.SIGTERM)
+        return benchmark_function(params)
+
+    propulator = Propulator(
+        loss_fn=terminated_sphere,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=100,
+        checkpoint_path=mpi_tmp_path,
+        async_checkpointing=False,
+        checkpoint_policy=SignalCheckpointPolicy(),
+    )
+    propulator.propulate()
+    assert len(evaluations) == 3
+    assert len(propulator.population) == 3 * MPI.COMM_WORLD.size  # Final synchronization
+    assert len(CheckpointLog.load_population(mpi_tmp_path, 0)) == 3 * MPI.COMM_WORLD.size
+
+
+def test_reshard_populations() -> None:
+    """Test redistributing island populations over fewer and more islands and workers."""
+    populations = [make_individuals(5, 0) + make_individuals(5, 1), make_individuals(3, 0)]
+    for ind in populations[1]:
+        ind.island, ind.loss = 1, ind.loss + 10.0
+    migrant = populations[0][0]  # Emigrated copy on island 1 and deactivated original on island 0
+    populations[1].append(copy.deepcopy(migrant))
+    populations[1][-1].island, populations[1][-1].loss = 0, migrant.loss
+    migrant.active = False
+
+    merged = reshard_populations(populations, [3])[0]
+    assert len(merged) == 13 and all(ind.active for ind in merged)
+    assert len({individual_key(ind) for ind in merged}) == 13
+    assert sorted(ind.loss for ind in merged) == sorted(ind.loss for ind in populations[0] + populations[1][:3])
+    assert [sum(ind.rank == rank for ind in merged) for rank in range(3)] == [5, 4, 4]
+    assert all(ind.island == 0 and ind.current == ind.rank for ind in merged)
+
+    split = reshard_populations(populations, [1, 2, 4])
+    assert [len(population) for population in split] == [10, 4, 10]
+    assert [ind.loss for ind in split[2]] == [ind.loss for ind in split[0]]  # Copy of old island 0
+    assert max(ind.generation for ind in split[2]) == 2 and split[1][0] is not populations[1][0]
+
+
+def test_propulator_elastic_restart(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test resuming from a checkpoint written with a different island layout.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    if MPI.COMM_WORLD.rank == 0:  # Checkpoint of two islands with two workers and one worker
+        for rank in range(2):
+            checkpoint_log = CheckpointLog(mpi_tmp_path, 0, rank)
+            for ind in make_individuals(5, rank):
+                checkpoint_log.record_individual(ind)
+            checkpoint_log.flush()
+        checkpoint_log = CheckpointLog(mpi_tmp_path, 1, 0)
+        for ind in make_individuals(3):
+            ind.island = 1
+            checkpoint_log.record_individual(ind)
+        checkpoint_log.flush()
+        write_layout(mpi_tmp_path, [2, 1])
+    MPI.COMM_WORLD.barrier()
+
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    propulator = Propulator(
+        loss_fn=benchmark_function,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+        async_checkpointing=False,
+    )
+    assert len(propulator.population) == 13
+    assert propulator.generation == len([ind for ind in propulator.population if ind.rank == MPI.COMM_WORLD.rank])
+    MPI.COMM_WORLD.barrier()
+    assert read_layout(mpi_tmp_path) == [MPI.COMM_WORLD.size]
+    assert len(CheckpointLog.load_population(mpi_tmp_path / "resharded_0", 0)) == 10
+    recovered = CheckpointLog.load_population(mpi_tmp_path, 0)
+    assert sorted(recovered, key=individual_key) == sorted(propulator.population, key=individual_key)
@@ -2,6 +2,7 @@ import pathlib
 import random
 
 import pytest
+from mpi4py import MPI
 
 from propulate import Propulator
 from propulate.propagators import ActiveCMA, BasicCMA, CMAAdapter, CMAPropagator
@@ -43,3 +44,37 @@ def test_cmaes_basic(cma_adapter: CMAAdapter, mpi_tmp_path: pathlib.Path) -> Non
     )
     # Run optimization and print summary of results.
     propulator.propulate()
+
+
+def test_cmaes_resume(cma_adapter: CMAAdapter, mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that a CMA-ES run resumed from a checkpoint continues exactly where it left off.
+
+    Each rank runs its own island, so that the sequence of individuals is deterministic. This test is run both
+    sequentially and in parallel.
+
+    Parameters
+    ----------
+    cma_adapter : CMAAdapter
+        The CMA adapter used, either basic or active.
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    benchmark_function, limits = get_function_search_space("sphere")
+    populations = []
+    for run in ["continuous", "resumed"]:
+        checkpoint_path = mpi_tmp_path / run / str(MPI.COMM_WORLD.rank)
+        for seed, generations in [(42, 10), (0, 20)] if run == "resumed" else [(42, 20)]:
+            rng = random.Random(seed)  # The resumed run restores the random number generator state.
+            propulator = Propulator(
+                loss_fn=benchmark_function,
+                propagator=CMAPropagator(cma_adapter, limits, rng=rng),
+                rng=rng,
+                island_comm=MPI.COMM_SELF,
+                propulate_comm=MPI.COMM_SELF,
+                generations=generations,
+                checkpoint_path=checkpoint_path,
+            )
+            propulator.propulate()
+        populations.append(sorted(propulator.population, key=lambda ind: ind.generation))
+    assert [ind.loss for ind in populations[0]] == [ind.loss for ind in populations[1]]
@@ -0,0 +1,88 @@
+import pathlib
+import random
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pytest
+
+from propulate import Propulator
+from propulate.propagators import DifferentialEvolution
+from propulate.utils.benchmark_functions import get_function_search_space, sphere
+
+
+@pytest.mark.parametrize(
+    "strategy, adaptation",
+    [("rand/1/bin", None), ("best/1/bin", "jade"), ("current-to-pbest/1/bin", "shade")],
+)
+def test_de(strategy: str, adaptation: Optional[str], mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test Propulator to optimize a benchmark function using a differential evolution propagator.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    strategy : str
+        The DE mutation strategy.
+    adaptation : str | None
+        The parameter adaptation scheme.
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42)  # Separate random number generator for optimization.
+    function, limits = get_function_search_space("sphere")
+    propagator = DifferentialEvolution(limits, strategy=strategy, pop_size=8, adaptation=adaptation, rng=rng)
+    propulator = Propulator(
+        loss_fn=function,
+        propagator=propagator,
+        rng=rng,
+        generations=20,
+        checkpoint_path=mpi_tmp_path,
+    )
+    propulator.propulate()
+    propulator.summarize()
+
+
+@pytest.mark.mpi_skip
+def test_de_mixed_search_space() -> None:
+    """Test that DE trials stay within a mixed search space, improve on the sphere function, and adapt their parameters."""
+    limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {
+        "x": (-5.12, 5.12),
+        "y": (-5.12, 5.12),
+        "int": (0, 5),
+        "ordinal": (1, 2, 4, 8),
+        "cat": ("a", "b", "c"),
+    }
+    propagator = DifferentialEvolution(
+        limits, strategy="current-to-pbest/1/bin", pop_size=10, adaptation="shade", rng=random.Random(42)
+    )
+    population = []
+    for generation in range(300):
+        ind = propagator(population)
+        assert -5.12 <= ind["x"] <= 5.12 and 0 <= ind["int"] <= 5 and ind["ordinal"] in limits["ordinal"]
+        assert ind["cat"] in limits["cat"] and ind.position[-3:].sum() == 1.0
+        ind.loss = sphere({"x": ind["x"], "y": ind["y"]}) + ind["int"] + (ind["cat"] != "b")
+        ind.generation = generation
+        population.append(ind)
+    best = min(population, key=lambda ind: ind.loss)
+    assert best.loss < 0.1 and best["int"] == 0 and best["cat"] == "b"
+    assert not np.allclose(propagator.memory_f, 0.5) and not np.allclose(propagator.memory_cr, 0.9)
+
+    # Restoring the state reproduces the trials.
+    state = propagator.state_dict()
+    bred = [ind.position for ind in propagator.breed_batch(population, 5)]
+    restored = DifferentialEvolution(
+        limits, strategy="current-to-pbest/1/bin", pop_size=10, adaptation="shade", rng=random.Random(0)
+    )
+    restored.load_state_dict(state)
+    assert all(np.array_equal(ind.position, position) for ind, position in zip(restored.breed_batch(population, 5), bred))
+
+    # Trials that never show up evaluated are forgotten beyond ``max_pending``.
+    bounded = DifferentialEvolution(limits, pop_size=10, adaptation="jade", max_pending=7, rng=random.Random(0))
+    for _ in range(5):
+        bounded.breed_batch(population, 3)
+    assert len(bounded.state_dict()["pending"]) == 7
+    with pytest.raises(ValueError):
+        DifferentialEvolution(limits, strategy="rand/2/exp")
+    with pytest.raises(ValueError):
+        DifferentialEvolution(limits, pop_size=3)
@@ -0,0 +1,148 @@
+import csv
+import json
+import pathlib
+import random
+from typing import List
+
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator, ResultsExporter, export_results
+from propulate.checkpoint import CheckpointLog, HDF5CheckpointLog
+from propulate.export import individual_row
+from propulate.population import Individual
+from propulate.utils import get_default_propagator, set_logger_config
+from propulate.utils.benchmark_functions import get_function_search_space
+
+
+def make_individuals(num: int, rank: int = 0) -> List[Individual]:
+    """
+    Create evaluated individuals of a worker on island 0.
+
+    Parameters
+    ----------
+    num : int
+        The number of individuals.
+    rank : int, optional
+        The worker's rank. Default is 0.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The individuals.
+    """
+    limits = {"lr": (0.0, 1.0), "layers": (1, 8), "act": ("relu", "tanh")}
+    individuals = []
+    for generation in range(num):
+        ind = Individual(
+            {"lr": generation / num, "layers": 1 + generation % 8, "act": "relu"}, limits, generation=generation, rank=rank
+        )
+        ind.island, ind.current, ind.migration_steps, ind.loss = 0, rank, 0, float(generation)
+        ind.migration_history = "0"
+        individuals.append(ind)
+    return individuals
+
+
+@pytest.mark.parametrize("export_format", ["csv", "jsonl", "parquet"])
+def test_export_results(export_format: str, tmp_path: pathlib.Path) -> None:
+    """
+    Test exporting a checkpoint with compacted logs and deactivations, with decoded parameters as columns.
+
+    Parameters
+    ----------
+    export_format : str
+        The output format.
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    if export_format == "parquet":
+        pytest.importorskip("pyarrow")
+    population = []
+    for rank in range(2):
+        checkpoint_log = CheckpointLog(tmp_path, 0, rank, compaction_threshold=3)
+        for ind in make_individuals(5, rank):
+            checkpoint_log.record_individual(ind)
+            population.append(ind)
+            checkpoint_log.flush()
+    population[1].active = False  # Deactivated by worker 1 after its log has been compacted.
+    checkpoint_log.record_deactivation(population[1])
+    checkpoint_log.flush()
+
+    output_path = tmp_path / f"results.{export_format}"
+    assert export_results(tmp_path, output_path, batch_size=3) == 10
+    if export_format == "csv":
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[1]["act"] == "relu" and rows[1]["active"] == "False" and float(rows[1]["lr"]) == 0.2
+        assert [int(row["layers"]) for row in rows] == [ind["layers"] for ind in population]
+    else:
+        if export_format == "jsonl":
+            with open(output_path) as f:
+                rows = [json.loads(line) for line in f]
+        else:
+            import pyarrow.parquet as pq
+
+            rows = pq.read_table(output_path).to_pylist()
+        assert rows == [individual_row(ind) for ind in population]
+
+
+def test_follow_results(tmp_path: pathlib.Path) -> None:
+    """
+    Test exporting the individuals of a running optimization as they are written, across compactions and HDF5 logs.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    individuals = make_individuals(12)
+    checkpoint_log = CheckpointLog(tmp_path, 0, 0, compaction_threshold=4)
+    hdf5_log = HDF5CheckpointLog(tmp_path, 1, 0, chunk_size=2)
+    exporter = ResultsExporter(tmp_path, tmp_path / "results.jsonl", batch_size=2)
+    assert exporter.poll() == 0
+    for ind, hdf5_ind in zip(individuals[:3], make_individuals(3)):
+        hdf5_ind.island = 1
+        checkpoint_log.record_individual(ind)
+        hdf5_log.record_individual(hdf5_ind)
+    checkpoint_log.flush()
+    hdf5_log.flush()
+    assert exporter.poll() == 6
+    for ind in individuals[3:]:  # Log is compacted several times between two polls.
+        checkpoint_log.record_individual(ind)
+        checkpoint_log.flush()
+    assert exporter.poll() == 9
+    with open(tmp_path / "results.jsonl") as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["generation"] for row in rows if row["island"] == 0] == list(range(12))
+    polls = iter([True])
+    assert exporter.follow(poll_interval=0.0, stop=lambda: next(polls)) == 15
+
+
+def test_export_propulator_results(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test exporting the results of an optimization run.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    propulator = Propulator(
+        loss_fn=benchmark_function,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+    )
+    propulator.propulate()
+    MPI.COMM_WORLD.barrier()
+    output_path = mpi_tmp_path / f"results_{MPI.COMM_WORLD.rank}.csv"
+    assert export_results(mpi_tmp_path, output_path) == 10 * MPI.COMM_WORLD.size
+    with open(output_path, newline="") as f:
+        losses = sorted(float(row["loss"]) for row in csv.DictReader(f))
+    assert losses == sorted(ind.loss for ind in propulator.population)
@@ -0,0 +1,149 @@
+import pickle
+import random
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pytest
+
+from propulate.population import Individual
+from propulate.propagators import (
+    Compose,
+    CrossoverMultiple,
+    CrossoverSigmoid,
+    CrossoverUniform,
+    InitUniform,
+    IntervalMutationNormal,
+    PointMutation,
+    RandomPointMutation,
+    SelectMin,
+)
+from propulate.utils import get_default_propagator
+
+limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {
+    "float1": (0.0, 1.0),
+    "cat1": ("a", "b", "c", "d", "e"),
+    "int1": (0, 5),
+    "ordinal": (2, 4, 8),
+    "float2": (-1.0, 1.0),
+    "cat2": ("f", "g", "h"),
+}
+
+
+def assert_valid(ind: Individual) -> None:
+    """
+    Assert that an individual lies within the search space and its mapping matches its position.
+
+    Parameters
+    ----------
+    ind : propulate.population.Individual
+        The individual.
+    """
+    for key, limit in limits.items():
+        if isinstance(limit[0], float):
+            assert limit[0] <= ind[key] <= limit[1]
+        elif isinstance(limit[0], int) and len(limit) == 2:
+            assert limit[0] <= ind[key] <= limit[1]
+        else:
+            assert ind[key] in limit
+        if isinstance(limit[0], str):
+            offset = ind.offsets[key]
+            assert ind.position[offset : offset + len(limit)].sum() == 1.0  # Valid one-hot encoding
+        assert ind.mapping[key] == ind[key]
+    assert ind.loss == float("inf")
+
+
+@pytest.mark.mpi_skip
+def test_mutations() -> None:
+    """Test that the array-native mutations stay within the limits, leave their parents unchanged, and cover all values."""
+    rng = random.Random(42)
+    parent = InitUniform(limits, rng=rng)()
+    parent.loss = 1.0
+    position = parent.position.copy()
+    for mutation, num_points in [
+        (PointMutation(limits, points=2, rng=rng), 2),
+        (RandomPointMutation(limits, min_points=1, max_points=3, rng=rng), 3),
+        (IntervalMutationNormal(limits, sigma_factor=0.5, points=2, rng=rng), 2),
+    ]:
+        children = [mutation(parent) for _ in range(250)] + mutation.apply_batch([parent] * 250)
+        for child in children:
+            assert_valid(child)
+            assert child.encoding is parent.encoding
+        # Resampled discrete traits may keep their value.
+        assert max(sum(child[key] != parent[key] for key in limits) for child in children) == num_points
+        if not isinstance(mutation, IntervalMutationNormal):
+            assert {child["ordinal"] for child in children} == set(limits["ordinal"])
+            assert {child["cat1"] for child in children} == set(limits["cat1"])
+        else:  # Only continuous traits are mutated.
+            assert all(child["cat1"] == parent["cat1"] and child["int1"] == parent["int1"] for child in children)
+    assert np.array_equal(parent.position, position) and parent.loss == 1.0
+
+
+@pytest.mark.mpi_skip
+def test_crossovers() -> None:
+    """Test that the array-native crossovers take each trait from one of the parents with the specified probability."""
+    rng = random.Random(42)
+    init = InitUniform(limits, rng=rng)
+    parents = [init() for _ in range(3)]
+    for idx, parent in enumerate(parents):
+        parent.loss = float(idx)
+        parent["cat1"] = limits["cat1"][idx]
+    for crossover, inds, share in [
+        (CrossoverUniform(relative_parent_contribution=0.8, rng=rng), parents[:2], 0.8),
+        (CrossoverMultiple(rng=rng), parents, 1.0 / 3.0),
+        (CrossoverSigmoid(temperature=1.0, rng=rng), parents[:2], 1.0 / (1.0 + np.exp(1.0))),
+    ]:
+        children = [crossover(inds) for _ in range(1000)] + crossover.apply_batch([inds] * 1000)
+        for child in children:
+            assert_valid(child)
+            assert all(any(child[key] == parent[key] for parent in inds) for key in limits)
+        assert abs(np.mean([child["cat1"] == "a" for child in children]) - share) < 0.05
+
+    assert CrossoverUniform(probability=0.0, rng=rng)(parents).mapping == parents[0].mapping
+
+
+@pytest.mark.mpi_skip
+def test_breed_batch() -> None:
+    """Test breeding a batch of offspring at once, selecting only once and vectorizing the variation operators."""
+    rng = random.Random(42)
+    init = InitUniform(limits, rng=rng)
+    population = [init() for _ in range(8)]
+    for idx, ind in enumerate(population):
+        ind.loss = float(idx)
+    propagator = get_default_propagator(pop_size=4, limits=limits, rng=rng)
+    for inds in [population, population[:3]]:  # Breed from population or initialize randomly.
+        offspring = propagator.breed_batch(inds, 100)
+        assert len(offspring) == 100
+        for child in offspring:
+            assert isinstance(child, Individual) and all(child is not ind for ind in population)
+            assert_valid(child)
+    assert all(isinstance(child, Individual) for child in propagator.apply_batch([population, population[:3]] * 5))
+
+    class CountingSelectMin(SelectMin):
+        calls = 0
+
+        def __call__(self, inds: List[Individual]) -> List[Individual]:
+            CountingSelectMin.calls += 1
+            return super().__call__(inds)
+
+    crossover = CrossoverUniform(probability=0.0, rng=rng)  # Children are copies of best parent.
+    best = Compose([CountingSelectMin(2), crossover]).breed_batch(population, 10)
+    assert CountingSelectMin.calls == 1
+    assert all(isinstance(child, Individual) and child.mapping == population[0].mapping for child in best)
+
+
+@pytest.mark.mpi_skip
+def test_spawn() -> None:
+    """Test creating offspring from a position, sharing the search space encoding, and pickling without it."""
+    parent = Individual({"float1": 0.1, "cat1": "e", "int1": 3, "ordinal": 4, "float2": 0.2, "cat2": "f"}, limits)
+    parent["cat1"] = "b"
+    parent["cat1"] = "d"  # Setting a categorical trait again resets its whole one-hot segment.
+    assert parent["cat1"] == "d" and parent.position[1:6].tolist() == [0.0, 0.0, 0.0, 1.0, 0.0]
+    parent["_artifact"] = "path"
+    child = parent.spawn(parent.position.copy())
+    assert child.mapping == {key: parent[key] for key in limits}  # Underscore-prefixed entries are not inherited.
+    assert child.encoding is parent.encoding and child.generation == -1 and child.loss == float("inf")
+    unpickled = pickle.loads(pickle.dumps(child))
+    assert "_encoding" not in vars(unpickled) and unpickled.mapping == child.mapping
+    assert unpickled.encoding.decode(unpickled.position) == child.mapping
+    with pytest.raises(ValueError):
+        parent.spawn(np.zeros(3))
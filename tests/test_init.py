@@ -0,0 +1,89 @@
+import pathlib
+import random
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator
+from propulate.propagators import InitQuasiRandom, InitUniform
+from propulate.utils import get_default_propagator, set_logger_config
+from propulate.utils.benchmark_functions import get_function_search_space
+
+limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {
+    "float": (-1.0, 1.0),
+    "int": (0, 3),
+    "cat": ("a", "b"),
+    "ordinal": (1, 2, 4, 8),
+}
+
+
+@pytest.mark.mpi_skip
+def test_init_uniform_batch() -> None:
+    """Test sampling a batch of individuals at once, covering all values of the search space."""
+    init = InitUniform(limits, rng=random.Random(42))
+    inds = init.breed_batch([], 400) + [init() for _ in range(100)]
+    assert all(-1.0 <= ind["float"] < 1.0 and ind.mapping == {key: ind[key] for key in limits} for ind in inds)
+    for key in ["int", "cat", "ordinal"]:
+        assert {ind[key] for ind in inds} == (set(range(4)) if key == "int" else set(limits[key]))
+    parent = inds[0]
+    init = InitUniform(limits, parents=1, probability=0.5, rng=random.Random(42))
+    assert 0 < sum(child is parent for child in init.apply_batch([parent] * 100)) < 100
+    with pytest.raises(ValueError):
+        InitUniform({"x": (None, None)})  # type: ignore[dict-item]
+
+
+@pytest.mark.mpi_skip
+@pytest.mark.parametrize("design", ["sobol", "halton", "lhs"])
+def test_init_quasi_random(design: str) -> None:
+    """
+    Test that workers drawing one point at a time together draw the global, stratified design.
+
+    Parameters
+    ----------
+    design : str
+        The quasi-random design.
+    """
+    workers = [InitQuasiRandom(limits, design, rank=rank, size=4, seed=3, points_per_worker=4) for rank in range(4)]
+    inds = [worker() for _ in range(4) for worker in workers]
+    whole = InitQuasiRandom(limits, design, seed=3, points_per_worker=16).breed_batch([], 16)
+    assert sorted(ind["float"] for ind in inds) == pytest.approx(sorted(ind["float"] for ind in whole))
+    assert np.histogram([ind["float"] for ind in inds], bins=16, range=(-1.0, 1.0))[0].tolist() == [1] * 16
+
+    # Resume drawing from a checkpointed state.
+    state = workers[1].state_dict()
+    expected = workers[1].breed_batch([], 3)
+    resumed = InitQuasiRandom(limits, design, rank=1, size=4, seed=3, points_per_worker=4)
+    resumed.load_state_dict(state)
+    assert [ind.mapping for ind in resumed.breed_batch([], 3)] == [ind.mapping for ind in expected]
+    with pytest.raises(ValueError):
+        InitQuasiRandom(limits, "grid")
+
+
+def test_propulator_quasi_random_init(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test an optimization run whose initial individuals are drawn from a Sobol sequence shared by all workers.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    init = InitQuasiRandom(limits, rng=rng)
+    propulator = Propulator(
+        loss_fn=benchmark_function,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng, init=init),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+    )
+    assert (init.rank, init.size) == (MPI.COMM_WORLD.rank, MPI.COMM_WORLD.size)  # Set from the breeding workers.
+    propulator.propulate()
+    assert init.index > 0
+    assert len(propulator.population) == 10 * MPI.COMM_WORLD.size
@@ -1,12 +1,15 @@
 import pathlib
 import random
-from typing import Dict
+import time
+from typing import Dict, Generator, List, Union
 
 import numpy as np
 import pytest
 from mpi4py import MPI
 
-from propulate import Islands
+from propulate import Islands, evaluation_deadline
+from propulate.population import Individual
+from propulate.propagators import InitQuasiRandom
 from propulate.utils import get_default_propagator, set_logger_config
 
 
@@ -56,10 +59,12 @@ def test_multi_rank_workers(mpi_tmp_path: pathlib.Path) -> None:
         "a": (-5.12, 5.12),
         "b": (-5.12, 5.12),
     }
+    init = InitQuasiRandom(limits, rng=rng)  # Initial design shared by all workers
     propagator = get_default_propagator(  # Get default evolutionary operator.
         pop_size=2,  # Breeding pool size
         limits=limits,  # Search-space limits
         rng=rng,  # Separate random number generator for Propulate optimization
+        init=init,  # Initialization propagator
     )
 
     # Set up island model.
@@ -82,3 +87,220 @@ def test_multi_rank_workers(mpi_tmp_path: pathlib.Path) -> None:
         debug=1,  # Debug level
     )
     islands.summarize(top_n=1, debug=1)
+    if full_world_comm.rank % 2 == 0:  # The design is partitioned across the workers' leading ranks only.
+        assert (init.rank, init.size) == (full_world_comm.rank // 2, full_world_comm.size // 2)
+
+
+@pytest.mark.mpi(min_size=8)
+def test_multi_rank_workers_context(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test persistent worker context on multi-rank workers. Two islands with at least two workers with two ranks each.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    full_world_comm = MPI.COMM_WORLD  # Get full world communicator.
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+
+    rng = random.Random(42 + full_world_comm.rank)
+    limits = {
+        "a": (-5.12, 5.12),
+        "b": (-5.12, 5.12),
+    }
+    calls = {"setup": 0, "teardown": 0, "evaluations": 0}
+
+    def worker_setup(comm: MPI.Comm) -> Dict[str, int]:
+        calls["setup"] += 1
+        calls["comm_size"] = comm.size
+        return calls
+
+    def worker_teardown(ctx: Dict[str, int]) -> None:
+        ctx["teardown"] += 1
+
+    def parallel_sphere_with_context(params: Dict[str, float], comm: MPI.Comm, ctx: Dict[str, int]) -> float:
+        ctx["evaluations"] += 1
+        return parallel_sphere(params, comm)
+
+    islands = Islands(
+        loss_fn=parallel_sphere_with_context,
+        propagator=get_default_propagator(pop_size=2, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        num_islands=2,
+        migration_probability=0.9,
+        pollination=False,
+        checkpoint_path=mpi_tmp_path,
+        ranks_per_worker=2,
+        worker_setup=worker_setup,
+        worker_teardown=worker_teardown,
+    )
+    islands.propulate(logging_interval=10, debug=1)
+    # Every rank of every worker, not just each worker's rank 0, holds its own context.
+    assert calls == {"setup": 1, "teardown": 1, "evaluations": 10, "comm_size": 2}
+
+
+@pytest.mark.mpi(min_size=8)
+def test_variable_size_workers(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test variable-size multi-rank workers. Two islands with one or more workers with a pool of four ranks each.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    full_world_comm = MPI.COMM_WORLD  # Get full world communicator.
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+
+    rng = random.Random(42 + full_world_comm.rank)
+    limits = {
+        "a": (-5.12, 5.12),
+        "b": (-5.12, 5.12),
+    }
+
+    def ranks_per_candidate(ind: Individual) -> int:
+        return 1 if ind["a"] < 0.0 else 3  # Expensive candidates get more ranks.
+
+    def variable_size_sphere(params: Individual, comm: MPI.Comm) -> float:
+        assert comm.size == ranks_per_candidate(params)
+        terms = np.array(list(params.values()), dtype=float) ** 2
+        return comm.allreduce(terms[comm.rank :: comm.size].sum())  # Each rank squares some of the inputs.
+
+    propagator = get_default_propagator(pop_size=2, limits=limits, rng=rng)
+    batch_sizes = []  # Each round's candidates are bred at once.
+    breed_batch = propagator.breed_batch
+
+    def record_batch(inds: List[Individual], k: int) -> List[Union[List[Individual], Individual]]:
+        batch_sizes.append(k)
+        return breed_batch(inds, k)
+
+    propagator.breed_batch = record_batch  # type: ignore[method-assign]
+
+    islands = Islands(
+        loss_fn=variable_size_sphere,
+        propagator=propagator,
+        rng=rng,
+        generations=10,
+        num_islands=2,
+        migration_probability=0.0,  # Keep individuals on their birth islands.
+        pollination=False,
+        checkpoint_path=mpi_tmp_path,
+        ranks_per_worker=4,  # Size of each worker's pool of ranks
+        ranks_per_candidate=ranks_per_candidate,
+    )
+    islands.propulate(logging_interval=10, debug=1)
+    propulator = islands.propulator
+    if propulator.propulate_comm is not None:  # Each worker evaluated each of its generations exactly once.
+        own = [ind for ind in propulator.population if ind.rank == propulator.island_comm.rank]
+        assert sorted(ind.generation for ind in own) == list(range(10))
+        assert all(ind.loss == pytest.approx(ind["a"] ** 2 + ind["b"] ** 2) for ind in own)
+        assert sum(batch_sizes) == 10 and max(batch_sizes) > 1
+
+
+@pytest.mark.mpi(min_size=4)
+def test_multi_rank_workers_eval_timeout(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that multi-rank workers penalize evaluations exceeding the time limit consistently on all their ranks.
+
+    The ranks of a worker reach the collectives within their loss function at different times. Interrupting only some
+    of them would leave the others blocked in the collective. Hanging plain loss functions stop cooperatively by
+    polling the evaluation deadline.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    full_world_comm = MPI.COMM_WORLD  # Get full world communicator.
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+
+    rng = random.Random(42 + full_world_comm.rank)
+    limits = {
+        "a": (-5.12, 5.12),
+        "b": (-5.12, 5.12),
+    }
+
+    def slow_parallel_sphere(params: Dict[str, float], comm: MPI.Comm) -> float:
+        time.sleep(0.1 * (comm.rank + 1))  # Only the last rank exceeds the time limit.
+        return parallel_sphere(params, comm)
+
+    def slow_parallel_sphere_generator(params: Dict[str, float], comm: MPI.Comm) -> Generator[float, None, None]:
+        for _ in range(100):
+            time.sleep(0.05 * (comm.rank + 1))
+            yield parallel_sphere(params, comm)
+
+    def hanging_parallel_sphere(params: Dict[str, float], comm: MPI.Comm) -> float:
+        deadline = evaluation_deadline()
+        assert deadline is not None
+        while not comm.allreduce(time.time() > deadline, op=MPI.LOR):  # Agree on stopping at the same point.
+            time.sleep(0.05 * (comm.rank + 1))
+        return parallel_sphere(params, comm)
+
+    for loss_fn in [slow_parallel_sphere, slow_parallel_sphere_generator, hanging_parallel_sphere]:
+        islands = Islands(
+            loss_fn=loss_fn,
+            propagator=get_default_propagator(pop_size=2, limits=limits, rng=rng),
+            rng=rng,
+            generations=2,
+            num_islands=1,
+            migration_probability=0.0,
+            pollination=False,
+            checkpoint_path=mpi_tmp_path / loss_fn.__name__,
+            ranks_per_worker=2,
+            eval_timeout=0.15,
+            timeout_loss=1000.0,
+        )
+        islands.propulate(logging_interval=10, debug=1)
+        propulator = islands.propulator
+        if propulator.propulate_comm is not None:
+            assert len(propulator.population) == 2 * propulator.island_comm.size
+            assert all(ind.loss == 1000.0 for ind in propulator.population)
+            assert all(ind.evalperiod < 1.0 for ind in propulator.population)
+
+
+@pytest.mark.mpi(min_size=4)
+def test_variable_size_workers_eval_timeout(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that hanging single-rank candidates of variable-size workers are interrupted.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    full_world_comm = MPI.COMM_WORLD  # Get full world communicator.
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+
+    rng = random.Random(42 + full_world_comm.rank)
+    limits = {
+        "a": (-5.12, 5.12),
+        "b": (-5.12, 5.12),
+    }
+
+    def hanging_sphere(params: Individual, comm: MPI.Comm) -> float:
+        assert comm.size == 1  # Evaluated on a split communicator of size one, not ``MPI.COMM_SELF``.
+        time.sleep(10.0)
+        return parallel_sphere(params)
+
+    islands = Islands(
+        loss_fn=hanging_sphere,
+        propagator=get_default_propagator(pop_size=2, limits=limits, rng=rng),
+        rng=rng,
+        generations=2,
+        num_islands=1,
+        migration_probability=0.0,
+        pollination=False,
+        checkpoint_path=mpi_tmp_path,
+        ranks_per_worker=2,
+        ranks_per_candidate=lambda ind: 1,
+        eval_timeout=0.1,
+        timeout_loss=1000.0,
+    )
+    islands.propulate(logging_interval=10, debug=1)
+    propulator = islands.propulator
+    if propulator.propulate_comm is not None:
+        assert len(propulator.population) == 2 * propulator.island_comm.size
+        assert all(ind.loss == 1000.0 for ind in propulator.population)
+        assert all(ind.evalperiod < 1.0 for ind in propulator.population)
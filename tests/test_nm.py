@@ -65,3 +65,22 @@ def test_cmaes(function_parameters: Tuple[str, float], mpi_tmp_path: pathlib.Pat
     # Run optimization and print summary of results.
     propulator.propulate()
     propulator.summarize()
+
+
+def test_nm_state_dict() -> None:
+    """Test that restoring the state of a Nelder-Mead propagator reproduces the individuals it breeds."""
+    function, limits = get_function_search_space("sphere")
+    propagator = ParallelNelderMead(limits, rng=random.Random(42), start=np.zeros(len(limits)))
+    population = []
+    for generation in range(8):
+        ind = propagator(population)
+        ind.loss, ind.generation = function(ind), generation
+        population.append(ind)
+    state = propagator.state_dict()
+    bred = [propagator(population).position for _ in range(3)]
+
+    restored = ParallelNelderMead(limits, rng=random.Random(0), start=np.zeros(len(limits)))
+    restored.load_state_dict(state)
+    assert restored.generation == 8
+    for position in bred:
+        assert np.array_equal(restored(population).position, position)
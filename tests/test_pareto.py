@@ -0,0 +1,162 @@
+import pathlib
+import pickle
+import random
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator
+from propulate.checkpoint import read_hdf5_columns, read_hdf5_population, write_hdf5_population
+from propulate.propagators import (
+    Compose,
+    Conditional,
+    CrossoverUniform,
+    InitUniform,
+    IntervalMutationNormal,
+    SelectPareto,
+    SelectUniform,
+    crowding_distance,
+    hypervolume,
+    hypervolume_contributions,
+    non_dominated_sort,
+)
+from propulate.utils import set_logger_config
+
+limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {"x": (-1.0, 3.0), "y": (-1.0, 1.0)}
+
+
+def two_objectives(params: Dict[str, float]) -> Tuple[float, float]:
+    """
+    Schaffer-type bi-objective function whose Pareto set is the segment from (0, 0) to (2, 0).
+
+    Parameters
+    ----------
+    params : Dict[str, float]
+        The function parameters.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The two losses.
+    """
+    return params["x"] ** 2 + params["y"] ** 2, (params["x"] - 2.0) ** 2 + params["y"] ** 2
+
+
+@pytest.mark.mpi_skip
+def test_non_dominated_sort() -> None:
+    """Test the non-dominated sort against the definition of the fronts."""
+    losses = np.random.default_rng(0).integers(0, 5, size=(60, 3)).astype(np.float64)  # Includes ties and duplicates.
+    fronts = non_dominated_sort(losses)
+    for i, point in enumerate(losses):
+        dominating = np.all(losses <= point, axis=1) & np.any(losses < point, axis=1)
+        assert fronts[i] == (fronts[dominating].max() + 1 if dominating.any() else 0)
+    assert non_dominated_sort(np.array([[0.0, np.inf], [1.0, 1.0], [np.inf, np.inf]])).tolist() == [0, 0, 1]
+
+
+@pytest.mark.mpi_skip
+def test_hypervolume() -> None:
+    """Test the hypervolume, its contributions, and the crowding distance on fronts with known values."""
+    front = np.array([[3.0, 1.0], [1.0, 3.0], [2.0, 2.0]])
+    assert hypervolume(front, [4.0, 4.0]) == pytest.approx(6.0)
+    assert hypervolume(np.vstack([front, [[3.0, 3.0], [5.0, 0.0]]]), [4.0, 4.0]) == pytest.approx(6.0)
+    assert hypervolume_contributions(front, [4.0, 4.0]) == pytest.approx([1.0, 1.0, 1.0])
+    assert crowding_distance(front).tolist() == [np.inf, np.inf, 2.0]
+    # Two overlapping boxes in three dimensions
+    assert hypervolume(np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 0.0]]), [2.0, 2.0, 2.0]) == pytest.approx(5.0)
+    points = np.random.default_rng(1).random((12, 3))
+    points = points[non_dominated_sort(points) == 0]
+    expected = [hypervolume(points, np.ones(3)) - hypervolume(np.delete(points, i, axis=0), np.ones(3)) for i in range(len(points))]
+    assert hypervolume_contributions(points, np.ones(3)) == pytest.approx(expected)
+    samples = np.random.default_rng(2).random((20000, 3))
+    covered = np.mean(np.any(np.all(points[None] <= samples[:, None], axis=2), axis=1))
+    assert hypervolume(points, np.ones(3)) == pytest.approx(covered, abs=0.02)
+
+
+@pytest.mark.mpi_skip
+@pytest.mark.parametrize("method", ["crowding", "hypervolume"])
+def test_select_pareto(method: str) -> None:
+    """
+    Test that the Pareto selection fills up with complete fronts and truncates the last one.
+
+    Parameters
+    ----------
+    method : str
+        The criterion to truncate the last front.
+    """
+    inds = InitUniform(limits, rng=random.Random(42)).breed_batch([], 6)
+    losses = [[0.0, 4.0], [1.0, 2.0], [1.1, 1.9], [4.0, 0.0], [5.0, 5.0], [np.nan, 1.0]]
+    for ind, loss in zip(inds, losses):
+        ind.losses, ind.loss = np.array(loss), loss[0]
+    # The extreme points are kept, the more crowded, less contributing one of the two close points is dropped.
+    assert sorted(SelectPareto(3, method=method)(inds), key=inds.index) == [inds[0], inds[2], inds[3]]
+    assert sorted(SelectPareto(5, method=method)(inds)[:4], key=inds.index) == inds[:4]
+    with pytest.raises(ValueError):
+        SelectPareto(7, method=method)(inds)
+    with pytest.raises(ValueError):
+        SelectPareto(3, method="random")
+
+
+@pytest.mark.mpi_skip
+def test_multi_objective_checkpoint(tmp_path: pathlib.Path) -> None:
+    """
+    Test that multi-objective losses survive pickling and HDF5 checkpoints.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    population = InitUniform(limits, rng=random.Random(42)).breed_batch([], 3)
+    for i, ind in enumerate(population):
+        ind.generation, ind.loss, ind.losses = i, float(i), np.array([i, -i], dtype=np.float64)
+    population[2].losses = None  # E.g., timed out
+    assert pickle.loads(pickle.dumps(population[0])).losses.tolist() == [0.0, 0.0]
+    write_hdf5_population(tmp_path / "island_0_ckpt.h5", population)
+    recovered = read_hdf5_population(tmp_path / "island_0_ckpt.h5")
+    assert [ind.losses.tolist() for ind in recovered[:2]] == [[0.0, 0.0], [1.0, -1.0]] and recovered[2].losses is None
+    assert read_hdf5_columns(tmp_path / "island_0_ckpt.h5", ["losses"])["losses"].shape == (3, 2)
+
+
+def test_propulator_multi_objective(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test a multi-objective optimization run with Pareto selection and its summary reporting the Pareto front.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    propagator = Conditional(
+        8,
+        Compose(
+            [
+                SelectPareto(8, method="hypervolume"),
+                SelectUniform(2, rng=rng),
+                CrossoverUniform(rng=rng),
+                IntervalMutationNormal(limits, rng=rng),
+            ]
+        ),
+        InitUniform(limits, rng=rng),
+    )
+    propulator = Propulator(
+        loss_fn=two_objectives,
+        propagator=propagator,
+        rng=rng,
+        generations=20,
+        checkpoint_path=mpi_tmp_path,
+        checkpoint_format="hdf5",
+    )
+    propulator.propulate()
+    assert all(ind.losses is not None and ind.loss == ind.losses[0] for ind in propulator.population)
+    fronts = propulator.summarize()
+    assert fronts is not None
+    front = fronts[0]
+    assert isinstance(front, list) and len(front) > 0
+    losses = np.stack([ind.losses for ind in front])
+    assert np.all(non_dominated_sort(losses) == 0) and np.all(np.diff(losses[:, 0]) >= 0.0)
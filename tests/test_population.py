@@ -1,8 +1,15 @@
+import pathlib
+import pickle
+import random
 from typing import Dict, Tuple, Union
 
+import h5py
+import numpy as np
 import pytest
 
-from propulate.population import Individual
+from propulate.checkpoint import _dump_limits, _load_limits
+from propulate.population import Individual, Transform, Transformed, get_transform
+from propulate.propagators import InitUniform, IntervalMutationNormal
 
 
 @pytest.mark.mpi_skip
@@ -137,3 +144,51 @@ def test_surrogate_key() -> None:
     assert "_s" not in ind.keys()
     assert "_s" not in ind.mapping
     assert "_s" not in ind.mapping.keys()
+
+
+@pytest.mark.mpi_skip
+def test_transformed_limits(tmp_path: pathlib.Path) -> None:
+    """
+    Test continuous traits searched in log, logit, and custom transformed spaces.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary directory.
+    """
+    Transform("sqrt", np.sqrt, np.square)
+    limits = {
+        "lr": Transformed(1e-5, 1e-1, "log"),
+        "p": Transformed(0.01, 0.99, "logit"),
+        "s": Transformed(1.0, 100.0, "sqrt"),
+        "cat": ("a", "b"),
+    }
+    ind = Individual({"lr": 1e-3, "p": 0.9, "s": 4.0, "cat": "b"}, limits)
+    assert ind.position[:3] == pytest.approx([np.log(1e-3), np.log(9.0), 2.0])
+    assert ind["lr"] == pytest.approx(1e-3) and ind["p"] == pytest.approx(0.9) and ind["s"] == pytest.approx(4.0)
+    ind["lr"] = 1e-2
+    assert ind.position[0] == pytest.approx(np.log(1e-2)) and ind.encoding.decode(ind.position)["lr"] == pytest.approx(1e-2)
+
+    # Uniform sampling in log space puts the median near the geometric mean of the limits.
+    inds = InitUniform(limits, rng=random.Random(42)).breed_batch([], 1000)
+    values = np.array([child["lr"] for child in inds])
+    assert np.all((values >= 1e-5) & (values <= 1e-1))
+    assert 1e-4 < np.median(values) < 1e-2
+    mutation = IntervalMutationNormal(limits, sigma_factor=10.0, points=3, rng=random.Random(42))
+    for child in mutation.apply_batch([ind] * 100):  # Decoded values are clipped to the limits.
+        assert all(limits[key][0] <= child[key] <= limits[key][1] for key in ["lr", "p", "s"])
+
+    unpickled = pickle.loads(pickle.dumps(ind))
+    assert unpickled.limits == limits and unpickled.limits["s"].transform is get_transform("sqrt")
+    assert unpickled.mapping == ind.mapping
+    with h5py.File(tmp_path / "ckpt.hdf5", "w") as h5_file:
+        h5_file.attrs["limits"] = _dump_limits(limits)
+        assert _load_limits(h5_file.attrs["limits"]) == limits
+    assert repr(_load_limits(_dump_limits(limits))["p"]) == "Transformed(0.01, 0.99, 'logit')"
+
+    with pytest.raises(ValueError):
+        Transformed(0.0, 1.0, "log")
+    with pytest.raises(ValueError):
+        Transformed(1.0, 0.1, "log")
+    with pytest.raises(ValueError):
+        Transformed(0.1, 1.0, "unknown")
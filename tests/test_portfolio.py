@@ -0,0 +1,137 @@
+import pathlib
+import random
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator
+from propulate.propagators import BayesianOptimization, Conditional, InitUniform, Portfolio
+from propulate.propagators.pso import BasicPSO, InitUniformPSO
+from propulate.utils import get_default_propagator, set_logger_config
+from propulate.utils.benchmark_functions import get_function_search_space
+
+
+@pytest.mark.mpi_skip
+@pytest.mark.parametrize("policy", ["ucb", "thompson"])
+def test_portfolio_credit(policy: str) -> None:
+    """
+    Test that the portfolio credits improving offspring and shifts breeding to the productive propagator.
+
+    Parameters
+    ----------
+    policy : str
+        The bandit policy.
+    """
+    limits = {"x": (-1.0, 1.0)}
+    arms = [InitUniform(limits, rng=random.Random(1)), InitUniform(limits, rng=random.Random(2))]
+    portfolio = Portfolio(arms, policy=policy, window=10, rng=random.Random(42))
+    inds = portfolio.breed_batch([], 4)
+    assert sorted(ind.operator for ind in inds) == [0, 0, 1, 1]  # Untried arms are explored first.
+    assert all(ind.velocity is not None and not ind.velocity.any() for ind in inds)
+
+    # Offspring of arm 0 keep improving, those of arm 1 are always the worst so far.
+    population = []
+    for generation in range(30):
+        ind = InitUniform(limits, rng=random.Random(generation))()
+        ind.operator, ind.generation, ind.rank, ind.island = generation % 2, generation, 0, 0
+        ind.evaltime = float(generation)
+        ind.loss = -float(generation) if ind.operator == 0 else 100.0 + generation
+        population.append(ind)
+    counts, means = portfolio.statistics(population)
+    assert counts.tolist() == [10.0, 10.0]  # Only the most recent offspring within the window count.
+    assert means[0] == pytest.approx(1.0) and means[1] == pytest.approx(0.0)
+    assert sum(ind.operator == 0 for ind in portfolio.breed_batch(population, 20)) >= 15
+
+    # Offspring leaving the population are forgotten.
+    counts, _ = portfolio.statistics(population[:4])
+    assert counts.tolist() == [2.0, 2.0]
+    with pytest.raises(ValueError):
+        Portfolio([])
+    with pytest.raises(ValueError):
+        Portfolio(arms, policy="epsilon")
+
+
+def test_propulator_portfolio(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test an optimization run allocating breeding between a genetic and a PSO propagator.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    pso = Conditional(
+        4,
+        BasicPSO(0.7298, 1.49618, 1.49618, MPI.COMM_WORLD.rank, limits, rng),
+        InitUniformPSO(limits, rank=MPI.COMM_WORLD.rank, rng=rng),
+    )
+    portfolio = Portfolio([get_default_propagator(pop_size=4, limits=limits, rng=rng), pso], window=100, rng=rng)
+    propulator = Propulator(
+        loss_fn=benchmark_function,
+        propagator=portfolio,
+        rng=rng,
+        generations=20,
+        checkpoint_path=mpi_tmp_path,
+    )
+    propulator.propulate()
+    operators = np.array([ind.operator for ind in propulator.population])
+    assert len(propulator.population) == 20 * MPI.COMM_WORLD.size
+    assert set(operators.tolist()) == {0, 1}
+    assert portfolio.statistics(propulator.population)[0].sum() == len(propulator.population)
+
+
+def test_portfolio_pending() -> None:
+    """Test that pending individuals reach nested arms accounting for them, along with earlier offspring of the batch."""
+    _, limits = get_function_search_space("sphere")
+    rng = random.Random(42)
+    bo = BayesianOptimization(limits, initial_points=2, rng=rng)
+    genetic = get_default_propagator(pop_size=4, limits=limits, rng=rng)
+    assert not genetic.set_pending([])
+    portfolio = Portfolio([genetic, bo], rng=rng)
+    propagator = Conditional(4, portfolio, InitUniform(limits, rng=rng))
+    pending = InitUniform(limits, rng=rng).breed_batch([], 2)
+    assert propagator.set_pending(pending)  # type: ignore[arg-type]
+    assert portfolio.pending == pending and bo.pending == pending
+
+    population = InitUniform(limits, rng=rng).breed_batch([], 4)
+    for generation, ind in enumerate(population):
+        ind.loss, ind.generation, ind.rank, ind.island = float(generation), generation, 0, 0
+    offspring = portfolio.breed_batch(population, 4)  # type: ignore[arg-type]
+    num_genetic = sum(ind.operator == 0 for ind in offspring)  # type: ignore[union-attr]
+    assert 0 < num_genetic < 4  # Untried arms are pulled first.
+    assert len(bo.pending) == len(pending) + num_genetic  # Offspring of the genetic arm are pending for BO.
+
+
+def test_propulator_portfolio_pending(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that workers share their pending individuals if a propagator accounting for them is wrapped in a portfolio.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    bo = BayesianOptimization(limits, initial_points=4, rng=rng)
+    portfolio = Portfolio([get_default_propagator(pop_size=4, limits=limits, rng=rng), bo], rng=rng)
+    propulator = Propulator(
+        loss_fn=benchmark_function,
+        propagator=portfolio,
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+    )
+    assert propulator.share_pending
+    propulator.propulate()
+    assert len(propulator.population) == 10 * MPI.COMM_WORLD.size
+    assert len(propulator.pending) == 0  # All pending individuals have shown up evaluated.
@@ -1,6 +1,8 @@
 import copy
 import pathlib
 import random
+import time
+from typing import Dict, Generator
 
 import deepdiff
 import pytest
@@ -65,7 +67,8 @@ def test_propulator(function_name: str, mpi_tmp_path: pathlib.Path) -> None:
     propulator.propulate()  # Run optimization and print summary of results.
 
 
-def test_propulator_checkpointing(mpi_tmp_path: pathlib.Path) -> None:
+@pytest.mark.parametrize("checkpoint_format", ["pickle", "hdf5"])
+def test_propulator_checkpointing(checkpoint_format: str, mpi_tmp_path: pathlib.Path) -> None:
     """
     Test standard Propulator checkpointing for the sphere benchmark function.
 
@@ -73,6 +76,8 @@ def test_propulator_checkpointing(mpi_tmp_path: pathlib.Path) -> None:
 
     Parameters
     ----------
+    checkpoint_format : str
+        The checkpoint format.
     mpi_tmp_path : pathlib.Path
         The temporary checkpoint directory.
     """
@@ -90,6 +95,7 @@ def test_propulator_checkpointing(mpi_tmp_path: pathlib.Path) -> None:
         generations=10,
         checkpoint_path=mpi_tmp_path,
         rng=rng,
+        checkpoint_format=checkpoint_format,
     )  # Set up propulator performing actual optimization.
 
     propulator.propulate()  # Run optimization and print summary of results.
@@ -104,8 +110,129 @@ def test_propulator_checkpointing(mpi_tmp_path: pathlib.Path) -> None:
         generations=5,
         checkpoint_path=mpi_tmp_path,
         rng=rng,
+        checkpoint_format=checkpoint_format,
     )  # Set up new propulator starting from checkpoint.
 
     # As the number of requested generations is smaller than the number of generations from the run before,
     # no new evaluations are performed. Thus, the length of both Propulators' populations must be equal.
     assert len(deepdiff.DeepDiff(old_population, propulator.population, ignore_order=True)) == 0
+
+
+def test_propulator_time_budget(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that Propulator stops breeding before the wall-clock time budget is exhausted.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+
+    def slow_sphere(params: Dict[str, float]) -> float:
+        time.sleep(0.1)
+        return benchmark_function(params)
+
+    propagator = get_default_propagator(pop_size=4, limits=limits, rng=rng)
+    propulator = Propulator(
+        loss_fn=slow_sphere,
+        propagator=propagator,
+        rng=rng,
+        generations=-1,  # Run into time budget.
+        checkpoint_path=mpi_tmp_path,
+        time_budget=1.0,
+    )
+    propulator.propulate()
+    assert time.time() - propulator.start_time < 2.0
+    assert 0 < propulator.generation <= 10
+    assert len([ind for ind in propulator.population if ind.rank == MPI.COMM_WORLD.rank]) == propulator.generation
+
+
+def test_propulator_eval_timeout(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that evaluations exceeding the per-evaluation time limit are stopped and assigned the penalty loss.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    _, limits = get_function_search_space("sphere")
+
+    def hanging_loss(params: Dict[str, float]) -> float:
+        time.sleep(10.0)
+        return 0.0
+
+    def hanging_loss_generator(params: Dict[str, float]) -> Generator[float, None, None]:
+        for i in range(100):
+            time.sleep(0.05)
+            yield float(i)
+
+    def hanging_loss_catching(params: Dict[str, float]) -> float:
+        start = time.time()
+        try:
+            time.sleep(10.0)
+        except Exception:  # The timeout must not be swallowed by the loss function.
+            pass
+        return time.time() - start
+
+    for loss_fn in [hanging_loss, hanging_loss_generator, hanging_loss_catching]:
+        propulator = Propulator(
+            loss_fn=loss_fn,
+            propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+            rng=rng,
+            generations=2,
+            checkpoint_path=mpi_tmp_path / loss_fn.__name__,
+            eval_timeout=0.2,
+            timeout_loss=1000.0,
+        )
+        propulator.propulate()
+        assert len(propulator.population) == 2 * MPI.COMM_WORLD.size
+        assert all(ind.loss == 1000.0 for ind in propulator.population)
+        assert all(ind.evalperiod < 1.0 for ind in propulator.population)
+
+
+def test_propulator_worker_context(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test that the worker context is set up once, passed to every evaluation, and torn down at the end.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    calls: Dict[str, int] = {"setup": 0, "teardown": 0, "evaluations": 0}
+
+    def worker_setup(comm: MPI.Comm) -> Dict[str, int]:
+        calls["setup"] += 1
+        return calls
+
+    def worker_teardown(ctx: Dict[str, int]) -> None:
+        ctx["teardown"] += 1
+
+    def sphere_with_context(params: Dict[str, float], ctx: Dict[str, int]) -> float:
+        ctx["evaluations"] += 1
+        return benchmark_function(params)
+
+    propulator = Propulator(
+        loss_fn=sphere_with_context,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path,
+        worker_setup=worker_setup,
+        worker_teardown=worker_teardown,
+    )
+    propulator.propulate()
+    assert calls == {"setup": 1, "teardown": 1, "evaluations": 10}
+    assert propulator.worker_context is None
@@ -1,13 +1,14 @@
 import logging
 import random
 from pathlib import Path
-from typing import Dict, Generator, Tuple, Union
+from typing import Dict, Generator, List, Tuple, Union
 
 import numpy as np
 import pytest
 from mpi4py import MPI
 
 from propulate import Islands, Propulator, surrogate
+from propulate.population import Individual
 from propulate.utils import get_default_propagator, set_logger_config
 
 pytestmark = [
@@ -176,3 +177,61 @@ def test_dynamic_island(mpi_tmp_path: Path) -> None:
     )
     islands.summarize(top_n=1, debug=2)
     MPI.COMM_WORLD.barrier()
+
+
+def test_asha_rungs() -> None:
+    """Test promotion and stopping decisions of the ASHA surrogate at its geometric rungs."""
+    limits: Dict[str, Union[Tuple[int, int], Tuple[float, float], Tuple[str, ...]]] = {"start": (0.1, 7.0)}
+    asha = surrogate.ASHASurrogate(min_resource=1, reduction_factor=2)
+
+    def run(losses: List[float]) -> int:
+        """Run the surrogate over the given interim losses and return the number of consumed yields."""
+        asha.start_run(Individual(position={"start": 1.0}, limits=limits, generation=0))
+        for idx, loss in enumerate(losses):
+            if asha.cancel(loss):
+                return idx + 1
+        asha.update(losses[-1])
+        return len(losses)
+
+    assert run([4.0, 3.0, 2.0, 1.0]) == 4  # Too few records to compare with at any rung.
+    assert run([1.0, 1.0, 1.0, 0.5]) == 4  # Best at every rung.
+    assert run([8.0, 1.0, 1.0, 1.0]) == 1  # Worse than the best half at the first rung (resource 1).
+    assert run([2.0, 4.0, 4.0, 4.0]) == 2  # Promoted at resource 1, but stopped at the second rung (resource 2).
+    assert sorted(asha.rungs) == [(0, 1), (0, 2), (0, 4)]
+    assert asha.data() == [((0, 1), 2.0), ((0, 2), 4.0)]
+
+    # Merging is commutative, i.e., the same rung records in any order yield the same decisions.
+    other = surrogate.ASHASurrogate(min_resource=1, reduction_factor=2)
+    for records in reversed([[((0, 1), 4.0), ((0, 2), 3.0)], [((0, 1), 1.0)], asha.data()]):
+        other.merge(records)
+    assert sorted(other.rungs[(0, 1)]) == [1.0, 2.0, 4.0]
+
+
+def test_asha(mpi_tmp_path: Path) -> None:
+    """Test ASHA surrogate using a dummy function."""
+    pop_size = 2 * MPI.COMM_WORLD.size  # Breeding population size
+    limits: Dict[str, Union[Tuple[int, int], Tuple[float, float], Tuple[str, ...]]] = {
+        "start": (0.1, 7.0),
+        "limit": (-1.0, 1.0),
+    }  # Define search space.
+    rng = random.Random(MPI.COMM_WORLD.rank + 100)  # Set up separate random number generator for evolutionary optimizer.
+    num_generations = 10
+
+    propagator = get_default_propagator(  # Get default evolutionary operator.
+        pop_size=pop_size,  # Breeding population size
+        limits=limits,  # Search space
+        rng=rng,  # Random number generator for evolutionary optimizer
+    )
+    propulator = Propulator(
+        loss_fn=ind_loss,
+        propagator=propagator,
+        generations=num_generations,
+        checkpoint_path=mpi_tmp_path,
+        rng=rng,
+        surrogate_factory=lambda: surrogate.ASHASurrogate(min_resource=2, reduction_factor=3, brackets=2),
+    )  # Set up propulator performing actual optimization.
+    propulator.propulate(debug=1)  # Run optimization and print summary of results.
+    assert isinstance(propulator.surrogate, surrogate.ASHASurrogate)
+    # Rung records of the own runs and all synchronized runs on the island are available.
+    assert sum(len(losses) for (_, resource), losses in propulator.surrogate.rungs.items() if resource == 2) >= num_generations // 2
+    MPI.COMM_WORLD.barrier()
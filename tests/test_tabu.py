@@ -0,0 +1,100 @@
+import pathlib
+import random
+from typing import Dict, List, Mapping, Tuple, Union
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator
+from propulate.population import Individual
+from propulate.propagators import InitUniform, Tabu
+from propulate.utils import get_default_propagator, set_logger_config
+
+limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {"a": (0, 2), "c": ("x", "y")}
+
+
+def evaluated(positions: np.ndarray, search_space: Mapping, generation: int = 0) -> List[Individual]:
+    """
+    Create evaluated individuals at the given positions.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        The positions, one row per individual.
+    search_space : Dict[str, Tuple[float, float]] | Dict[str, Tuple[int, int]] | Dict[str, Tuple[str, ...]]
+        The search space.
+    generation : int, optional
+        The generation of the first individual. Default is 0.
+
+    Returns
+    -------
+    List[propulate.population.Individual]
+        The individuals.
+    """
+    inds = []
+    for i, position in enumerate(positions):
+        ind = Individual(np.array(position, dtype=np.float64), search_space, generation=generation + i, rank=0)
+        ind.island, ind.loss = 0, float(i)
+        inds.append(ind)
+    return inds
+
+
+@pytest.mark.mpi_skip
+def test_tabu_discrete() -> None:
+    """Test that proposals duplicating evaluated individuals or each other are bred again."""
+    tabu = Tabu(InitUniform(limits, rng=random.Random(42)), limits, max_retries=100)
+    assert len({tuple(ind.position) for ind in tabu.breed_batch([], 6)}) == 6  # All configurations, none twice
+    configurations = [[a, 1.0, 0.0] for a in range(3)] + [[a, 0.0, 1.0] for a in range(3)]
+    population = evaluated(np.array(configurations[:5]), limits)
+    assert all(tabu(population).position.tolist() == configurations[5] for _ in range(10))
+    assert tabu.rejected > 0
+    tabu = Tabu(InitUniform(limits, rng=random.Random(42)), limits, max_retries=3)
+    assert isinstance(tabu(evaluated(np.array(configurations), limits)), Individual)  # Accepted after the last retry
+    assert tabu.rejected == 3
+    with pytest.raises(ValueError):
+        Tabu(InitUniform(limits), limits, epsilon=-1.0)
+
+
+@pytest.mark.mpi_skip
+def test_tabu_near_duplicates() -> None:
+    """Test that proposals within epsilon of evaluated individuals are bred again, while the index grows in batches."""
+    continuous = {"x": (0.0, 10.0)}
+    tabu = Tabu(InitUniform(continuous, rng=random.Random(42)), continuous, epsilon=0.004, max_retries=1000)
+    grid = np.linspace(0.0, 10.0, 101)[:, None]  # Spacing of 0.01 relative to the limits
+    population = []
+    for start in range(0, len(grid), 7):  # The index is extended by a few individuals per breeding.
+        population += evaluated(grid[start : start + 7], continuous, generation=start)
+        x = tabu(population)["x"]
+        assert np.abs(grid[: start + 7, 0] - x).min() > 0.04
+    assert len(tabu._trees) <= int(np.log2(len(grid))) + 1
+
+
+def test_propulator_tabu(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test an optimization run on a small discrete search space without evaluating any configuration twice.
+
+    This test is run both sequentially and in parallel. Within the parallel run, workers may still collide with
+    in-flight individuals of other workers they have not received yet.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    grid: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {"a": (0, 9), "b": (0, 9)}
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    tabu = Tabu(get_default_propagator(pop_size=4, limits=grid, rng=rng), grid, max_retries=50, rng=rng)
+    propulator = Propulator(
+        loss_fn=lambda params: float((params["a"] - 3) ** 2 + (params["b"] - 5) ** 2),
+        propagator=tabu,
+        rng=rng,
+        generations=15,
+        checkpoint_path=mpi_tmp_path,
+    )
+    propulator.propulate()
+    configurations = {(ind["a"], ind["b"]) for ind in propulator.population}
+    assert len(propulator.population) == 15 * MPI.COMM_WORLD.size
+    if MPI.COMM_WORLD.size == 1:
+        assert len(configurations) == 15
@@ -0,0 +1,64 @@
+import pathlib
+import random
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from propulate import Propulator, Transformed
+from propulate.propagators import TreeParzenEstimator
+from propulate.utils.benchmark_functions import get_function_search_space, sphere
+
+
+def test_tpe(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test Propulator to optimize a benchmark function using a tree-structured Parzen estimator propagator.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    function, limits = get_function_search_space("rosenbrock")
+    propulator = Propulator(
+        loss_fn=function,
+        propagator=TreeParzenEstimator(limits, initial_points=5, rng=rng),
+        rng=rng,
+        generations=20,
+        checkpoint_path=mpi_tmp_path,
+    )
+    propulator.propulate()
+    propulator.summarize()
+
+
+@pytest.mark.mpi_skip
+def test_tpe_mixed_search_space() -> None:
+    """Test that TPE proposals lie within a mixed search space and concentrate around the good individuals."""
+    limits: Dict[str, Union[Tuple[float, float], Tuple[int, int], Tuple[str, ...]]] = {
+        "x": (-5.12, 5.12),
+        "y": (-5.12, 5.12),
+        "lr": Transformed(1e-5, 1e-1, "log"),
+        "int": (0, 5),
+        "ordinal": (1, 2, 4, 8),
+        "cat": ("a", "b", "c"),
+    }
+    propagator = TreeParzenEstimator(limits, rng=random.Random(42))
+    population = []
+    for generation in range(150):
+        ind = propagator(population)
+        assert -5.12 <= ind["x"] <= 5.12 and 1e-5 <= ind["lr"] <= 1e-1 and 0 <= ind["int"] <= 5
+        assert ind["ordinal"] in limits["ordinal"] and ind["cat"] in limits["cat"] and ind.position[-3:].sum() == 1.0
+        ind.loss = sphere({"x": ind["x"], "y": ind["y"]}) + ind["int"] + np.log10(ind["lr"] / 1e-3) ** 2
+        ind.generation = generation
+        population.append(ind)
+    best = min(population, key=lambda ind: ind.loss)
+    assert best.loss < 0.5 and best["int"] == 0
+    assert np.median([ind.loss for ind in population[-50:]]) < np.median([ind.loss for ind in population[:10]])
+    assert all(isinstance(ind, type(best)) for ind in propagator.breed_batch(population, 5))
+
+    with pytest.raises(ValueError):
+        TreeParzenEstimator(limits, gamma=1.0)
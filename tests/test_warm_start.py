@@ -0,0 +1,90 @@
+import pathlib
+import pickle
+import random
+from typing import List
+
+from mpi4py import MPI
+
+from propulate import Propulator, WarmStart
+from propulate.population import Individual
+from propulate.utils import get_default_propagator, set_logger_config
+from propulate.utils.benchmark_functions import get_function_search_space
+
+
+def test_warm_start_seeds(tmp_path: pathlib.Path) -> None:
+    """
+    Test mapping previous results into a renamed, subset search space with new parameters.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        The temporary directory for previous results.
+    """
+    old_limits = {"x": (-10.0, 10.0), "units": (1, 512), "act": ("relu", "tanh", "gelu")}
+    previous = []
+    for idx, (x, units, act) in enumerate([(1.0, 64, "relu"), (-8.0, 32, "tanh"), (2.0, 256, "gelu"), (1.0, 64, "tanh")]):
+        ind = Individual({"x": x, "units": units, "act": act}, old_limits)
+        ind.loss = float(idx)
+        previous.append(ind)
+    previous[3].loss = -1.0  # Duplicate in new search space with lower loss
+    timed_out = Individual({"x": 0.0, "units": 8, "act": "relu"}, old_limits)  # Penalty loss is not adopted.
+    with open(tmp_path / "results.pickle", "wb") as f:
+        pickle.dump(previous, f)
+
+    limits = {"a": (-5.0, 5.0), "units": (16, 128), "lr": (0.001, 0.1)}
+    warm_start = WarmStart(limits, [tmp_path / "results.pickle", [timed_out]], param_map={"a": "x"}, defaults={"lr": 0.01})
+    seeds = warm_start.seeds()
+    # Individuals with x=-8.0 and 256 units are out of the new limits, lr is new in the search space.
+    assert [(ind["a"], ind["units"], ind["lr"], ind.loss) for ind in seeds] == [(1.0, 64, 0.01, -1.0)]
+    warm_start = WarmStart(limits, [previous], num_seeds=2, param_map={"a": "x"}, defaults={"lr": 0.01, "units": 16})
+    assert [ind.mapping for ind in warm_start.seeds()] == [{"a": 1.0, "units": 64, "lr": 0.01}, {"a": 2.0, "units": 16, "lr": 0.01}]
+
+
+def test_propulator_warm_start(mpi_tmp_path: pathlib.Path) -> None:
+    """
+    Test seeding a run with the checkpoint of a previous study, adopting and re-evaluating seeds.
+
+    This test is run both sequentially and in parallel.
+
+    Parameters
+    ----------
+    mpi_tmp_path : pathlib.Path
+        The temporary checkpoint directory.
+    """
+    rng = random.Random(42 + MPI.COMM_WORLD.rank)  # Separate random number generator for optimization
+    benchmark_function, limits = get_function_search_space("sphere")
+    set_logger_config(log_file=mpi_tmp_path / "log.log")
+    previous = Propulator(
+        loss_fn=benchmark_function,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=10,
+        checkpoint_path=mpi_tmp_path / "previous",
+    )
+    previous.propulate()
+    best_previous = min(ind.loss for ind in previous.population)
+
+    evaluated: List[Individual] = []
+
+    def sphere(params: Individual) -> float:
+        evaluated.append(params)
+        return benchmark_function(params)
+
+    num_seeds, reevaluate = 3 * MPI.COMM_WORLD.size, MPI.COMM_WORLD.size
+    propulator = Propulator(
+        loss_fn=sphere,
+        propagator=get_default_propagator(pop_size=4, limits=limits, rng=rng),
+        rng=rng,
+        generations=5,
+        checkpoint_path=mpi_tmp_path / "current",
+        warm_start=WarmStart(limits, [mpi_tmp_path / "previous"], num_seeds=num_seeds, reevaluate=reevaluate),
+    )
+    assert len(propulator.population) == num_seeds - reevaluate
+    assert all(ind.generation < 0 for ind in propulator.population)
+    assert min(ind.loss for ind in propulator.population) > best_previous  # Best seeds are evaluated again.
+    assert len(propulator.seed_queue) == 1
+    reevaluated = propulator.seed_queue[0]
+    propulator.propulate()
+    assert evaluated[0] is reevaluated and reevaluated.generation == 0
+    assert len([ind for ind in propulator.population if ind.generation >= 0]) == 5 * MPI.COMM_WORLD.size
+    assert min(ind.loss for ind in propulator.population) <= best_previous
@@ -313,6 +313,8 @@ if __name__ == "__main__":
         checkpoint_path=log_path,
         surrogate_factory=lambda: surrogate.StaticSurrogate(),
         # surrogate_factory=lambda: surrogate.DynamicSurrogate(limits),
+        # Or asynchronous successive halving, stopping runs outside the best third at each rung:
+        # surrogate_factory=lambda: surrogate.ASHASurrogate(min_resource=1, reduction_factor=3),
     )
     islands.propulate(  # Run evolutionary optimization.
         logging_interval=1,  # Logging interval
@@ -11,7 +11,7 @@ import pathlib
 import random
 import socket
 import time
-from typing import Dict, Tuple, Union
+from typing import Any, Dict, Tuple, Union
 
 import torch
 import torch.distributed as dist
@@ -256,7 +256,43 @@ def torch_process_group_init(subgroup_comm: MPI.Comm, method: str) -> None:
     log.info(f"Finish subgroup torch.dist init: world size: {dist.get_world_size()}, rank: {dist.get_rank()}")
 
 
-def ind_loss(params: Dict[str, Union[int, float, str]], subgroup_comm: MPI.Comm) -> float:
+def worker_setup(subgroup_comm: MPI.Comm) -> Dict[str, Any]:
+    """
+    Set up the persistent context of a multi-rank worker once at the start of the optimization.
+
+    The torch process group and the data loaders are reused for every individual the worker evaluates.
+
+    Parameters
+    ----------
+    subgroup_comm : MPI.Comm
+        Each multi-rank worker's subgroup communicator.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The worker context holding the training and validation dataloaders.
+    """
+    torch_process_group_init(subgroup_comm, method=SUBGROUP_COMM_METHOD)
+    train_loader, val_loader = get_data_loaders(
+        batch_size=8, subgroup_comm=subgroup_comm
+    )  # Get training and validation data loaders.
+    return {"train_loader": train_loader, "val_loader": val_loader}
+
+
+def worker_teardown(ctx: Dict[str, Any]) -> None:
+    """
+    Release the persistent context of a multi-rank worker at the end of the optimization.
+
+    Parameters
+    ----------
+    ctx : Dict[str, Any]
+        The worker context created by ``worker_setup``.
+    """
+    if dist.is_initialized():
+        dist.destroy_process_group()
+
+
+def ind_loss(params: Dict[str, Union[int, float, str]], subgroup_comm: MPI.Comm, ctx: Dict[str, Any]) -> float:
     """
     Loss function for evolutionary optimization with Propulate. Minimize the model's negative validation accuracy.
 
@@ -266,13 +302,14 @@ def ind_loss(params: Dict[str, Union[int, float, str]], subgroup_comm: MPI.Comm)
         The hyperparameters to be optimized evolutionarily.
     subgroup_comm : MPI.Comm
         Each multi-rank worker's subgroup communicator.
+    ctx : Dict[str, Any]
+        The worker context created once per worker by ``worker_setup``.
 
     Returns
     -------
     float
         The trained model's validation loss.
     """
-    torch_process_group_init(subgroup_comm, method=SUBGROUP_COMM_METHOD)
     # Extract hyperparameter combination to test from input dictionary.
     conv_layers = int(params["conv_layers"])  # Number of convolutional layers
     activation = str(params["activation"])  # Activation function
@@ -292,9 +329,7 @@ def ind_loss(params: Dict[str, Union[int, float, str]], subgroup_comm: MPI.Comm)
     # Set up neural network with specified hyperparameters.
     model = Net(conv_layers, activation)
 
-    train_loader, val_loader = get_data_loaders(
-        batch_size=8, subgroup_comm=subgroup_comm
-    )  # Get training and validation data loaders.
+    train_loader, val_loader = ctx["train_loader"], ctx["val_loader"]  # Reuse the worker's data loaders.
 
     if torch.cuda.is_available():
         device = MPI.COMM_WORLD.rank % GPUS_PER_NODE
@@ -383,7 +418,6 @@ def ind_loss(params: Dict[str, Union[int, float, str]], subgroup_comm: MPI.Comm)
         set_new_best = False
 
     # Return best validation loss as an individual's loss (trained so lower is better).
-    dist.destroy_process_group()
     return best_val_loss
 
 
@@ -436,6 +470,8 @@ if __name__ == "__main__":
         checkpoint_path=config.checkpoint,  # Checkpoint path
         # ----- SPECIFIC FOR MULTI-RANK UCS -----
         ranks_per_worker=2,  # Number of ranks per (multi rank) worker
+        worker_setup=worker_setup,  # Build process group and data loaders once per worker.
+        worker_teardown=worker_teardown,  # Destroy process group at the end of the optimization.
     )
 
     # Run actual optimization.